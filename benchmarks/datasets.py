@@ -0,0 +1,74 @@
+"""
+Deterministic benchmark datasets, built on data/input/generate_data.py.
+
+Shapes:
+- nested: records as generated (payload.temp_c, payload.status)
+- flat: payload flattened, plus a numeric 'value' (CSV friendly, used by pipeline.yaml)
+- wide: nested records with 40 extra scalar fields
+- dirty: nested records, ~10% violate data/schema/records_schema.json (for Validate)
+"""
+import random
+import sys
+
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "data" / "input"))
+
+from generate_data import generate_records
+
+SHAPES = ("nested", "flat", "wide", "dirty")
+
+def make_records(shape: str, count: int, seed: int = 42) -> list[dict]:
+    """
+    Example:
+    - make_records("nested", 3) -> the same 3 records on every call
+    """
+    if shape not in SHAPES:
+        raise ValueError(f"Unknown shape '{shape}'. Allowed: {', '.join(SHAPES)}")
+
+    rng = random.Random(f"{shape}:{seed}")
+    records = list(generate_records(count, rng))
+
+    if shape == "flat":
+        return [_flat(record, rng) for record in records]
+    if shape == "wide":
+        for record in records:
+            _widen(record, rng)
+    if shape == "dirty":
+        for record in records:
+            if rng.random() < 0.1:
+                _corrupt(record, rng)
+    return records
+
+def _flat(record: dict, rng: random.Random) -> dict:
+    payload = record.pop("payload")
+    record["temp_c"] = payload["temp_c"]
+    record["status"] = payload["status"]
+    record["value"] = rng.randint(0, 40)
+    return record
+
+def _widen(record: dict, rng: random.Random) -> None:
+    for index in range(40):
+        kind = index % 4
+        if kind == 0:
+            value = rng.randint(0, 1_000_000)
+        elif kind == 1:
+            value = round(rng.uniform(-1000.0, 1000.0), 3)
+        elif kind == 2:
+            value = f"text-{rng.randint(0, 9999):04d}"
+        else:
+            value = rng.random() < 0.5
+        record[f"f{index:02d}"] = value
+
+def _corrupt(record: dict, rng: random.Random) -> None:
+    kind = rng.randrange(4)
+    if kind == 0:
+        # Misspelled required key
+        record["tss"] = record.pop("ts")
+    elif kind == 1:
+        record["id"] = str(record["id"])
+    elif kind == 2:
+        record["payload"]["temp_c"] = f"{record['payload']['temp_c']}C"
+    else:
+        del record["payload"]["status"]
@@ -0,0 +1,366 @@
+"""
+Benchmark suite for adapters, plugins and the sample pipelines.
+
+Every benchmark runs on deterministic data (see datasets.py), the best of
+--repeat runs is reported as records/sec, peak memory comes from one extra
+run with tracemalloc. Results are compared with a JSON baseline, a benchmark
+that got slower (or needs more memory) than --tolerance fails the run.
+
+Usage (from the repository root):
+- python benchmarks/run.py                      -> run all, compare with benchmarks/baseline.json
+- python benchmarks/run.py --save               -> store the results as new baseline
+- python benchmarks/run.py --only plugin. -r 5  -> only plugin benchmarks, best of 5
+"""
+import argparse
+import gc
+import json
+import os
+import pickle
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+
+from datasets import make_records
+
+from configura.columnar import ColumnBatch
+from configura.adapters.csv_adapter import ReadCsv, WriteCsv
+from configura.adapters.json_adapter import ReadJson, WriteJson
+from configura.adapters.jsonl_adapter import ReadJsonl, WriteJsonl
+from configura.engine import run_pipeline_from_config
+from configura.io import read_yaml, write_csv, write_json, write_jsonl
+from configura.plugins.aggregate import Aggregate
+from configura.plugins.deduplicate import Deduplicate
+from configura.plugins.drop_fields import DropFields
+from configura.plugins.filter import Filter
+from configura.plugins.filter_by_field import FilterByField
+from configura.plugins.limit import Limit
+from configura.plugins.rename_fields import RenameFields
+from configura.plugins.sort import Sort
+from configura.plugins.validate import Validate
+from configura.stream import collect, copy_batch, iter_batches, stream_step
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+DEFAULT_BASELINE = ROOT / "benchmarks" / "baseline.json"
+SCHEMA_PATH = str(ROOT / "data" / "schema" / "records_schema.json")
+
+# Memory differences below this are noise (allocator, caches)
+MEMORY_FLOOR_BYTES = 1024 * 1024
+
+class Workspace:
+    """Datasets (in memory and as files) shared by all benchmarks of one run."""
+
+    def __init__(self, directory: str, count: int, seed: int) -> None:
+        self.directory = Path(directory)
+        self.count = count
+        self.seed = seed
+        self._records: dict[str, bytes] = {}
+        self._files: dict[tuple[str, str], str] = {}
+
+    def records(self, shape: str) -> list[dict]:
+        """Fresh copy on every call, plugins may change records in place."""
+        if shape not in self._records:
+            self._records[shape] = pickle.dumps(make_records(shape, self.count, self.seed), protocol=pickle.HIGHEST_PROTOCOL)
+        return pickle.loads(self._records[shape])
+
+    def file(self, shape: str, file_format: str) -> str:
+        key = (shape, file_format)
+        if key not in self._files:
+            path = str(self.directory / f"{shape}.{file_format}")
+            writers = {"jsonl": write_jsonl, "json": write_json, "csv": write_csv}
+            writers[file_format](self.records(shape), path)
+            self._files[key] = path
+        return self._files[key]
+
+    def shards(self, shape: str, file_format: str, count: int) -> str:
+        """The records split into count files, returns their glob pattern."""
+        key = (shape, f"{file_format}*{count}")
+        if key not in self._files:
+            records = self.records(shape)
+            size = -(-len(records) // count)
+            writers = {"jsonl": write_jsonl, "json": write_json, "csv": write_csv}
+            for index in range(count):
+                path = str(self.directory / f"{shape}_shard{count}_{index:03d}.{file_format}")
+                writers[file_format](records[index * size : (index + 1) * size], path)
+            self._files[key] = str(self.directory / f"{shape}_shard{count}_*.{file_format}")
+        return self._files[key]
+
+    def output(self, name: str) -> str:
+        return str(self.directory / "output" / name)
+
+class Benchmark:
+    """
+    setup(workspace) runs untimed before every measured run and returns
+    the function to time, records is the number of input records.
+    """
+
+    def __init__(self, name: str, setup: Callable[[Workspace], Callable[[], Any]], records: Optional[int] = None) -> None:
+        self.name = name
+        self.setup = setup
+        self.records = records
+
+#region Benchmarks
+def _read(reader_class, shape, file_format, stream=False, **params):
+    def setup(ws: Workspace):
+        reader = reader_class(ws.file(shape, file_format), **params)
+        if stream:
+            return lambda: collect(reader.read_batches())
+        return lambda: reader.process(None)
+    return setup
+
+def _read_shards(reader_class, shape, file_format, count, **params):
+    """Reads the records from count files through one glob pattern (streaming)."""
+    def setup(ws: Workspace):
+        reader = reader_class(ws.shards(shape, file_format, count), **params)
+        return lambda: collect(reader.read_batches())
+    return setup
+
+def _write(writer_class, shape, name, stream=False, **params):
+    def setup(ws: Workspace):
+        data = ws.records(shape)
+        writer = writer_class(ws.output(name), **params)
+        if stream:
+            return lambda: collect(writer.process_stream(iter([data[i : i + 1000] for i in range(0, len(data), 1000)])))
+        return lambda: writer.process(data)
+    return setup
+
+def _plugin(factory, shape="nested", in_place=False, stream=False):
+    def setup(ws: Workspace):
+        data = ws.records(shape)
+        plugin = factory(ws)
+        if in_place:
+            # Records owned by the plugin, as after a reader in a pipeline
+            data = copy_batch(data)
+            plugin.in_place = True
+        if stream:
+            return lambda: collect(stream_step(plugin, iter_batches(data)))
+        return lambda: plugin.process(data)
+    return setup
+
+def _columnar(factory, shape="nested"):
+    """Plugin on ColumnBatch input as produced by a columnar reader, conversion is not timed."""
+    def setup(ws: Workspace):
+        batches = [ColumnBatch.from_records(batch) for batch in iter_batches(ws.records(shape))]
+        plugin = factory(ws)
+        return lambda: collect(plugin.process_stream(iter(batches)))
+    return setup
+
+def _pipeline(config_name, shape, streaming, pipelined=False, fusion=True):
+    def setup(ws: Workspace):
+        config = read_yaml(str(ROOT / "data" / "configs" / config_name))
+        for step in config["pipeline"]:
+            params = step.setdefault("params", {})
+            if step["type"].endswith(":ReadJsonl"):
+                params["path"] = ws.file(shape, "jsonl")
+            elif step["type"].endswith(("WriteJsonl", "WriteJson", "WriteCsv")):
+                params["path"] = ws.output(f"{config_name}_{Path(params['path']).name}")
+            if "dlq_dir" in params:
+                params["dlq_dir"] = ws.output("dlq") + "/"
+            if "schema_path" in params:
+                params["schema_path"] = SCHEMA_PATH
+        config["streaming"] = streaming
+        config["pipelined"] = pipelined
+        config["fusion"] = fusion
+
+        config_path = ws.directory / f"{config_name}_{streaming}_{pipelined}_{fusion}.json"
+        config_path.write_text(json.dumps(config))
+        return lambda: run_pipeline_from_config(config_path)
+    return setup
+
+AGGREGATIONS = {
+    "n": {"op": "count"},
+    "temp_mean": {"op": "mean", "field": "payload.temp_c"},
+    "temp_max": {"op": "max", "field": "payload.temp_c"},
+    "last_ts": {"op": "last", "field": "ts"},
+}
+
+BENCHMARKS = [
+    # Adapters
+    Benchmark("adapter.ReadJsonl", _read(ReadJsonl, "nested", "jsonl")),
+    Benchmark("adapter.ReadJsonl[stream]", _read(ReadJsonl, "nested", "jsonl", stream=True)),
+    Benchmark("adapter.ReadJsonl[wide]", _read(ReadJsonl, "wide", "jsonl")),
+    Benchmark("adapter.ReadJsonl[shards]", _read_shards(ReadJsonl, "nested", "jsonl", 24)),
+    Benchmark("adapter.ReadJsonl[shards,interleaved]", _read_shards(ReadJsonl, "nested", "jsonl", 24, ordered=False)),
+    Benchmark("adapter.WriteJsonl", _write(WriteJsonl, "nested", "nested.jsonl")),
+    Benchmark("adapter.WriteJsonl[stream]", _write(WriteJsonl, "nested", "nested_stream.jsonl", stream=True)),
+    Benchmark("adapter.ReadJson", _read(ReadJson, "nested", "json")),
+    Benchmark("adapter.WriteJson", _write(WriteJson, "nested", "nested.json")),
+    Benchmark("adapter.ReadCsv", _read(ReadCsv, "flat", "csv")),
+    Benchmark("adapter.ReadCsv[stream]", _read(ReadCsv, "flat", "csv", stream=True)),
+    Benchmark("adapter.ReadCsv[typed]", _read(ReadCsv, "flat", "csv", stream=True, types="infer")),
+    Benchmark("adapter.ReadCsv[shards]", _read_shards(ReadCsv, "flat", "csv", 24)),
+    Benchmark("adapter.WriteCsv", _write(WriteCsv, "flat", "flat.csv")),
+    Benchmark("adapter.WriteCsv[stream]", _write(WriteCsv, "flat", "flat_stream.csv", stream=True)),
+    # Plugins
+    Benchmark("plugin.FilterByField", _plugin(lambda ws: FilterByField(key_name="payload.temp_c", operator=">=", value=20))),
+    Benchmark("plugin.Filter", _plugin(lambda ws: Filter('payload.temp_c >= 18 and type != "debug" and payload.status == "ok" and id > 100'), stream=True)),
+    Benchmark("plugin.Filter[static]", _plugin(lambda ws: Filter('payload.temp_c >= 18 and type != "debug" and payload.status == "ok" and id > 100', adaptive=False), stream=True)),
+    Benchmark("plugin.DropFields", _plugin(lambda ws: DropFields(fields=["password", "debug", "internal_id", "temp_flag"]))),
+    Benchmark("plugin.DropFields[wide]", _plugin(lambda ws: DropFields(fields=[f"f{i:02d}" for i in range(0, 40, 2)]), "wide")),
+    Benchmark("plugin.DropFields[wide,in_place]", _plugin(lambda ws: DropFields(fields=[f"f{i:02d}" for i in range(0, 40, 2)]), "wide", in_place=True)),
+    Benchmark("plugin.RenameFields", _plugin(lambda ws: RenameFields(mapping={"ts": "time_stamp", "payload.temp_c": "payload.temp_celsius"}))),
+    Benchmark("plugin.RenameFields[in_place]", _plugin(lambda ws: RenameFields(mapping={"ts": "time_stamp", "payload.temp_c": "payload.temp_celsius"}), in_place=True)),
+    Benchmark("plugin.Deduplicate[exact]", _plugin(lambda ws: Deduplicate(keys=["id", "ts"]))),
+    Benchmark("plugin.Deduplicate[spill]", _plugin(lambda ws: Deduplicate(keys=["id", "ts"], memory_bytes=1024 * 1024, spill_dir=ws.output("dedup")))),
+    Benchmark("plugin.Deduplicate[approximate]", _plugin(lambda ws: Deduplicate(keys=["id", "ts"], mode="approximate"))),
+    Benchmark("plugin.Sort", _plugin(lambda ws: Sort(keys="ts"), stream=True)),
+    Benchmark("plugin.Sort[multi]", _plugin(lambda ws: Sort(keys=["ts", "payload.temp_c"], descending=[False, True]), stream=True)),
+    Benchmark("plugin.Sort[spill]", _plugin(lambda ws: Sort(keys="ts", memory_bytes=4 * 1024 * 1024, spill_dir=ws.output("sort")), stream=True)),
+    Benchmark("plugin.Aggregate", _plugin(lambda ws: Aggregate(group_by=["type", "payload.status"], aggregations=AGGREGATIONS), stream=True)),
+    Benchmark("plugin.Aggregate[spill]", _plugin(lambda ws: Aggregate(group_by="id", aggregations=AGGREGATIONS, max_groups=10000, spill_dir=ws.output("aggregate")), stream=True)),
+    Benchmark("plugin.Limit", _plugin(lambda ws: Limit(start=10, end=ws.count // 2))),
+    Benchmark("plugin.Validate[skip]", _plugin(lambda ws: Validate(schema_path=SCHEMA_PATH, on_fail="skip"), "dirty")),
+    Benchmark("plugin.Validate[dlq]", _plugin(lambda ws: Validate(schema_path=SCHEMA_PATH, on_fail="dlq", dlq_dir=ws.output("dlq") + "/", dlq_name="bench"), "dirty")),
+    # Sample pipelines
+    Benchmark("pipeline.pipeline", _pipeline("pipeline.yaml", "flat", streaming=False)),
+    Benchmark("pipeline.pipeline[streaming]", _pipeline("pipeline.yaml", "flat", streaming=True)),
+    Benchmark("pipeline.pipeline_extended", _pipeline("pipeline_extended.yaml", "dirty", streaming=False)),
+    Benchmark("pipeline.pipeline_extended[streaming]", _pipeline("pipeline_extended.yaml", "dirty", streaming=True)),
+    Benchmark("pipeline.pipeline_extended[no_fusion]", _pipeline("pipeline_extended.yaml", "dirty", streaming=False, fusion=False)),
+    Benchmark("pipeline.pipeline_extended[pipelined]", _pipeline("pipeline_extended.yaml", "dirty", streaming=True, pipelined=True)),
+]
+
+if numpy is not None:
+    BENCHMARKS.append(Benchmark("adapter.ReadJsonl[columnar]", _read(ReadJsonl, "nested", "jsonl", stream=True, columnar=True)))
+    BENCHMARKS.append(Benchmark("plugin.Aggregate[columnar]", _columnar(lambda ws: Aggregate(group_by=["type", "payload.status"], aggregations=AGGREGATIONS))))
+#endregion
+
+def measure(benchmark: Benchmark, ws: Workspace, repeat: int) -> dict[str, Any]:
+    best = None
+    for _ in range(repeat):
+        run = benchmark.setup(ws)
+        gc.collect()
+        started = time.perf_counter()
+        run()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+
+    run = benchmark.setup(ws)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        run()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    records = benchmark.records or ws.count
+    return {
+        "records": records,
+        "seconds": best,
+        "records_per_s": records / best if best else None,
+        "peak_bytes": peak,
+    }
+
+def compare(results: dict[str, Any], baseline: dict[str, Any], tolerance: float) -> list[str]:
+    """Returns one message per regression (slower or more memory than the tolerance allows)."""
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+
+        if base.get("records_per_s") and result["records_per_s"] < base["records_per_s"] * (1 - tolerance):
+            regressions.append(
+                f"{name}: {result['records_per_s']:,.0f} rec/s, baseline {base['records_per_s']:,.0f} rec/s"
+            )
+        limit = max(base.get("peak_bytes", 0) * (1 + tolerance), base.get("peak_bytes", 0) + MEMORY_FLOOR_BYTES)
+        if result["peak_bytes"] > limit:
+            regressions.append(
+                f"{name}: peak {result['peak_bytes'] / 1024**2:.1f} MiB, baseline {base['peak_bytes'] / 1024**2:.1f} MiB"
+            )
+    return regressions
+
+def format_table(results: dict[str, Any], baseline: dict[str, Any]) -> str:
+    lines = [f"{'benchmark':<44} {'rec/s':>12} {'peak MiB':>9} {'vs base':>8}"]
+    for name, result in results.items():
+        base = baseline.get(name)
+        delta = ""
+        if base and base.get("records_per_s"):
+            delta = f"{result['records_per_s'] / base['records_per_s'] - 1:+.0%}"
+        lines.append(f"{name:<44} {result['records_per_s']:>12,.0f} {result['peak_bytes'] / 1024**2:>9.1f} {delta:>8}")
+    return "\n".join(lines)
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="benchmarks/run.py", description="Configura benchmark suite")
+    parser.add_argument("-n", "--records", type=int, default=100_000, help="records per dataset (default: 100000)")
+    parser.add_argument("-r", "--repeat", type=int, default=3, help="timed runs per benchmark, best is reported (default: 3)")
+    parser.add_argument("--seed", type=int, default=42, help="dataset seed (default: 42)")
+    parser.add_argument("--only", default=None, metavar="TEXT", help="only benchmarks whose name contains TEXT")
+    parser.add_argument("--baseline", default=str(DEFAULT_BASELINE), metavar="FILE", help="baseline JSON to compare with")
+    parser.add_argument("--save", action="store_true", help="store the results as baseline instead of comparing")
+    parser.add_argument("--allow-missing-baseline", action="store_true", help="exit 0 without a baseline (default: exit 2)")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed slowdown/memory growth (default: 0.2 = 20%%)")
+    parser.add_argument("--output", default=None, metavar="FILE", help="also write the results to FILE")
+    args = parser.parse_args(argv)
+
+    benchmarks = [b for b in BENCHMARKS if args.only is None or args.only in b.name]
+
+    # Sample configs use relative paths (schema, dlq)
+    os.chdir(ROOT)
+
+    # A missing baseline must not pass a CI run silently, checked before the benchmarks run
+    baseline_path = Path(args.baseline)
+    if not (args.save or args.allow_missing_baseline or baseline_path.exists()):
+        print(f"No baseline at {baseline_path}, run with --save to create one", file=sys.stderr)
+        return 2
+
+    results: dict[str, Any] = {}
+    with tempfile.TemporaryDirectory(prefix="configura_bench_") as directory:
+        ws = Workspace(directory, args.records, args.seed)
+        (ws.directory / "output").mkdir()
+        for benchmark in benchmarks:
+            results[benchmark.name] = measure(benchmark, ws, args.repeat)
+            print(f"{benchmark.name:<44} {results[benchmark.name]['records_per_s']:>12,.0f} rec/s", file=sys.stderr)
+
+    report = {
+        "meta": {
+            "records": args.records,
+            "seed": args.seed,
+            "repeat": args.repeat,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+        },
+        "results": results,
+    }
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2))
+
+    if args.save:
+        baseline_path.write_text(json.dumps(report, indent=2))
+        print(format_table(results, {}))
+        print(f"Baseline saved: {baseline_path}")
+        return 0
+
+    if not baseline_path.exists():
+        print(format_table(results, {}))
+        print(f"No baseline at {baseline_path}, run with --save to create one")
+        return 0
+
+    baseline = json.loads(baseline_path.read_text())
+    meta = baseline.get("meta", {})
+    if (meta.get("records"), meta.get("seed")) != (args.records, args.seed):
+        print(f"Baseline was created with records={meta.get('records')}, seed={meta.get('seed')}, not comparable")
+        return 2
+
+    print(format_table(results, baseline["results"]))
+    regressions = compare(results, baseline["results"], args.tolerance)
+    for message in regressions:
+        print(f"REGRESSION {message}")
+    return 1 if regressions else 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
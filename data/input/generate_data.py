@@ -6,32 +6,38 @@ from pathlib import Path
 TYPES = ["sensor_reading", "telemetry"]
 STATUSES = ["ok", "warning"]
 
-def generate_record(record_id: int, base_time: datetime) -> dict:
+BASE_TIME = datetime(2025, 11, 1, 12, 0, 0)
+
+# rng: pass random.Random(seed) for reproducible data (benchmarks)
+def generate_record(record_id: int, base_time: datetime, rng: random.Random = random) -> dict:
     ts = base_time.isoformat() + "Z"
 
     return {
         "id": record_id,
         "ts": ts,
-        "type": random.choice(TYPES),
+        "type": rng.choice(TYPES),
         "password": f"secret{record_id}",
-        "debug": random.choice([True, False]),
+        "debug": rng.choice([True, False]),
         "internal_id": f"A-{record_id:03d}",
-        "temp_flag": random.choice([True, False]),
+        "temp_flag": rng.choice([True, False]),
         "payload": {
-            "temp_c": round(random.uniform(18.0, 23.0), 1),
-            "status": random.choice(STATUSES),
+            "temp_c": round(rng.uniform(18.0, 23.0), 1),
+            "status": rng.choice(STATUSES),
         },
     }
 
-def generate_jsonl(filename: str = "generated_records.jsonl", count: int = 100) -> None:
+def generate_records(count: int = 100, rng: random.Random = random):
+    for i in range(1, count + 1):
+        record_time = BASE_TIME + timedelta(seconds=i * rng.randint(10, 90))
+        yield generate_record(i, record_time, rng)
+
+def generate_jsonl(filename: str = "generated_records.jsonl", count: int = 100, seed: int | None = None) -> None:
     script_dir = Path(__file__).parent
     output_path = script_dir / filename
-    base_time = datetime(2025, 11, 1, 12, 0, 0)
+    rng = random.Random(seed) if seed is not None else random
 
     with output_path.open("w", encoding="utf-8") as f:
-        for i in range(1, count + 1):
-            record_time = base_time + timedelta(seconds=i * random.randint(10, 90))
-            record = generate_record(i, record_time)
+        for record in generate_records(count, rng):
             f.write(json.dumps(record) + "\n")
 
     print(f"Generated: {output_path}")
@@ -1,19 +1,177 @@
-from configura.constants import DEFAULT_ENCODING
+import copy
+
+from typing import Callable, Optional, Union
+
+from configura.constants import DEFAULT_ENCODING, DEFAULT_BATCH_SIZE, DEFAULT_COMPRESSION, DEFAULT_FILE_WORKERS, DEFAULT_SOURCE_FIELD, TYPE_COMPRESSION, TYPE_DATA, TYPE_STREAM
+from configura.columnar import ColumnBatch, require_numpy, to_columnar
+from configura.io import expand_paths, is_glob
+from configura.planner import Pushdown
+from configura.stages import iter_concurrent
+from configura.stream import collect, drain, iter_batches
 
 class ReadBase:
+    """
+    Readers ignore their input data.
+
+    Subclasses implement read() and optionally _read_batches()
+    for lazy, batch-wise reading in streaming mode.
+
+    Readers with supports_pushdown = True accept filters, projections and
+    limits of the following steps (see configura.planner).
+
+    columnar = True yields ColumnBatch objects (requires numpy),
+    columnar steps (FilterByField, DropFields, Limit) then work vectorized.
+
+    compression: "infer" (from the extension), "gzip", "bz2", "xz" or None.
+
+    path can also be a glob pattern or a list of paths/patterns (e.g. "data/records_2025-11-01T*.jsonl"):
+    - the files are read at the same time by file_workers threads (see stages.iter_concurrent)
+    - ordered = True keeps the file order, False interleaves the batches of the files as they are read
+    - every record gets its file in source_field (None: no field), pushed down steps see it too
+    """
+
+    supports_pushdown = False
+    # Every record is newly decoded (see planner.assign_ownership)
+    owns_output = True
+
     def __init__(
         self,
-        path: str,
+        path: Union[str, list[str]],
         encoding: str = DEFAULT_ENCODING,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        columnar: bool = False,
+        compression: TYPE_COMPRESSION = DEFAULT_COMPRESSION,
+        file_workers: int = DEFAULT_FILE_WORKERS,
+        ordered: bool = True,
+        source_field: Optional[str] = DEFAULT_SOURCE_FIELD,
     ) -> None:
         self.path = path
         self.encoding = encoding
+        self.batch_size = batch_size
+        self.columnar = columnar
+        self.compression = compression
+        self.file_workers = file_workers
+        self.ordered = ordered
+        self.source_field = source_field
+        self.pushdown = Pushdown()
+
+        # False: a single file (path), otherwise the files of the pattern(s), see files()
+        self.multi_file = not isinstance(path, str) or is_glob(path)
+        if self.multi_file and file_workers < 1:
+            raise ValueError(f"file_workers must be >= 1, got: {file_workers}")
+
+        if columnar:
+            require_numpy()
+            # Filters stay in the pipeline and run vectorized on the columns
+            self.pushdown.predicates_allowed = False
+
+    def read(self) -> TYPE_DATA:
+        raise NotImplementedError
+
+    def files(self) -> list[str]:
+        """Files of the pattern(s), expanded on every read so files added between runs are picked up."""
+        return expand_paths(self.path)
+
+    def _read_batches(self, skip: int, batch_size: int) -> TYPE_STREAM:
+        """Batches of all records after the first `skip` ones."""
+        return iter_batches(self.read()[skip:], batch_size)
+
+    def read_batches(self) -> TYPE_STREAM:
+        stream = self._read_pushdown()
+        return to_columnar(stream) if self.columnar else stream
+
+    def _read_pushdown(self) -> TYPE_STREAM:
+        pushdown = self.pushdown
+        if not pushdown.active:
+            return self._read_source(0, self.batch_size)
+
+        # Records can only be skipped without decoding in a single file
+        skip = 0 if self.multi_file else pushdown.raw_skip
+        batch_size = self.batch_size
+        if pushdown.stop is not None and not pushdown.predicates:
+            # Small limit -> do not decode a full batch
+            batch_size = max(min(batch_size, pushdown.stop - skip), 1)
+
+        return pushdown.apply(self._read_source(skip, batch_size), skipped=skip)
+
+    def _read_source(self, skip: int, batch_size: int) -> TYPE_STREAM:
+        if not self.multi_file:
+            return self._read_batches(skip, batch_size)
+
+        # A pushed down Limit needs the records in file order
+        return iter_concurrent(
+            [self._file_source(path, batch_size) for path in self.files()],
+            workers=self.file_workers,
+            ordered=self.ordered or self.pushdown.limited,
+        )
+
+    def _file_source(self, path: str, batch_size: int) -> Callable[[], TYPE_STREAM]:
+        # Same reader for a single file, the pushdown is shared (e.g. fields CSV does not decode)
+        reader = copy.copy(self)
+        reader.path = path
+        reader.multi_file = False
+        field = self.source_field
+
+        def read() -> TYPE_STREAM:
+            for batch in reader._read_batches(0, batch_size):
+                if field is not None:
+                    for record in batch:
+                        record[field] = path
+                yield batch
+
+        return read
+
+    def _read_all(self) -> TYPE_DATA:
+        return collect(self._read_source(0, self.batch_size)) if self.multi_file else self.read()
+
+    def process(self, data) -> TYPE_DATA:
+        if self.columnar:
+            data = collect(self._read_pushdown()) if self.pushdown.active else self._read_all()
+            return ColumnBatch.from_records(data)
+        if self.pushdown.active:
+            return collect(self.read_batches())
+        return self._read_all()
+
+    def process_stream(self, stream: TYPE_STREAM) -> TYPE_STREAM:
+        # Input is ignored, but upstream steps (e.g. writers) still have to run
+        drain(stream)
+        yield from self.read_batches()
 
 class WriteBase:
+    """
+    Writers pass their input through, so further steps (e.g. a second writer) can follow.
+
+    Subclasses implement write() and write_batches(),
+    which writes every batch before yielding it.
+
+    compression: "infer" (from the extension), "gzip", "bz2", "xz" or None,
+    compression_level: 1-9 (None -> library default).
+    """
+
+    side_effects = True
+    preserves_ownership = True
+
     def __init__(
         self,
         path: str = "",
         encoding: str = DEFAULT_ENCODING,
+        compression: TYPE_COMPRESSION = DEFAULT_COMPRESSION,
+        compression_level: Optional[int] = None,
     ) -> None:
         self.path = path
         self.encoding = encoding
+        self.compression = compression
+        self.compression_level = compression_level
+
+    def write(self, data: TYPE_DATA) -> None:
+        raise NotImplementedError
+
+    def write_batches(self, stream: TYPE_STREAM) -> TYPE_STREAM:
+        raise NotImplementedError
+
+    def process(self, data: TYPE_DATA) -> TYPE_DATA:
+        self.write(data)
+        return data
+
+    def process_stream(self, stream: TYPE_STREAM) -> TYPE_STREAM:
+        return self.write_batches(stream)
@@ -1,42 +1,129 @@
 from configura.adapters.base_adapter import ReadBase, WriteBase
-from configura.io import read_csv, write_csv
+from configura.io import read_csv, write_csv, iter_csv, write_csv_stream
+from configura.schema import csv_columns, load_schema
 
-from configura.constants import DEFAULT_ENCODING
+from typing import Optional, Union
+
+from configura.constants import DEFAULT_ENCODING, DEFAULT_BATCH_SIZE, DEFAULT_COMPRESSION, DEFAULT_FILE_WORKERS, DEFAULT_INFER_ROWS, DEFAULT_SOURCE_FIELD, TYPE_COMPRESSION, TYPE_CSV_EXTRAS, TYPE_CSV_TYPES
 
 DELIMITER = ","
 
 class ReadCsv(ReadBase):
+    """
+    types: None -> every value is a string,
+    {"id": "int", "temp_c": "float"} -> declared column types ("str", "int", "float", "bool"),
+    "infer" -> types inferred from the first infer_rows rows.
+    schema_path: column types from the top-level properties of a JSON schema (if types is None).
+    Several files (glob / list of paths): each file has its own header, "infer" infers per file.
+    """
+
+    supports_pushdown = True
+
     def __init__(
         self,
-        path: str,
+        path: Union[str, list[str]],
         encoding: str = DEFAULT_ENCODING,
-        delimiter: str = DELIMITER
+        delimiter: str = DELIMITER,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        columnar: bool = False,
+        compression: TYPE_COMPRESSION = DEFAULT_COMPRESSION,
+        types: TYPE_CSV_TYPES = None,
+        infer_rows: int = DEFAULT_INFER_ROWS,
+        schema_path: Optional[str] = None,
+        file_workers: int = DEFAULT_FILE_WORKERS,
+        ordered: bool = True,
+        source_field: Optional[str] = DEFAULT_SOURCE_FIELD
     ) -> None:
-        super().__init__(path, encoding)
+        super().__init__(path, encoding, batch_size, columnar, compression, file_workers, ordered, source_field)
         self.delimiter = delimiter
+        self.infer_rows = infer_rows
 
-    def process(self, data):
+        if types is None and schema_path:
+            types = csv_columns(load_schema(schema_path).schema)
+        if not (types is None or types == "infer" or isinstance(types, dict)):
+            raise ValueError(f"types must be a mapping, 'infer' or None, got: {types!r}")
+        self.types = types
+
+    def read(self):
         return read_csv(
             path=self.path,
             encoding=self.encoding,
-            delimiter=self.delimiter
+            delimiter=self.delimiter,
+            compression=self.compression,
+            types=self.types,
+            infer_rows=self.infer_rows
+        )
+
+    def _read_batches(self, skip, batch_size):
+        return iter_csv(
+            path=self.path,
+            encoding=self.encoding,
+            delimiter=self.delimiter,
+            batch_size=batch_size,
+            skip=skip,
+            drop_fields=self.pushdown.decode_drop_fields,
+            compression=self.compression,
+            types=self.types,
+            infer_rows=self.infer_rows
         )
 
 class WriteCsv(WriteBase):
+    """
+    Header: fieldnames, the columns of schema_path, the existing header when appending,
+    or the keys of the first infer_rows records. Batches are written one by one.
+    extrasaction: keys missing in the header are left out ("ignore") or raise ValueError ("raise").
+    """
+
     def __init__(
         self,
         path: str,
         encoding: str = DEFAULT_ENCODING,
-        delimiter: str = DELIMITER
+        delimiter: str = DELIMITER,
+        compression: TYPE_COMPRESSION = DEFAULT_COMPRESSION,
+        compression_level: Optional[int] = None,
+        append: bool = False,
+        fieldnames: Optional[list[str]] = None,
+        schema_path: Optional[str] = None,
+        infer_rows: int = DEFAULT_INFER_ROWS,
+        extrasaction: TYPE_CSV_EXTRAS = "ignore"
     ) -> None:
-        super().__init__(path, encoding)
+        super().__init__(path, encoding, compression, compression_level)
         self.delimiter = delimiter
+        self.append = append
+        self.infer_rows = infer_rows
+
+        if extrasaction not in ("ignore", "raise"):
+            raise ValueError(f"extrasaction must be 'ignore' or 'raise', got: {extrasaction!r}")
+        self.extrasaction = extrasaction
+
+        if fieldnames is None and schema_path:
+            fieldnames = list(csv_columns(load_schema(schema_path).schema))
+        self.fieldnames = fieldnames
 
-    def process(self, data):
+    def write(self, data):
         write_csv(
             data=data,
             path=self.path,
             encoding=self.encoding,
-            delimiter=self.delimiter
+            delimiter=self.delimiter,
+            compression=self.compression,
+            compression_level=self.compression_level,
+            append=self.append,
+            fieldnames=self.fieldnames,
+            infer_rows=self.infer_rows,
+            extrasaction=self.extrasaction
+        )
+
+    def write_batches(self, stream):
+        return write_csv_stream(
+            stream=stream,
+            path=self.path,
+            encoding=self.encoding,
+            delimiter=self.delimiter,
+            compression=self.compression,
+            compression_level=self.compression_level,
+            append=self.append,
+            fieldnames=self.fieldnames,
+            infer_rows=self.infer_rows,
+            extrasaction=self.extrasaction
         )
-        return data
\ No newline at end of file
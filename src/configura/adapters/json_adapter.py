@@ -1,17 +1,64 @@
 from configura.adapters.base_adapter import ReadBase, WriteBase
-from configura.io import read_json, write_json
+from configura.io import read_json, write_json, write_json_stream
+
+from typing import Optional, Union
+
+from configura.constants import DEFAULT_ENCODING, DEFAULT_BATCH_SIZE, DEFAULT_COMPRESSION, DEFAULT_FILE_WORKERS, DEFAULT_JSON_CODEC, DEFAULT_SOURCE_FIELD, TYPE_COMPRESSION
 
 class ReadJson(ReadBase):
-    def process(self, data):
+    # A JSON document has to be parsed as a whole,
+    # read_batches() only splits the loaded list into batches
+    def __init__(
+        self,
+        path: Union[str, list[str]],
+        encoding: str = DEFAULT_ENCODING,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        columnar: bool = False,
+        codec: str = DEFAULT_JSON_CODEC,
+        compression: TYPE_COMPRESSION = DEFAULT_COMPRESSION,
+        file_workers: int = DEFAULT_FILE_WORKERS,
+        ordered: bool = True,
+        source_field: Optional[str] = DEFAULT_SOURCE_FIELD
+    ) -> None:
+        super().__init__(path, encoding, batch_size, columnar, compression, file_workers, ordered, source_field)
+        self.codec = codec
+
+    def read(self):
         return read_json(
             path=self.path,
-            encoding=self.encoding
+            encoding=self.encoding,
+            codec=self.codec,
+            compression=self.compression
         )
 
 class WriteJson(WriteBase):
-    def process(self, data):
-        return write_json(
+    def __init__(
+        self,
+        path: str,
+        encoding: str = DEFAULT_ENCODING,
+        codec: str = DEFAULT_JSON_CODEC,
+        compression: TYPE_COMPRESSION = DEFAULT_COMPRESSION,
+        compression_level: Optional[int] = None
+    ) -> None:
+        super().__init__(path, encoding, compression, compression_level)
+        self.codec = codec
+
+    def write(self, data):
+        write_json(
             data=data,
             path=self.path,
             encoding=self.encoding,
-        )
\ No newline at end of file
+            codec=self.codec,
+            compression=self.compression,
+            compression_level=self.compression_level
+        )
+
+    def write_batches(self, stream):
+        return write_json_stream(
+            stream=stream,
+            path=self.path,
+            encoding=self.encoding,
+            codec=self.codec,
+            compression=self.compression,
+            compression_level=self.compression_level
+        )
@@ -1,17 +1,171 @@
 from configura.adapters.base_adapter import ReadBase, WriteBase
-from configura.io import read_jsonl, write_jsonl
+from configura.io import resolve_compression, read_jsonl, write_jsonl, iter_jsonl, iter_jsonl_parallel, iter_jsonl_tail, write_jsonl_stream
+from configura.stream import collect
+from configura.watermark import Watermark
+
+from typing import Optional, Union
+
+from configura.constants import DEFAULT_ENCODING, DEFAULT_BATCH_SIZE, DEFAULT_COMPRESSION, DEFAULT_FILE_WORKERS, DEFAULT_JSON_CODEC, DEFAULT_RANGE_BYTES, DEFAULT_SOURCE_FIELD, TYPE_COMPRESSION
 
 class ReadJsonl(ReadBase):
-    def process(self, data):
+    """
+    workers > 1 parses byte ranges of the memory-mapped file in a process pool
+    (of every file, if path names several files, see ReadBase).
+    ordered = False yields the records of each range (and file) as soon as it is parsed,
+    a pushed down Limit always reads in file order.
+    Compressed files are always read sequentially.
+
+    watermark = "<state file>" reads only the lines appended since the last
+    successful run (byte offset + inode, see configura.watermark), single files only.
+    The offset is saved by commit(), which the engine calls after the run.
+    """
+
+    supports_pushdown = True
+
+    def __init__(
+        self,
+        path: Union[str, list[str]],
+        encoding: str = DEFAULT_ENCODING,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        columnar: bool = False,
+        codec: str = DEFAULT_JSON_CODEC,
+        compression: TYPE_COMPRESSION = DEFAULT_COMPRESSION,
+        workers: int = 1,
+        ordered: bool = True,
+        range_bytes: int = DEFAULT_RANGE_BYTES,
+        watermark: Optional[str] = None,
+        file_workers: int = DEFAULT_FILE_WORKERS,
+        source_field: Optional[str] = DEFAULT_SOURCE_FIELD
+    ) -> None:
+        super().__init__(path, encoding, batch_size, columnar, compression, file_workers, ordered, source_field)
+        self.codec = codec
+        self.workers = workers
+        self.range_bytes = range_bytes
+
+        if watermark and self.multi_file:
+            raise ValueError(f"watermark requires a single file, got: {path}")
+        self.watermark = Watermark(watermark, path) if watermark else None
+        self._offset: Optional[int] = None
+        # id(record) -> byte offset after its line, for the last batch read
+        self._ends: dict[int, int] = {}
+        if self.watermark is not None and resolve_compression(path, compression) is not None:
+            raise ValueError(f"watermark requires an uncompressed file, got: {path}")
+
+    @property
+    def cacheable(self) -> bool:
+        # Output depends on the watermark state, not only on the file
+        return self.watermark is None
+
+    def commit(self) -> None:
+        """Saves the offset after the lines read in this run."""
+        if self.watermark is not None and self._offset is not None:
+            self.watermark.save(self._offset)
+            self._offset = None
+
+    def read(self):
+        if self.watermark is not None or self.parallel:
+            return collect(self._read_batches(0, self.batch_size))
+
         return read_jsonl(
             path=self.path,
-            encoding=self.encoding
+            encoding=self.encoding,
+            codec=self.codec,
+            compression=self.compression
+        )
+
+    @property
+    def parallel(self) -> bool:
+        # Compressed streams can not be split into byte ranges
+        return self.workers > 1 and self.watermark is None and resolve_compression(self.path, self.compression) is None
+
+    def _read_batches(self, skip, batch_size):
+        if self.watermark is not None:
+            return self._read_tail(skip, batch_size)
+
+        if self.parallel:
+            return iter_jsonl_parallel(
+                path=self.path,
+                encoding=self.encoding,
+                batch_size=batch_size,
+                skip=skip,
+                codec=self.codec,
+                workers=self.workers,
+                ordered=self.ordered or self.pushdown.limited,
+                range_bytes=self.range_bytes
+            )
+
+        return iter_jsonl(
+            path=self.path,
+            encoding=self.encoding,
+            batch_size=batch_size,
+            skip=skip,
+            codec=self.codec,
+            compression=self.compression
+        )
+
+    def _read_tail(self, skip, batch_size):
+        batches = iter_jsonl_tail(
+            path=self.path,
+            offset=self.watermark.load(),
+            encoding=self.encoding,
+            batch_size=batch_size,
+            skip=skip,
+            codec=self.codec
         )
+        for batch, ends, end in batches:
+            if batch:
+                self._ends = dict(zip(map(id, batch), ends))
+                yield batch
+            # The consumer asked for more: the whole batch is done (filtered records included)
+            self._offset = end
+
+    def _read_pushdown(self):
+        stream = super()._read_pushdown()
+        return stream if self.watermark is None else self._track_offset(stream)
+
+    def _track_offset(self, stream):
+        """
+        Moves the offset past the last record of every batch the consumer finished, so a pushed down
+        Limit that stops within a batch leaves the remaining lines for the next run.
+        A consumer that stops within a batch on its own (e.g. a Limit after other steps)
+        gets that batch again in the next run (at least once).
+        """
+        for batch in stream:
+            yield batch
+            self._offset = self._ends.get(id(batch[-1]), self._offset)
 
 class WriteJsonl(WriteBase):
-    def process(self, data):
-        return write_jsonl(
+    def __init__(
+        self,
+        path: str,
+        encoding: str = DEFAULT_ENCODING,
+        codec: str = DEFAULT_JSON_CODEC,
+        compression: TYPE_COMPRESSION = DEFAULT_COMPRESSION,
+        compression_level: Optional[int] = None,
+        append: bool = False
+    ) -> None:
+        super().__init__(path, encoding, compression, compression_level)
+        self.codec = codec
+        self.append = append
+
+    def write(self, data):
+        write_jsonl(
             data=data,
             path=self.path,
             encoding=self.encoding,
-        )
\ No newline at end of file
+            codec=self.codec,
+            compression=self.compression,
+            compression_level=self.compression_level,
+            append=self.append
+        )
+
+    def write_batches(self, stream):
+        return write_jsonl_stream(
+            stream=stream,
+            path=self.path,
+            encoding=self.encoding,
+            codec=self.codec,
+            compression=self.compression,
+            compression_level=self.compression_level,
+            append=self.append
+        )
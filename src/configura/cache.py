@@ -0,0 +1,257 @@
+import glob
+import hashlib
+import inspect
+import json
+import os
+import pickle
+
+from typing import Any, Iterator, Optional
+
+from configura.constants import *
+from configura.io import is_glob
+from configura.stream import collect, drain, iter_batches
+
+class CheckpointCache:
+    """
+    On-disk cache for the output of step prefixes.
+
+    - every prefix of steps without side effects (and not cacheable = False) gets a fingerprint:
+      fingerprint of the previous prefix + step type/params + size/mtime of
+      every file named (or matched by a glob pattern) in the params + the plugin source file
+      + the configura package sources (helpers like paths, schema or io change outputs too)
+    - one checkpoint after the last cacheable step (and after steps with checkpoint: true),
+      written only if it is not stored yet
+    - entries are the record batches of that prefix, pickled one after another
+    - LRU: a hit touches the entry, the least recently used entries are
+      removed once the cache is larger than max_bytes
+
+    Example:
+    - cache = CheckpointCache(".configura_cache", max_bytes=2 * 1024**3)
+    - steps = cache.apply(pipeline, steps) -> resumes after the longest cached prefix
+    """
+
+    def __init__(
+        self,
+        cache_dir: str = DEFAULT_CACHE_DIR,
+        max_bytes: int = DEFAULT_CACHE_BYTES,
+        hash_inputs: bool = False,
+    ) -> None:
+        if max_bytes < 1:
+            raise ValueError(f"max_bytes must be >= 1, got: {max_bytes}")
+
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.hash_inputs = hash_inputs
+
+    def path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.pkl")
+
+    def fingerprints(self, pipeline: list[TYPE_PIPELINE_STEP], steps: list[Any]) -> list[str]:
+        """Fingerprints of the cacheable prefixes, steps[:i + 1] -> fingerprints[i]."""
+        keys: list[str] = []
+        previous = _package_signature()
+        for step, instance in zip(pipeline, steps):
+            # Steps after a writer/DLQ can not be skipped, the side effect would be lost
+            if getattr(instance, "side_effects", False) or not getattr(instance, "cacheable", True):
+                break
+
+            digest = hashlib.sha256(previous.encode())
+            # Where checkpoints are stored does not change the output
+            spec = {key: value for key, value in step.items() if key != "checkpoint"}
+            digest.update(json.dumps(spec, sort_keys=True, default=str).encode())
+            for signature in self._file_signatures(step.get("params") or {}):
+                digest.update(signature.encode())
+            digest.update(_source_signature(type(instance)).encode())
+
+            previous = digest.hexdigest()
+            keys.append(previous)
+        return keys
+
+    def apply(
+        self,
+        pipeline: list[TYPE_PIPELINE_STEP],
+        steps: list[Any],
+        verbose: bool = False,
+    ) -> list[Any]:
+        """
+        Replaces the longest cached prefix with a CachedSource and inserts a Checkpoint
+        after the last cacheable step and after steps with checkpoint: true, unless they are stored.
+        Checkpoints are the only barriers: pushdown and fusion work between them (see planner).
+        """
+        keys = self.fingerprints(pipeline, steps)
+
+        resume = 0
+        for index in range(len(keys), 0, -1):
+            if os.path.exists(self.path(keys[index - 1])):
+                resume = index
+                break
+
+        # Prefix lengths to store, every one after resume is missing
+        points = {len(keys)} | {index + 1 for index, step in enumerate(pipeline[:len(keys)]) if step.get("checkpoint")}
+
+        planned: list[Any] = []
+        if resume:
+            if verbose: print(f"[DEBUG] cache: resuming after step {resume} ({keys[resume - 1][:12]})")
+            planned.append(CachedSource(self, keys[resume - 1]))
+
+        for index in range(resume, len(steps)):
+            planned.append(steps[index])
+            if index + 1 in points and index + 1 > resume:
+                planned.append(Checkpoint(self, keys[index]))
+
+        return planned
+
+    def load(self, key: str) -> TYPE_STREAM:
+        path = self.path(key)
+        # Touch for LRU
+        os.utime(path)
+
+        with open(path, "rb") as f:
+            while True:
+                try:
+                    yield pickle.load(f)
+                except EOFError:
+                    return
+
+    def store(self, key: str, stream: TYPE_STREAM) -> TYPE_STREAM:
+        """Writes the batches while passing them through, the entry only exists once the stream is complete."""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self.path(key)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+
+        complete = False
+        try:
+            with open(tmp_path, "wb") as f:
+                for batch in stream:
+                    pickle.dump(batch, f, protocol=pickle.HIGHEST_PROTOCOL)
+                    yield batch
+            os.replace(tmp_path, path)
+            complete = True
+        finally:
+            if not complete and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+        self.evict()
+
+    def evict(self) -> None:
+        entries = []
+        for entry in os.scandir(self.cache_dir):
+            if entry.name.endswith(".pkl"):
+                stat = entry.stat()
+                entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            os.remove(path)
+            total -= size
+
+    def _file_signatures(self, value: Any) -> Iterator[str]:
+        # Every string param that names an existing file is an input of the step
+        if isinstance(value, dict):
+            for key in sorted(value, key=str):
+                yield from self._file_signatures(value[key])
+        elif isinstance(value, (list, tuple)):
+            for item in value:
+                yield from self._file_signatures(item)
+        elif isinstance(value, str) and os.path.isfile(value):
+            stat = os.stat(value)
+            signature = f"{os.path.abspath(value)}:{stat.st_size}:{stat.st_mtime_ns}"
+            if self.hash_inputs:
+                signature += ":" + _file_hash(value)
+            yield signature
+        elif isinstance(value, str) and is_glob(value):
+            # Files of a pattern (multi-file readers), a new or removed file changes the fingerprint
+            for path in sorted(glob.glob(value, recursive=True)):
+                yield from self._file_signatures(path)
+
+def _source_signature(step_class: type) -> str:
+    # Editing the plugin code invalidates its checkpoints
+    try:
+        path = inspect.getsourcefile(step_class)
+    except TypeError:
+        path = None
+    if not path or not os.path.isfile(path):
+        return step_class.__qualname__
+
+    stat = os.stat(path)
+    return f"{step_class.__module__}.{step_class.__qualname__}:{stat.st_size}:{stat.st_mtime_ns}"
+
+def _package_signature() -> str:
+    # Editing any configura module (e.g. paths, schema, io codecs) invalidates all checkpoints
+    package = os.path.dirname(os.path.abspath(__file__))
+    digest = hashlib.sha256()
+    for path in sorted(glob.glob(os.path.join(package, "**", "*.py"), recursive=True)):
+        stat = os.stat(path)
+        digest.update(f"{os.path.relpath(path, package)}:{stat.st_size}:{stat.st_mtime_ns}".encode())
+    return digest.hexdigest()
+
+def _file_hash(path: str) -> str:
+    digest = hashlib.blake2b()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+class CachedSource:
+    """Replaces a cached step prefix, yields the stored batches."""
+
+    columnar = True
+    owns_output = True
+
+    def __init__(self, cache: CheckpointCache, key: str) -> None:
+        self.cache = cache
+        self.key = key
+
+    def __repr__(self) -> str:
+        return f"CachedSource({self.key[:12]})"
+
+    def process(self, data: TYPE_DATA) -> TYPE_DATA:
+        return collect(self.cache.load(self.key))
+
+    def process_stream(self, stream: TYPE_STREAM) -> TYPE_STREAM:
+        drain(stream)
+        yield from self.cache.load(self.key)
+
+class Checkpoint:
+    """Stores the output of the previous step in the cache and passes it through unchanged."""
+
+    columnar = True
+    # Batches are pickled before they are passed on
+    preserves_ownership = True
+
+    def __init__(self, cache: CheckpointCache, key: str) -> None:
+        self.cache = cache
+        self.key = key
+
+    def __repr__(self) -> str:
+        return f"Checkpoint({self.key[:12]})"
+
+    def process(self, data: Any) -> Any:
+        batches = [data] if not isinstance(data, list) else iter_batches(data, DEFAULT_CHUNK_SIZE)
+        drain(self.cache.store(self.key, batches))
+        return data
+
+    def process_stream(self, stream: TYPE_STREAM) -> TYPE_STREAM:
+        return self.cache.store(self.key, stream)
+
+def build_cache(config: Any) -> Optional[CheckpointCache]:
+    """
+    Example:
+    - cache: true -> CheckpointCache with defaults
+    - cache: {dir: ".cache", max_bytes: 1073741824, hash_inputs: true}
+    - cache: false / missing -> None
+    """
+    if not config:
+        return None
+    if config is True:
+        return CheckpointCache()
+    if not isinstance(config, dict):
+        raise ValueError(f"Config key 'cache' must be a bool or mapping, got: {type(config)}")
+
+    return CheckpointCache(
+        cache_dir=config.get("dir", DEFAULT_CACHE_DIR),
+        max_bytes=config.get("max_bytes", DEFAULT_CACHE_BYTES),
+        hash_inputs=bool(config.get("hash_inputs", False)),
+    )
@@ -3,6 +3,7 @@ from pathlib import Path
 from typing import Optional
 
 from configura.engine import run_pipeline_from_config
+from configura.profiling import Profiler
 
 def main(argv: Optional[list[str]] = None) -> int:
     parser = argparse.ArgumentParser(
@@ -22,12 +23,70 @@ def main(argv: Optional[list[str]] = None) -> int:
         action="store_true",
         help="enable verbose logging",
     )
+    parser.add_argument(
+        "--streaming",
+        action="store_const",
+        const=True,
+        default=None,
+        help="process records as a stream of batches (overrides config key 'streaming')",
+    )
+    parser.add_argument(
+        "--pipelined",
+        action="store_const",
+        const=True,
+        default=None,
+        help="run every step as its own stage connected by bounded queues (overrides config key 'pipelined')",
+    )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=None,
+        metavar="N",
+        help="run parallel-safe steps in N worker processes (overrides config key 'workers')",
+    )
+
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="configura_profile.json",
+        default=None,
+        metavar="FILE",
+        help="print per-step metrics and write them as JSON to FILE (default: configura_profile.json)",
+    )
+    parser.add_argument(
+        "--profile-memory",
+        choices=["rss", "tracemalloc", "none"],
+        default="rss",
+        help="memory metric for --profile (default: rss)",
+    )
+    parser.add_argument(
+        "--profile-cprofile",
+        default=None,
+        metavar="DIR",
+        help="with --profile: write one cProfile stats file per step to DIR",
+    )
 
     args = parser.parse_args(argv)
 
     config_path = Path(args.config)
 
-    run_pipeline_from_config(config_path=config_path, verbose=args.verbose)
+    profiler = None
+    if args.profile:
+        profiler = Profiler(memory=args.profile_memory, cprofile_dir=args.profile_cprofile)
+
+    run_pipeline_from_config(
+        config_path=config_path,
+        verbose=args.verbose,
+        streaming=args.streaming,
+        workers=args.workers,
+        pipelined=args.pipelined,
+        profiler=profiler,
+    )
+
+    if profiler is not None:
+        print(profiler.table())
+        profiler.write_json(args.profile)
 
     return 0
 
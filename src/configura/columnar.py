@@ -0,0 +1,364 @@
+from typing import Any, Callable, Iterable, Iterator, Optional, Union
+
+from configura.constants import *
+
+# Optional dependency: pip install configura[columnar]
+# Imported on first use by require_numpy(), importing numpy takes longer than configura itself
+np = None
+
+class _Missing:
+    """Placeholder for keys that do not exist in a record."""
+
+_MISSING = _Missing()
+_NULL_TYPES = {type(None), _Missing}
+# Largest int64 value, bounds the combined group codes and integer sums
+_MAX_CODE = 2**63 - 1
+
+def require_numpy() -> None:
+    global np
+    if np is None:
+        try:
+            import numpy
+        except ImportError: # pragma: no cover
+            raise ImportError("Columnar batches require numpy: pip install configura[columnar]") from None
+        np = numpy
+
+class Column:
+    """
+    Values of one leaf field path for every row of a batch.
+    - values: int64/float64/bool array for homogeneous scalars, object array otherwise
+    - mask: True where the value is missing or None (null mask)
+    - present: True where the key exists (to rebuild explicit None values)
+    """
+
+    __slots__ = ("values", "mask", "present", "_numeric")
+
+    def __init__(self, values: "np.ndarray", mask: "np.ndarray", present: "np.ndarray") -> None:
+        self.values = values
+        self.mask = mask
+        self.present = present
+        self._numeric = _MISSING
+
+    @classmethod
+    def from_values(cls, values: list[Any]) -> "Column":
+        count = len(values)
+        kinds = set(map(type, values))
+        has_nulls = bool(kinds & _NULL_TYPES)
+        kinds -= _NULL_TYPES
+
+        if has_nulls:
+            present = np.fromiter((value is not _MISSING for value in values), dtype=bool, count=count)
+            mask = np.fromiter((value is None or value is _MISSING for value in values), dtype=bool, count=count)
+            filled = [0 if value is None or value is _MISSING else value for value in values]
+        else:
+            present = np.ones(count, dtype=bool)
+            mask = np.zeros(count, dtype=bool)
+            filled = values
+
+        array = None
+        if kinds == {int}:
+            try:
+                array = np.array(filled, dtype=np.int64)
+            except OverflowError:
+                pass
+        elif kinds == {float}:
+            array = np.array(filled, dtype=np.float64)
+        elif kinds == {bool}:
+            array = np.array(filled, dtype=bool)
+
+        if array is None:
+            # fromiter keeps lists/dicts as single objects instead of adding dimensions
+            array = np.fromiter((None if value is _MISSING else value for value in values), dtype=object, count=count)
+
+        return cls(array, mask, present)
+
+    @property
+    def numeric(self) -> Optional["np.ndarray"]:
+        """float64/int64 view for vectorized comparisons, None if the column is not numeric."""
+        if self._numeric is _MISSING:
+            values = self.values
+            if values.dtype != object:
+                self._numeric = values
+            else:
+                kinds = {type(value) for value in values[~self.mask]}
+                self._numeric = np.where(self.mask, 0, values).astype(np.float64) if kinds and kinds <= {int, float} else None
+        return self._numeric
+
+    def take(self, selector: Any) -> "Column":
+        column = Column(self.values[selector], self.mask[selector], self.present[selector])
+        if self._numeric is not _MISSING:
+            column._numeric = None if self._numeric is None else self._numeric[selector]
+        return column
+
+class ColumnBatch:
+    """
+    Columnar record batch: one Column per leaf field path (nested dicts are flattened).
+
+    Behaves like a read-only list of records (len, slicing, iteration),
+    so steps without columnar support still work, they just see dicts.
+    Steps with columnar = True receive the batch itself.
+
+    Example:
+    - records = [{"id": 1, "payload": {"temp_c": 18.7}}, {"id": 2}]
+    - columns -> ("id",): [1, 2], ("payload", "temp_c"): [18.7, <null>]
+    """
+
+    __slots__ = ("columns", "length")
+
+    def __init__(self, columns: dict[tuple, Column], length: int) -> None:
+        self.columns = columns
+        self.length = length
+
+    @classmethod
+    def from_records(cls, records: TYPE_DATA) -> "ColumnBatch":
+        require_numpy()
+
+        values: dict[tuple, list[Any]] = {}
+        for row, record in enumerate(records):
+            _flatten(record, (), values, row)
+
+        # Pad columns that are missing in the last rows
+        length = len(records)
+        for column in values.values():
+            if len(column) < length:
+                column.extend([_MISSING] * (length - len(column)))
+
+        columns = {path: Column.from_values(column) for path, column in values.items()}
+        return cls(columns, len(records))
+
+    def to_records(self) -> TYPE_DATA:
+        records: TYPE_DATA = [{} for _ in range(self.length)]
+
+        for path, column in self.columns.items():
+            values = column.values.tolist()
+            mask = column.mask.tolist()
+            present = column.present.tolist()
+            parents, last = path[:-1], path[-1]
+
+            for row, record in enumerate(records):
+                if not present[row]:
+                    continue
+
+                target = record
+                for key in parents:
+                    child = target.get(key)
+                    if not isinstance(child, dict):
+                        child = target[key] = {}
+                    target = child
+                target[last] = None if mask[row] else values[row]
+
+        return records
+
+    def column(self, path: str) -> Optional[Column]:
+        return self.columns.get(tuple(path.split(".")))
+
+    def has_nested(self, path: str) -> bool:
+        """True if the path points to a nested dict (prefix of other columns)."""
+        keys = tuple(path.split("."))
+        return any(len(other) > len(keys) and other[:len(keys)] == keys for other in self.columns)
+
+    def take(self, selector: Any) -> "ColumnBatch":
+        """Rows by boolean mask, index array or slice."""
+        if isinstance(selector, slice):
+            length = len(range(self.length)[selector])
+        elif selector.dtype == bool:
+            length = int(np.count_nonzero(selector))
+        else:
+            length = len(selector)
+
+        columns = {path: column.take(selector) for path, column in self.columns.items()}
+        return ColumnBatch(columns, length)
+
+    def drop(self, fields: Iterable[str]) -> "ColumnBatch":
+        """Drops top-level fields (and everything nested below them)."""
+        fields = set(fields)
+        columns = {path: column for path, column in self.columns.items() if path[0] not in fields}
+        return ColumnBatch(columns, self.length)
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __iter__(self) -> Iterator[TYPE_RECORD]:
+        return iter(self.to_records())
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return self.take(index)
+
+        index = range(self.length)[index] # normalizes negative indices, raises IndexError
+        return self.take(slice(index, index + 1)).to_records()[0]
+
+def _flatten(record: TYPE_RECORD, prefix: tuple, values: dict[tuple, list[Any]], row: int) -> None:
+    for key, value in record.items():
+        path = prefix + (key,)
+        if isinstance(value, dict) and value:
+            _flatten(value, path, values, row)
+            continue
+
+        column = values.get(path)
+        if column is None:
+            column = values[path] = []
+        if len(column) < row:
+            # Missing in the rows since the last value
+            column.extend([_MISSING] * (row - len(column)))
+        column.append(value)
+
+def to_columnar(stream: TYPE_STREAM) -> TYPE_STREAM:
+    for batch in stream:
+        yield batch if isinstance(batch, ColumnBatch) else ColumnBatch.from_records(batch)
+
+def as_records(data: Any) -> Any:
+    """Converts a ColumnBatch back to a list of dicts, everything else is returned as is."""
+    return data.to_records() if isinstance(data, ColumnBatch) else data
+
+def filter_column(
+    batch: ColumnBatch,
+    path: str,
+    predicate: Callable[[Any, Any], bool],
+    value: Any,
+    fail_on_type_error: bool = False,
+) -> Optional[ColumnBatch]:
+    """
+    Vectorized FilterByField semantics:
+    - missing/None -> row is dropped
+    - TypeError -> raise if fail_on_type_error, otherwise the row is dropped
+    Returns None if the path points to a nested dict (caller falls back to records).
+    """
+    if batch.has_nested(path):
+        return None
+
+    column = batch.column(path)
+    if column is None:
+        return batch.take(np.zeros(batch.length, dtype=bool))
+
+    numeric = column.numeric
+    if numeric is not None and isinstance(value, (int, float)):
+        selected = np.asarray(predicate(numeric, value), dtype=bool) & ~column.mask
+        return batch.take(selected)
+
+    selected = np.zeros(batch.length, dtype=bool)
+    values = column.values.tolist()
+    for row in np.flatnonzero(~column.mask).tolist():
+        try:
+            selected[row] = bool(predicate(values[row], value))
+        except TypeError:
+            if fail_on_type_error:
+                raise
+    return batch.take(selected)
+
+def group_rows(batch: ColumnBatch, paths: list[str]) -> Optional[tuple[list[tuple], "np.ndarray"]]:
+    """
+    Groups the rows of a batch by the values of the given leaf paths.
+    Returns (keys, inverse): one key tuple per group in order of first appearance
+    and the group index of every row. Missing/None values group as None.
+    Returns None if a path points to a nested dict (caller falls back to records).
+    """
+    codes: list["np.ndarray"] = []
+    uniques: list[list[Any]] = []
+    for path in paths:
+        if batch.has_nested(path):
+            return None
+        column = batch.column(path)
+        if column is None:
+            codes.append(np.zeros(batch.length, dtype=np.int64))
+            uniques.append([None])
+        elif column.values.dtype != object:
+            values, inverse = np.unique(column.values, return_inverse=True)
+            values = values.tolist()
+            if column.mask.any():
+                inverse = np.where(column.mask, len(values), inverse)
+                values.append(None)
+            codes.append(inverse.astype(np.int64))
+            uniques.append(values)
+        else:
+            index: dict[Any, int] = {}
+            mask = column.mask.tolist()
+            try:
+                code = [index.setdefault(None if null else value, len(index)) for value, null in zip(column.values.tolist(), mask)]
+            except TypeError:
+                # Unhashable values (lists)
+                return None
+            codes.append(np.array(code, dtype=np.int64))
+            uniques.append(list(index))
+
+    combined = np.zeros(batch.length, dtype=np.int64)
+    bound = 1
+    for code, values in zip(codes, uniques):
+        if bound * len(values) > _MAX_CODE:
+            # Renumber the combined codes densely (< batch.length) before they overflow int64
+            _, combined = np.unique(combined, return_inverse=True)
+            combined = combined.reshape(-1).astype(np.int64)
+            bound = int(combined.max()) + 1
+        combined = combined * len(values) + code
+        bound *= len(values)
+
+    _, first_rows, inverse = np.unique(combined, return_index=True, return_inverse=True)
+    # Renumber the groups in order of first appearance
+    order = np.argsort(first_rows, kind="stable")
+    rank = np.empty(len(order), dtype=np.int64)
+    rank[order] = np.arange(len(order))
+    first_rows = first_rows[order].tolist()
+
+    keys = [tuple(values[code[row]] for code, values in zip(codes, uniques)) for row in first_rows]
+    return keys, rank[inverse.reshape(-1)]
+
+def group_sizes(inverse: "np.ndarray", groups: int) -> list[int]:
+    """Rows per group of group_rows()."""
+    return np.bincount(inverse, minlength=groups).tolist()
+
+def aggregate_column(column: Column, op: str, inverse: "np.ndarray", groups: int) -> Optional[list[Any]]:
+    """
+    Vectorized Aggregate state of one column per group, None values are ignored.
+    - count -> non-null values, sum/min/max -> value or None, mean -> (sum, count), first/last -> value or None
+    Returns None if the op needs numbers and the column is not numeric, or if an
+    integer sum could overflow int64 (caller falls back to records).
+    """
+    valid = ~column.mask
+    rows = inverse[valid]
+    counts = np.bincount(rows, minlength=groups)
+    if op == "count":
+        return counts.tolist()
+
+    if op in ("first", "last"):
+        selected = np.full(groups, -1, dtype=np.int64)
+        positions = np.flatnonzero(valid)
+        if op == "first":
+            # Fancy assignment keeps the last write, reversed -> first row per group
+            selected[rows[::-1]] = positions[::-1]
+        else:
+            selected[rows] = positions
+        values = column.values
+        return [None if row < 0 else _scalar(values[row]) for row in selected.tolist()]
+
+    numeric = column.numeric
+    if numeric is None or numeric.dtype.kind not in "if":
+        return None
+    numeric = numeric[valid]
+
+    if op in ("sum", "mean"):
+        if numeric.dtype.kind == "f":
+            sums = np.bincount(rows, weights=numeric, minlength=groups)
+        else:
+            if len(numeric) and max(int(numeric.max()), -int(numeric.min())) * len(numeric) > _MAX_CODE:
+                return None
+            sums = np.zeros(groups, dtype=numeric.dtype)
+            np.add.at(sums, rows, numeric)
+        if op == "mean":
+            return [(total, count) for total, count in zip(sums.tolist(), counts.tolist())]
+        return [total if count else None for total, count in zip(sums.tolist(), counts.tolist())]
+
+    if op in ("min", "max"):
+        if numeric.dtype.kind == "f":
+            fill = np.inf if op == "min" else -np.inf
+        else:
+            info = np.iinfo(numeric.dtype)
+            fill = info.max if op == "min" else info.min
+        result = np.full(groups, fill, dtype=numeric.dtype)
+        (np.minimum if op == "min" else np.maximum).at(result, rows, numeric)
+        return [value if count else None for value, count in zip(result.tolist(), counts.tolist())]
+
+    return None
+
+def _scalar(value: Any) -> Any:
+    """numpy scalar -> Python value, object array items are returned as is."""
+    return value.item() if isinstance(value, np.generic) else value
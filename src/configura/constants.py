@@ -1,4 +1,4 @@
-from typing import Any, Literal, TypeAlias
+from typing import Any, Iterator, Literal, TypeAlias
 
 # ----------------------
 # Types
@@ -8,17 +8,37 @@ TYPE_PIPELINE_STEP = dict[str, Any]
 
 TYPE_RECORD: TypeAlias = dict[str, Any]
 TYPE_DATA: TypeAlias = list[TYPE_RECORD]
+TYPE_STREAM: TypeAlias = Iterator[TYPE_DATA] # stream of record batches
 
 TYPE_ON_FAIL = Literal["skip", "fail", "dlq"]
 TYPE_DLQ_FORMAT = Literal["json", "jsonl", "csv"]
+TYPE_COMPRESSION = Literal["infer", "gzip", "bz2", "xz"] | None
+TYPE_CSV_TYPES = dict[str, str] | Literal["infer"] | None # column -> "str" | "int" | "float" | "bool"
+TYPE_CSV_EXTRAS = Literal["ignore", "raise"]
 
 # ----------------------
 # Default Values
 # ----------------------
 
 DEFAULT_ENCODING = "utf-8"
+DEFAULT_JSON_CODEC = "auto" # decode: fastest installed (orjson, msgspec, stdlib json), encode: stdlib json
+DEFAULT_COMPRESSION = "infer" # from the file extension (.gz, .bz2, .xz)
 
 DEFAULT_ON_FAIL = "skip"
 DEFAULT_DLQ_FORMAT = "json"
 
+DEFAULT_BATCH_SIZE = 1000
+DEFAULT_CHUNK_SIZE = 10000 # records per task in parallel execution
+DEFAULT_RANGE_BYTES = 16 * 1024 * 1024 # bytes per task in parallel JSONL parsing
+DEFAULT_QUEUE_SIZE = 4 # batches buffered between pipelined stages
+DEFAULT_FILE_WORKERS = 4 # files read at the same time by readers with several files (glob / list of paths)
+DEFAULT_SOURCE_FIELD = "_source" # field with the source file of every record when reading several files
+DEFAULT_INFER_ROWS = 1000 # CSV rows sampled to infer the header (writer) or column types (reader)
+
+DEFAULT_CACHE_DIR = ".configura_cache"
+DEFAULT_CACHE_BYTES = 1024 * 1024 * 1024 # checkpoint cache size before LRU eviction
+DEFAULT_DEDUP_MEMORY_BYTES = 256 * 1024 * 1024 # in-memory keys of Deduplicate before partitions are spilled
+DEFAULT_SORT_MEMORY_BYTES = 256 * 1024 * 1024 # buffered records of Sort before a sorted run is spilled
+DEFAULT_AGGREGATE_GROUPS = 1_000_000 # groups of Aggregate in memory before their partial states are spilled
+
 VERBOSE = False
\ No newline at end of file
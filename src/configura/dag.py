@@ -0,0 +1,191 @@
+import threading
+
+from typing import Any, Iterator, Optional
+
+from configura.constants import *
+from configura.stages import _Channel, _StageGroup, _close, connect_stages
+from configura.stream import connect, copy_batch, drain
+
+class Branch:
+    """
+    Linear chain of pipeline steps in a DAG.
+    The output of its last step is fanned out to every child branch.
+
+    Example:
+    - read -> validate -> {write_jsonl, filter -> write_csv}
+    - Branch([read, validate], children=[Branch([write_jsonl]), Branch([filter, write_csv])])
+    """
+
+    def __init__(self, names: list[str], specs: list[TYPE_PIPELINE_STEP], children: list["Branch"]) -> None:
+        self.names = names
+        self.specs = specs
+        self.children = children
+        # Planned step instances, set by the Pipeline
+        self.steps: list[Any] = []
+
+    def __repr__(self) -> str:
+        return f"Branch({' -> '.join(self.names)})"
+
+    def walk(self) -> Iterator["Branch"]:
+        """This branch and all descendants, parents before children."""
+        yield self
+        for child in self.children:
+            yield from child.walk()
+
+    def all_steps(self) -> list[Any]:
+        return [instance for branch in self.walk() for instance in branch.steps]
+
+    def with_steps(self, steps: Iterator[Any]) -> "Branch":
+        """Same structure, steps taken in walk() order (e.g. wrapped by a Profiler)."""
+        branch = Branch(self.names, self.specs, [])
+        branch.steps = [next(steps) for _ in self.steps]
+        branch.children = [child.with_steps(steps) for child in self.children]
+        return branch
+
+    def describe(self, indent: str = "") -> str:
+        lines = [f"{indent}{' -> '.join(self.names)}"]
+        for child in self.children:
+            lines.append(child.describe(indent + "  "))
+        return "\n".join(lines)
+
+def build_branches(pipeline: list[TYPE_PIPELINE_STEP]) -> Branch:
+    """
+    Splits the config steps into branches.
+
+    - name: optional step name (default: step<index>)
+    - input: name of an earlier step whose output this step receives,
+      without 'input' a step receives the output of the previous step in the list
+    """
+    if not pipeline:
+        return Branch([], [], [])
+
+    names: list[str] = []
+    index_by_name: dict[str, int] = {}
+    parents: list[Optional[int]] = []
+
+    for index, step in enumerate(pipeline):
+        name = step.get("name", f"step{index}")
+        if not isinstance(name, str) or not name:
+            raise ValueError(f"Step {index}: 'name' must be a non-empty string, got: {name!r}")
+        if name in index_by_name:
+            raise ValueError(f"Step {index}: duplicate step name '{name}'")
+
+        if "input" in step:
+            source = step["input"]
+            if source not in index_by_name:
+                raise ValueError(f"Step '{name}': input '{source}' must name an earlier step")
+            parents.append(index_by_name[source])
+        else:
+            parents.append(index - 1 if index else None)
+
+        names.append(name)
+        index_by_name[name] = index
+
+    children: list[list[int]] = [[] for _ in pipeline]
+    for index, parent in enumerate(parents):
+        if parent is not None:
+            children[parent].append(index)
+
+    def chain(start: int) -> Branch:
+        indices = [start]
+        while len(children[indices[-1]]) == 1:
+            indices.append(children[indices[-1]][0])
+        return Branch(
+            [names[i] for i in indices],
+            [pipeline[i] for i in indices],
+            [chain(child) for child in children[indices[-1]]],
+        )
+
+    return chain(0)
+
+def run_branches(
+    root: Branch,
+    stream: Optional[TYPE_STREAM] = None,
+    queue_size: int = DEFAULT_QUEUE_SIZE,
+    pipelined: bool = False,
+) -> None:
+    """
+    Runs a DAG of planned branches as streams.
+
+    Shared upstream steps run once, at every fan-out each child branch gets its own
+    copy of every batch through a bounded queue and runs concurrently in a thread.
+    The slowest branch sets the pace (backpressure). The first error cancels all branches.
+    """
+    group = _StageGroup()
+    _run_branch(root, stream, group, queue_size, pipelined, side_effects=False)
+    if group.error is not None:
+        raise group.error
+
+def _run_branch(
+    branch: Branch,
+    stream: Optional[TYPE_STREAM],
+    group: _StageGroup,
+    queue_size: int,
+    pipelined: bool,
+    side_effects: bool,
+) -> None:
+    if pipelined:
+        output = connect_stages(branch.steps, stream, queue_size, side_effects=side_effects)
+    else:
+        output = connect(branch.steps, stream, side_effects=side_effects)
+
+    if not branch.children:
+        drain(output)
+        return
+
+    # Steps with side effects (writers, DLQ) must see every record even if all branches stop early
+    side_effects = side_effects or any(getattr(instance, "side_effects", False) for instance in branch.steps)
+
+    channels = [_Channel(group, queue_size) for _ in branch.children]
+    threads = [
+        threading.Thread(
+            target=_consume_branch,
+            args=(child, channel.results(), group, queue_size, pipelined, side_effects),
+            name=f"configura-branch-{child.names[0]}",
+            daemon=True,
+        )
+        for child, channel in zip(branch.children, channels)
+    ]
+    for thread in threads:
+        thread.start()
+
+    completed = False
+    try:
+        for batch in output:
+            if group.cancel.is_set():
+                raise group.failure()
+
+            live = [channel for channel in channels if not channel.stopped.is_set()]
+            if not live and not side_effects:
+                break
+            # The last branch gets the original batch, the others a copy
+            for position, channel in enumerate(live):
+                channel.put(batch if position == len(live) - 1 else copy_batch(batch))
+
+        for channel in channels:
+            channel.close()
+        completed = True
+    except Exception as exc:
+        group.fail(exc)
+        raise
+    finally:
+        if not completed:
+            group.cancel.set()
+        _close(output)
+        for thread in threads:
+            thread.join()
+
+def _consume_branch(
+    branch: Branch,
+    stream: TYPE_STREAM,
+    group: _StageGroup,
+    queue_size: int,
+    pipelined: bool,
+    side_effects: bool,
+) -> None:
+    try:
+        _run_branch(branch, stream, group, queue_size, pipelined, side_effects)
+    except BaseException as exc:
+        group.fail(exc)
+    finally:
+        _close(stream)
@@ -0,0 +1,206 @@
+import atexit
+import os
+import threading
+
+from datetime import datetime
+from typing import IO, Any, Iterable, Optional
+
+from configura.constants import *
+from configura.io import _is_utf8, get_codec
+
+class DeadLetterSink:
+    """
+    Append-only JSONL file for rejected records.
+
+    - entries are buffered and written with one writelines() per flush
+    - existing files are appended to, never overwritten
+    - rotation: when max_bytes or max_records is reached, the active file
+      is renamed to '<name>_<YYYYmmdd_HHMMSS>.jsonl' and a new one is started
+
+    Example:
+    - sink = DeadLetterSink("data/dlq/", "records_dlq", max_records=10000)
+    - sink.write([{"record": {...}, "errors": ["..."]}])
+    - sink.close() -> flushes, the file is reopened on the next write
+    The record count of the active file is kept in memory, it is only counted
+    when a file is opened that was changed by someone else.
+
+    A sink is thread-safe. Steps sharing it (see get_sink) call acquire() first,
+    their close() then only closes the file after the last user.
+    """
+
+    def __init__(
+        self,
+        dlq_dir: str,
+        dlq_name: str,
+        encoding: str = DEFAULT_ENCODING,
+        max_bytes: Optional[int] = None,
+        max_records: Optional[int] = None,
+        buffer_records: int = DEFAULT_BATCH_SIZE,
+    ) -> None:
+        if max_records is not None and max_records < 1:
+            raise ValueError(f"max_records must be >= 1, got: {max_records}")
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError(f"max_bytes must be >= 1, got: {max_bytes}")
+
+        self.dlq_dir = dlq_dir
+        self.dlq_name = dlq_name
+        self.encoding = encoding
+        self.max_bytes = max_bytes
+        self.max_records = max_records
+        self.buffer_records = buffer_records
+        self._encode = get_codec().encode
+        self._utf8 = _is_utf8(encoding)
+
+        self.path = f"{dlq_dir}{dlq_name}.jsonl"
+        self.total_records = 0
+
+        self._buffer: list[bytes] = []
+        self._file: Optional[IO[bytes]] = None
+        self._bytes = 0
+        self._records = 0
+        # Size of the active file when it was closed, -1: unknown
+        self._closed_size = -1
+        self._users = 0
+        self._lock = threading.RLock()
+
+    def acquire(self) -> "DeadLetterSink":
+        """Registers a user, close() keeps the file open for the others."""
+        with self._lock:
+            self._users += 1
+        return self
+
+    def write(self, entries: Iterable[Any]) -> None:
+        # Encoded outside the lock
+        lines = [self._encode(entry) + b"\n" for entry in entries]
+        if not self._utf8:
+            lines = [line.decode("utf-8").encode(self.encoding) for line in lines]
+
+        with self._lock:
+            self._buffer.extend(lines)
+            self.total_records += len(lines)
+            if len(self._buffer) >= self.buffer_records:
+                self.flush()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush()
+
+    def _flush(self) -> None:
+        if not self._buffer:
+            return
+
+        buffer, self._buffer = self._buffer, []
+        while buffer:
+            if self._file is None:
+                self._open()
+
+            # Records that still fit into the active file
+            count = len(buffer)
+            if self.max_records is not None:
+                count = min(count, max(self.max_records - self._records, 0))
+            if self.max_bytes is not None:
+                size, fitting = self._bytes, 0
+                for line in buffer[:count]:
+                    if size + len(line) > self.max_bytes and (fitting or size):
+                        break
+                    size += len(line)
+                    fitting += 1
+                count = fitting
+
+            if count == 0:
+                self._rotate()
+                continue
+
+            chunk, buffer = buffer[:count], buffer[count:]
+            self._file.writelines(chunk)
+            self._bytes += sum(len(line) for line in chunk)
+            self._records += len(chunk)
+
+        self._file.flush()
+
+    def close(self) -> None:
+        """Flushes, closes the file unless other acquired users remain."""
+        with self._lock:
+            self._flush()
+            self._users = max(self._users - 1, 0)
+            if self._users == 0:
+                self._close_file()
+
+    def _close_file(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            self._closed_size = self._bytes
+
+    def _open(self) -> None:
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self._file = open(self.path, "ab")
+        size = self._file.tell()
+        if size != self._closed_size:
+            # New, rotated or changed file
+            self._records = _count_lines(self.path) if size and self.max_records is not None else 0
+        self._bytes = size
+
+    def _rotate(self) -> None:
+        self._file.close()
+        self._file = None
+
+        stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        target = f"{self.dlq_dir}{self.dlq_name}_{stamp}.jsonl"
+        counter = 1
+        while os.path.exists(target):
+            target = f"{self.dlq_dir}{self.dlq_name}_{stamp}_{counter}.jsonl"
+            counter += 1
+
+        os.replace(self.path, target)
+        self._bytes = self._records = 0
+        self._closed_size = 0
+
+def _count_lines(path: str) -> int:
+    count = 0
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            count += chunk.count(b"\n")
+    return count
+
+# Shared sinks: plugins writing to the same DLQ file use the same buffer
+_SINKS: dict[str, DeadLetterSink] = {}
+_SINKS_LOCK = threading.Lock()
+
+def get_sink(
+    dlq_dir: str,
+    dlq_name: str,
+    encoding: str = DEFAULT_ENCODING,
+    max_bytes: Optional[int] = None,
+    max_records: Optional[int] = None,
+) -> DeadLetterSink:
+    """
+    Returns the process-wide sink for a DLQ file, created on first use.
+    Every user of a file needs the same encoding and rotation settings (ValueError otherwise).
+    Users call acquire() on it and close() when they are done.
+    """
+    path = os.path.abspath(f"{dlq_dir}{dlq_name}.jsonl")
+
+    with _SINKS_LOCK:
+        sink = _SINKS.get(path)
+        if sink is None:
+            sink = _SINKS[path] = DeadLetterSink(
+                dlq_dir,
+                dlq_name,
+                encoding=encoding,
+                max_bytes=max_bytes,
+                max_records=max_records,
+            )
+        elif (sink.encoding, sink.max_bytes, sink.max_records) != (encoding, max_bytes, max_records):
+            raise ValueError(
+                f"DLQ {path} is already used with encoding={sink.encoding}, max_bytes={sink.max_bytes}, "
+                f"max_records={sink.max_records}, got: encoding={encoding}, max_bytes={max_bytes}, max_records={max_records}"
+            )
+    return sink
+
+@atexit.register
+def close_sinks() -> None:
+    for sink in list(_SINKS.values()):
+        with sink._lock:
+            sink._flush()
+            sink._close_file()
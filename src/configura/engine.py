@@ -1,47 +1,26 @@
-from configura.io import read_yaml, read_json
-from configura.loader import process_class
-from configura.constants import *
+from configura.pipeline import Pipeline, commit_steps, run_steps, run_steps_streaming
+from configura.profiling import Profiler
 from pathlib import Path
-
-def run_pipeline_from_config(config_path: Path, verbose: bool = False) -> None:
-    # Convert to str if type(Path)
-
-    if not config_path.exists():
-        raise SystemExit(f"Config file not found: {config_path}")
-
-    if not config_path.is_file():
-        raise SystemExit(f"Config path is not a file: {config_path}")
-
-    if config_path.suffix in (".yaml", ".yml"):
-        config = read_yaml(str(config_path))
-    elif config_path.suffix == ".json":
-        config = read_json(str(config_path))
-    else:
-        raise SystemExit(
-            f"Unsupported config format '{config_path.suffix}'. "
-            f"Allowed: .yaml, .yml, .json"
-        )
-
-    if not isinstance(config, dict):
-        raise ValueError(f"Config root must be an object/dict, got: {type(config)}")
-
-    if verbose: print("[DEBUG] Loaded config:", config)
-
-    pipeline: list[dict] = config.get("pipeline", [])
-    if not isinstance(pipeline, list):
-        raise ValueError("Config key 'pipeline' must be a list.")
-
-    if verbose: print(f"[DEBUG] Executing {len(pipeline)} pipeline steps...")
-
-    data = []
-    for step in pipeline:
-        if verbose: print(f"[DEBUG] step: {step}")
-        data = process_class(step, data)
-
-    if verbose: print("[DONE] Pipeline finished")
+from typing import Optional
+
+def run_pipeline_from_config(
+    config_path: Path,
+    verbose: bool = False,
+    streaming: Optional[bool] = None,
+    workers: Optional[int] = None,
+    pipelined: Optional[bool] = None,
+    profiler: Optional[Profiler] = None,
+) -> None:
+    """
+    profiler: collects per-step metrics of this run (see configura.profiling)
+
+    Compiles and runs the pipeline once, use configura.pipeline.Pipeline to run it repeatedly.
+    """
+    pipeline = Pipeline.from_config(config_path, verbose=verbose, streaming=streaming, workers=workers, pipelined=pipelined)
+    pipeline.run(profiler=profiler)
 
 # for debug & development
 if __name__ == "__main__":
     #default_config = "./data/configs/pipeline.yaml"
     #run_pipeline_from_config(default_config, verbose=True)
-    pass
\ No newline at end of file
+    pass
@@ -0,0 +1,286 @@
+import ast
+import operator
+
+from typing import Any, Callable, Optional
+
+from configura.constants import TYPE_DATA, TYPE_RECORD
+from configura.paths import compile_path
+
+COMPARISONS = {
+    ast.Eq:    ("==", operator.eq),
+    ast.NotEq: ("!=", operator.ne),
+    ast.Lt:    ("<", operator.lt),
+    ast.LtE:   ("<=", operator.le),
+    ast.Gt:    (">", operator.gt),
+    ast.GtE:   (">=", operator.ge),
+    ast.In:    ("in", lambda left, right: left in right),
+    ast.NotIn: ("not in", lambda left, right: left not in right),
+}
+
+# Nodes: ("and", [nodes]), ("or", [nodes]), ("not", node), ("truthy", operand),
+#        ("null", operand, is_null), ("cmp", symbol, left, right)
+# Operands: ("field", path), ("const", value)
+TYPE_NODE = tuple
+
+class Expression:
+    """
+    Boolean expression over dotted field paths, compiled once into Python functions.
+
+    Syntax (Python): and, or, not, ==, !=, <, <=, >, >=, in, not in, is None, is not None,
+    chained ranges (10 <= payload.temp_c < 30), literal lists for 'in',
+    field("any-key.path") for paths that are not identifiers.
+
+    Comparisons with a missing/None value are false (like FilterByField),
+    so are comparisons that raise TypeError (e.g. "abc" < 5).
+
+    Example:
+    - expr = Expression('payload.temp_c >= 20 and type in ["sensor_reading", "telemetry"]')
+    - expr.matches({"type": "telemetry", "payload": {"temp_c": 21.5}}) -> True
+    - expr.select(batch) -> records of the batch that match
+    """
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+        try:
+            tree = ast.parse(text.strip(), mode="eval")
+        except SyntaxError as exc:
+            raise ValueError(f"Invalid expression {text!r}: {exc.msg}") from None
+
+        self.root = _parse(tree.body, text)
+        self.fields = sorted(_fields(self.root))
+        # Top-level AND terms, their order can change without changing the result
+        self.conjuncts: list[TYPE_NODE] = self.root[1] if self.root[0] == "and" else [self.root]
+
+        self.matches = self._wrap(_generate(self.root)[0])
+        self.select = self.selector()
+
+    def selector(self, order: Optional[list[int]] = None) -> Callable[[TYPE_DATA], TYPE_DATA]:
+        """Batch filter with the top-level AND terms in the given order (one comprehension, no call per record)."""
+        if order is None:
+            root = self.root
+        else:
+            root = ("and", [self.conjuncts[i] for i in order]) if len(order) > 1 else self.conjuncts[order[0]]
+        return self._wrap_batch(_generate(root)[1])
+
+    def source(self, bind: Callable[[Any], str]) -> str:
+        """
+        Python source of the expression on a record 'r' (no TypeError handling),
+        getters and constants are bound through bind(value) -> name.
+        """
+        return _Generator(bind).source(self.root)
+
+    def conjunct_selector(self, index: int) -> Callable[[TYPE_DATA], TYPE_DATA]:
+        """Batch filter of a single top-level AND term."""
+        node = self.conjuncts[index]
+        return self._wrap_batch(_generate(node)[1], lambda item: bool(_evaluate(node, item)))
+
+    def _wrap(self, matches: Callable[[TYPE_RECORD], Any]) -> Callable[[TYPE_RECORD], bool]:
+        root = self.root
+
+        def safe_matches(item: TYPE_RECORD) -> bool:
+            try:
+                return bool(matches(item))
+            except TypeError:
+                # Per comparison TypeError handling, only for the records that need it
+                return bool(_evaluate(root, item))
+
+        return safe_matches
+
+    def _wrap_batch(
+        self,
+        select: Callable[[TYPE_DATA], TYPE_DATA],
+        matches: Optional[Callable[[TYPE_RECORD], bool]] = None,
+    ) -> Callable[[TYPE_DATA], TYPE_DATA]:
+        matches = matches or self.matches
+
+        def safe_select(batch: TYPE_DATA) -> TYPE_DATA:
+            try:
+                return select(batch)
+            except TypeError:
+                return [item for item in batch if matches(item)]
+
+        return safe_select
+
+    def __repr__(self) -> str:
+        return f"Expression({self.text!r})"
+
+#region Parsing
+def _parse(node: ast.AST, text: str) -> TYPE_NODE:
+    if isinstance(node, ast.BoolOp):
+        kind = "and" if isinstance(node.op, ast.And) else "or"
+        children: list[TYPE_NODE] = []
+        for value in node.values:
+            child = _parse(value, text)
+            # Flatten a and (b and c)
+            children.extend(child[1] if child[0] == kind else [child])
+        return (kind, children)
+
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not):
+        return ("not", _parse(node.operand, text))
+
+    if isinstance(node, ast.Compare):
+        terms: list[TYPE_NODE] = []
+        left = _operand(node.left, text)
+        for op, comparator in zip(node.ops, node.comparators):
+            right = _operand(comparator, text)
+            if isinstance(op, (ast.Is, ast.IsNot)):
+                if right != ("const", None) or left[0] != "field":
+                    raise ValueError(f"Invalid expression {text!r}: 'is' is only supported as '<field> is [not] None'")
+                terms.append(("null", left, isinstance(op, ast.Is)))
+            elif type(op) in COMPARISONS:
+                terms.append(("cmp", COMPARISONS[type(op)][0], left, right))
+            else: # pragma: no cover (all Python comparison operators are handled)
+                raise ValueError(f"Invalid expression {text!r}: unsupported comparison")
+            left = right
+        return terms[0] if len(terms) == 1 else ("and", terms)
+
+    operand = _operand(node, text)
+    if operand[0] == "field":
+        return ("truthy", operand)
+    raise ValueError(f"Invalid expression {text!r}: constant {ast.unparse(node)} is not a condition")
+
+def _operand(node: ast.AST, text: str) -> TYPE_NODE:
+    path = _path(node)
+    if path is not None:
+        return ("field", path)
+
+    if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id == "field":
+        if len(node.args) == 1 and not node.keywords and isinstance(node.args[0], ast.Constant) and isinstance(node.args[0].value, str):
+            return ("field", node.args[0].value)
+        raise ValueError(f"Invalid expression {text!r}: field() takes one string path")
+
+    try:
+        value = ast.literal_eval(node)
+    except ValueError:
+        raise ValueError(f"Invalid expression {text!r}: unsupported syntax {ast.unparse(node)!r}") from None
+
+    if isinstance(value, (list, tuple, set)):
+        try:
+            value = frozenset(value)
+        except TypeError:
+            value = tuple(value)
+    return ("const", value)
+
+def _path(node: ast.AST) -> Optional[str]:
+    """payload.temp_c (Name/Attribute chain) -> "payload.temp_c", None for other nodes."""
+    keys = []
+    while isinstance(node, ast.Attribute):
+        keys.append(node.attr)
+        node = node.value
+    if not isinstance(node, ast.Name) or node.id in ("True", "False", "None"):
+        return None
+    keys.append(node.id)
+    return ".".join(reversed(keys))
+
+def _fields(node: TYPE_NODE) -> set[str]:
+    kind = node[0]
+    if kind in ("and", "or"):
+        return set().union(*(_fields(child) for child in node[1]))
+    if kind == "not":
+        return _fields(node[1])
+    if kind == "field":
+        return {node[1]}
+    if kind in ("truthy", "null"):
+        return _fields(node[1])
+    if kind == "cmp":
+        return _fields(node[2]) | _fields(node[3])
+    return set()
+#endregion
+
+#region Code generation
+class _Generator:
+    """
+    Builds the source of a node, constants and getters are passed in as closure variables.
+    bind(value) -> name: binds them in another namespace (e.g. a fused loop), default: self.names
+    """
+
+    def __init__(self, bind: Optional[Callable[[Any], str]] = None) -> None:
+        self.names: dict[str, Any] = {}
+        self._bind = bind or self._bind_local
+        self._getters: dict[str, str] = {}
+        self._values = 0
+
+    def _bind_local(self, value: Any) -> str:
+        name = f"_c{len(self.names)}"
+        self.names[name] = value
+        return name
+
+    def getter(self, path: str) -> str:
+        name = self._getters.get(path)
+        if name is None:
+            name = self._getters[path] = self._bind(compile_path(path).get)
+        return name
+
+    def const(self, value: Any) -> str:
+        return self._bind(value)
+
+    def value(self) -> str:
+        self._values += 1
+        return f"_v{self._values}"
+
+    def source(self, node: TYPE_NODE) -> str:
+        kind = node[0]
+        if kind in ("and", "or"):
+            return "(" + f" {kind} ".join(self.source(child) for child in node[1]) + ")"
+        if kind == "not":
+            return f"(not {self.source(node[1])})"
+        if kind == "truthy":
+            return f"bool({self.getter(node[1][1])}(r))"
+        if kind == "null":
+            return f"({self.getter(node[1][1])}(r) is {'' if node[2] else 'not '}None)"
+
+        _, symbol, left, right = node
+        checks: list[str] = []
+        operands: list[str] = []
+        for operand in (left, right):
+            if operand[0] == "field":
+                name = self.value()
+                checks.append(f"({name} := {self.getter(operand[1])}(r)) is not None")
+                operands.append(name)
+            elif operand[1] is None:
+                # Comparisons with None are false
+                return "False"
+            else:
+                operands.append(self.const(operand[1]))
+        return "(" + " and ".join(checks + [f"{operands[0]} {symbol} {operands[1]}"]) + ")"
+
+def _generate(node: TYPE_NODE) -> tuple[Callable[[TYPE_RECORD], Any], Callable[[TYPE_DATA], TYPE_DATA]]:
+    generator = _Generator()
+    expression = generator.source(node)
+    names = ", ".join(generator.names)
+    source = (
+        f"def _build({names}):\n"
+        f"    def matches(r):\n"
+        f"        return {expression}\n"
+        f"    def select(batch):\n"
+        f"        return [r for r in batch if {expression}]\n"
+        f"    return matches, select\n"
+    )
+    namespace: dict[str, Any] = {}
+    exec(compile(source, "<configura expression>", "exec"), namespace)
+    return namespace["_build"](**generator.names)
+
+def _evaluate(node: TYPE_NODE, item: TYPE_RECORD) -> bool:
+    """Reference evaluation, a TypeError only makes its own comparison false."""
+    kind = node[0]
+    if kind == "and":
+        return all(_evaluate(child, item) for child in node[1])
+    if kind == "or":
+        return any(_evaluate(child, item) for child in node[1])
+    if kind == "not":
+        return not _evaluate(node[1], item)
+    if kind == "truthy":
+        return bool(compile_path(node[1][1]).get(item))
+    if kind == "null":
+        return (compile_path(node[1][1]).get(item) is None) == node[2]
+
+    _, symbol, left, right = node
+    values = [compile_path(operand[1]).get(item) if operand[0] == "field" else operand[1] for operand in (left, right)]
+    if values[0] is None or values[1] is None:
+        return False
+    predicate = next(function for sym, function in COMPARISONS.values() if sym == symbol)
+    try:
+        return bool(predicate(values[0], values[1]))
+    except TypeError:
+        return False
+#endregion
@@ -0,0 +1,118 @@
+from typing import Any, Callable, Optional
+
+from configura.constants import *
+
+def is_fusable(instance: Any) -> bool:
+    """
+    A step can be fused if it works record by record:
+    process_record(record) -> record (changed or new) or None to drop it.
+    Steps with batch-level behavior (e.g. a DLQ file per batch) opt out with fusable = False.
+    """
+    return hasattr(instance, "process_record") and bool(getattr(instance, "fusable", True))
+
+class RecordSource:
+    """
+    Source of a fused loop. Steps can inline themselves with record_source(source) -> lines:
+    Python statements on the current record 'r' (may replace it), 'continue' drops the record.
+    Values the lines need are bound as closure variables with bind(value) -> name.
+
+    Example (DropFields in place):
+    - fields = source.bind(frozenset(["secret"]))
+    - RESULT -> [f"for _f in {fields}:", "    r.pop(_f, None)"]
+    """
+
+    def __init__(self) -> None:
+        self.names: dict[str, Any] = {}
+
+    def bind(self, value: Any) -> str:
+        name = f"_b{len(self.names)}"
+        self.names[name] = value
+        return name
+
+    def step_lines(self, instance: Any) -> list[str]:
+        record_source = getattr(instance, "record_source", None)
+        if record_source is not None:
+            return record_source(self)
+
+        # Only process_record: one call per record
+        function = self.bind(instance.process_record)
+        return [f"r = {function}(r)", "if r is None:", "    continue"]
+
+    def compile(self, steps: list[Any]) -> Callable[[TYPE_DATA], TYPE_DATA]:
+        body: list[str] = []
+        for instance in steps:
+            body.extend(self.step_lines(instance))
+
+        lines = [
+            f"def _build({', '.join(self.names)}):",
+            "    def fused(batch):",
+            "        result = []",
+            "        append = result.append",
+            "        for r in batch:",
+            *(f"            {line}" for line in body),
+            "            append(r)",
+            "        return result",
+            "    return fused",
+        ]
+        namespace: dict[str, Any] = {}
+        exec(compile("\n".join(lines) + "\n", "<configura fused steps>", "exec"), namespace)
+        return namespace["_build"](**self.names)
+
+class FusedSteps:
+    """
+    Consecutive record-wise steps in a single generated loop: every record runs through all steps
+    before the next one, a step that drops the record skips the rest (no list per step).
+    The loop is generated on first use and again when the in_place modes of the steps change.
+
+    Example:
+    - RenameFields -> DropFields -> FilterByField
+    - RESULT -> FusedSteps(RenameFields -> DropFields -> FilterByField)
+    """
+
+    streamable = True
+
+    def __init__(self, steps: list[Any]) -> None:
+        self.steps = steps
+        self._function: Optional[Callable[[TYPE_DATA], TYPE_DATA]] = None
+        self._modes: Optional[tuple] = None
+
+    def __repr__(self) -> str:
+        names = " -> ".join(type(step).__name__ for step in self.steps)
+        return f"FusedSteps({names})"
+
+    def __reduce__(self):
+        # The generated loop can not be pickled (process pools), it is generated again
+        return (FusedSteps, (self.steps,))
+
+    @property
+    def parallel_safe(self) -> bool:
+        return all(getattr(step, "parallel_safe", False) for step in self.steps)
+
+    @property
+    def side_effects(self) -> bool:
+        return any(getattr(step, "side_effects", False) for step in self.steps)
+
+    @property
+    def preserves_ownership(self) -> bool:
+        return all(getattr(step, "preserves_ownership", False) for step in self.steps)
+
+    @property
+    def in_place(self) -> bool:
+        return all(step.in_place for step in self.steps if hasattr(step, "in_place"))
+
+    @in_place.setter
+    def in_place(self, value: bool) -> None:
+        # Same records for every step, so the same ownership
+        for step in self.steps:
+            if hasattr(step, "in_place"):
+                step.in_place = value
+
+    def process(self, data: TYPE_DATA) -> TYPE_DATA:
+        if data is None:
+            return []
+
+        modes = tuple(getattr(step, "in_place", None) for step in self.steps)
+        if self._function is None or modes != self._modes:
+            self._function = RecordSource().compile(self.steps)
+            self._modes = modes
+        return self._function(data)
@@ -1,13 +1,297 @@
+import bz2
+import codecs
+# concurrent.futures loads the process pool module (multiprocessing) only on first use
+import concurrent.futures
 import csv
+import glob
+import gzip
 import json
+import lzma
+import mmap
+import os
 import yaml
 
-from typing import Any
+from collections import deque
+from functools import lru_cache
+from itertools import chain, islice
+from typing import IO, Any, Callable, Iterable, Iterator, Optional, Union
 from pathlib import Path
 
 from configura.constants import *
+from configura.stream import collect, drain, iter_batches
+
+#region Paths
+def is_glob(path: str) -> bool:
+    """True for patterns like "data/records_2025-11-01T*.jsonl" ("*", "?" or "[...]")."""
+    return glob.has_magic(path)
+
+def expand_paths(paths: Union[str, list[str]]) -> list[str]:
+    """
+    Files of a path, a glob pattern or a list of both, every pattern in sorted order.
+    "**" matches nested directories, a pattern that matches nothing raises FileNotFoundError.
+
+    Example:
+    - expand_paths("data/records_2025-11-01T*.jsonl") -> ["data/records_2025-11-01T00.jsonl", ...]
+    - expand_paths(["data/a.csv", "data/b/*.csv"]) -> ["data/a.csv", "data/b/1.csv", "data/b/2.csv"]
+    """
+    files: list[str] = []
+    for path in [paths] if isinstance(paths, str) else paths:
+        if not is_glob(path):
+            files.append(path)
+            continue
+
+        matches = sorted(match for match in glob.glob(path, recursive=True) if os.path.isfile(match))
+        if not matches:
+            raise FileNotFoundError(f"No files match: {path}")
+        files.extend(matches)
+    return files
+#endregion
+
+#region Compression
+# Stdlib streaming (de)compressors, files are never decompressed to disk
+COMPRESSIONS = {
+    "gzip": gzip.open,
+    "bz2": bz2.open,
+    "xz": lzma.open,
+}
+
+COMPRESSION_EXTENSIONS = {
+    ".gz": "gzip",
+    ".gzip": "gzip",
+    ".bz2": "bz2",
+    ".xz": "xz",
+    ".lzma": "xz",
+}
+
+def resolve_compression(path: str, compression: TYPE_COMPRESSION = DEFAULT_COMPRESSION) -> Optional[str]:
+    """
+    Example:
+    - resolve_compression("data/records.jsonl.gz") -> "gzip"
+    - resolve_compression("data/records.jsonl") -> None
+    - resolve_compression("data/records.bin", "xz") -> "xz"
+    """
+    if compression is None or compression == "none":
+        return None
+    if compression == "infer":
+        return COMPRESSION_EXTENSIONS.get(Path(path).suffix.lower())
+    if compression == "lzma":
+        return "xz"
+    if compression not in COMPRESSIONS:
+        raise ValueError(f"Unknown compression '{compression}'. Allowed: infer, none, {', '.join(COMPRESSIONS)}")
+    return compression
+
+def open_file(
+    path: str,
+    mode: str = "r",
+    encoding: Optional[str] = None,
+    newline: Optional[str] = None,
+    compression: TYPE_COMPRESSION = DEFAULT_COMPRESSION,
+    compression_level: Optional[int] = None
+) -> IO:
+    """
+    open() with transparent compression, same modes as open() ("r", "w", "a", "rb", "wb", ...).
+    compression_level: gzip/bz2 1-9, xz preset 0-9 (None -> library default), writing only.
+    """
+    name = resolve_compression(path, compression)
+    if name is None:
+        return open(path, mode, encoding=encoding, newline=newline)
+
+    if "b" not in mode and "t" not in mode:
+        mode += "t"
+    kwargs: dict[str, Any] = {}
+    if "b" not in mode:
+        kwargs.update(encoding=encoding, newline=newline)
+    if compression_level is not None and "r" not in mode:
+        kwargs["preset" if name == "xz" else "compresslevel"] = compression_level
+
+    return COMPRESSIONS[name](path, mode, **kwargs)
+#endregion
+
+#region Codec
+class JsonCodec:
+    """
+    JSON backend based on the stdlib, always available.
+
+    - decode: accepts bytes (UTF-8) or str, no text-decode pass needed for bytes
+    - encode: returns UTF-8 bytes, non-ASCII characters are kept (ensure_ascii=False)
+    """
+
+    name = "json"
+
+    def decode(self, data: Union[bytes, str]) -> Any:
+        return json.loads(data)
+
+    def encode(self, obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+    def encode_indent(self, obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+
+def _has_non_finite(obj: Any) -> bool:
+    """NaN/Infinity anywhere in obj (orjson and msgspec would write them as null)."""
+    if isinstance(obj, float):
+        return obj != obj or obj in (float("inf"), float("-inf"))
+    if isinstance(obj, dict):
+        return any(_has_non_finite(value) for value in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return any(_has_non_finite(value) for value in obj)
+    return False
+
+class OrjsonCodec(JsonCodec):
+    """
+    orjson backend (pip install orjson), compact output.
+    Values orjson rejects (NaN literals, ints > 64 bit, ...) fall back to the stdlib,
+    so do NaN/Infinity values (orjson would write null).
+    """
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        import orjson
+        self._orjson = orjson
+
+    def decode(self, data: Union[bytes, str]) -> Any:
+        try:
+            return self._orjson.loads(data)
+        except self._orjson.JSONDecodeError:
+            return json.loads(data)
+
+    def encode(self, obj: Any) -> bytes:
+        try:
+            data = self._orjson.dumps(obj)
+        except TypeError:
+            return super().encode(obj)
+        # Only output with a null can hide a non-finite float
+        if b"null" in data and _has_non_finite(obj):
+            return super().encode(obj)
+        return data
+
+    def encode_indent(self, obj: Any) -> bytes:
+        try:
+            data = self._orjson.dumps(obj, option=self._orjson.OPT_INDENT_2)
+        except TypeError:
+            return super().encode_indent(obj)
+        if b"null" in data and _has_non_finite(obj):
+            return super().encode_indent(obj)
+        return data
+
+class MsgspecCodec(JsonCodec):
+    """
+    msgspec backend (pip install msgspec), compact output.
+    Values msgspec rejects fall back to the stdlib, so do NaN/Infinity values (msgspec would write null).
+    """
+
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        import msgspec
+        self._msgspec = msgspec
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+
+    def decode(self, data: Union[bytes, str]) -> Any:
+        try:
+            return self._decoder.decode(data)
+        except self._msgspec.DecodeError:
+            return json.loads(data)
+
+    def encode(self, obj: Any) -> bytes:
+        data = self._encode(obj)
+        return super().encode(obj) if data is None else data
+
+    def encode_indent(self, obj: Any) -> bytes:
+        data = self._encode(obj)
+        return super().encode_indent(obj) if data is None else self._msgspec.json.format(data, indent=2)
+
+    def _encode(self, obj: Any) -> Optional[bytes]:
+        # None -> the stdlib has to encode obj
+        try:
+            data = self._encoder.encode(obj)
+        except (TypeError, OverflowError, self._msgspec.EncodeError):
+            return None
+        if b"null" in data and _has_non_finite(obj):
+            return None
+        return data
+
+class AutoCodec(JsonCodec):
+    """
+    Codec "auto": decodes with the fastest installed backend (orjson, msgspec, stdlib)
+    and encodes with the stdlib, so written files do not depend on the installed packages.
+    "orjson"/"msgspec" also encode with that backend (faster, compact output).
+    """
+
+    def __init__(self, decoder: JsonCodec) -> None:
+        self.name = f"auto:{decoder.name}"
+        self.decode = decoder.decode
+
+JSON_CODECS = {
+    "json": JsonCodec,
+    "orjson": OrjsonCodec,
+    "msgspec": MsgspecCodec,
+}
+
+# "auto" tries these in order
+_AUTO_CODECS = ("orjson", "msgspec", "json")
+
+@lru_cache(maxsize=None)
+def get_codec(name: str = DEFAULT_JSON_CODEC) -> JsonCodec:
+    """
+    Example:
+    - get_codec("auto") -> decodes with orjson if installed, else msgspec, else json, encodes with json
+    - get_codec("json") -> JsonCodec (stdlib)
+    """
+    if name == "auto":
+        for candidate in _AUTO_CODECS:
+            try:
+                return AutoCodec(JSON_CODECS[candidate]())
+            except ImportError:
+                continue
+
+    codec_class = JSON_CODECS.get(name)
+    if codec_class is None:
+        raise ValueError(f"Unknown JSON codec '{name}'. Allowed: auto, {', '.join(JSON_CODECS)}")
+    return codec_class()
+
+def _is_utf8(encoding: str) -> bool:
+    return codecs.lookup(encoding).name == "utf-8"
+
+def _open_json_read(path: str, encoding: str, compression: TYPE_COMPRESSION) -> IO:
+    # UTF-8 lines are passed to the codec as bytes, other encodings are decoded first
+    if _is_utf8(encoding):
+        return open_file(path, "rb", compression=compression)
+    return open_file(path, "r", encoding=encoding, compression=compression)
+
+class _JsonWriter:
+    """Binary file writer for codec output, transcodes if the encoding is not UTF-8."""
+
+    def __init__(
+        self,
+        path: str,
+        encoding: str,
+        compression: TYPE_COMPRESSION,
+        compression_level: Optional[int],
+        append: bool = False
+    ) -> None:
+        mode = "ab" if append else "wb"
+        self._file = open_file(path, mode, compression=compression, compression_level=compression_level)
+        self._transcode = None if _is_utf8(encoding) else encoding
+
+    def writelines(self, chunks: list[bytes]) -> None:
+        if self._transcode is not None:
+            chunks = [chunk.decode("utf-8").encode(self._transcode) for chunk in chunks]
+        self._file.writelines(chunks)
+
+    def __enter__(self) -> "_JsonWriter":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._file.close()
+#endregion
 
 #region YAML
+# libyaml (C) loader when PyYAML was built with it, several times faster on large configs
+YAML_LOADER = getattr(yaml, "CFullLoader", yaml.FullLoader)
+
 def read_yaml(
     path: str,
     encoding: str = DEFAULT_ENCODING
@@ -16,59 +300,477 @@ def read_yaml(
         raise FileNotFoundError(f"YAML config not found: {path}")
     
     with open(path, mode="r", encoding=encoding) as f:
-        return yaml.load(f, Loader=yaml.FullLoader)
+        return yaml.load(f, Loader=YAML_LOADER)
 #endregion
 
 #region CSV
+def _csv_bool(value: str) -> bool:
+    lowered = value.strip().lower()
+    if lowered in ("true", "1", "yes"):
+        return True
+    if lowered in ("false", "0", "no"):
+        return False
+    raise ValueError(f"not a boolean: {value!r}")
+
+# Column type name -> converter for non-empty values (empty values become None)
+CSV_TYPES = {
+    "str": str,
+    "int": int,
+    "float": float,
+    "bool": _csv_bool,
+}
+
+def infer_csv_types(rows: Iterable[list[str]], fieldnames: list[str]) -> dict[str, str]:
+    """
+    Most specific type per column that parses every non-empty sampled value:
+    int -> float -> bool -> str (columns without values stay str)
+
+    Example:
+    - rows = [["1", "2.5", "true"], ["2", "", "false"]]
+    - RESULT -> {"a": "int", "b": "float", "c": "bool"}
+    """
+    candidates = [["int", "float", "bool"] for _ in fieldnames]
+    seen = [False] * len(fieldnames)
+    for row in rows:
+        for index, value in enumerate(row[: len(fieldnames)]):
+            if not value:
+                continue
+            seen[index] = True
+            remaining = candidates[index]
+            for name in list(remaining):
+                try:
+                    CSV_TYPES[name](value)
+                except ValueError:
+                    remaining.remove(name)
+
+    return {
+        name: remaining[0] if seen[index] and remaining else "str"
+        for index, (name, remaining) in enumerate(zip(fieldnames, candidates))
+    }
+
+def _csv_converter(name: str, type_name: str) -> Callable[[Optional[str]], Any]:
+    try:
+        convert = CSV_TYPES[type_name]
+    except KeyError:
+        raise ValueError(f"Unknown CSV column type '{type_name}' for '{name}'. Allowed: {', '.join(CSV_TYPES)}") from None
+
+    def converter(value: Optional[str]) -> Any:
+        if not value:
+            return None
+        try:
+            return convert(value)
+        except ValueError:
+            raise ValueError(f"CSV column '{name}': can not convert {value!r} to {type_name}") from None
+
+    return converter
+
 def read_csv(
     path: str,
     encoding: str = DEFAULT_ENCODING,
-    delimiter: str = ","
+    delimiter: str = ",",
+    compression: TYPE_COMPRESSION = DEFAULT_COMPRESSION,
+    types: TYPE_CSV_TYPES = None,
+    infer_rows: int = DEFAULT_INFER_ROWS
 ) -> TYPE_DATA:
-    data = []
-    with open(path, mode="r", encoding=encoding, newline="") as f:
-        reader = csv.DictReader(f, delimiter=delimiter)
-        for row in reader:
-            data.append(dict(row))
-    return data
+    """types: see iter_csv"""
+    return collect(iter_csv(
+        path,
+        encoding=encoding,
+        delimiter=delimiter,
+        batch_size=DEFAULT_CHUNK_SIZE,
+        compression=compression,
+        types=types,
+        infer_rows=infer_rows
+    ))
 
 def write_csv(
     data: TYPE_DATA,
     path: str,
     encoding: str = DEFAULT_ENCODING,
-    delimiter: str = ","
+    delimiter: str = ",",
+    compression: TYPE_COMPRESSION = DEFAULT_COMPRESSION,
+    compression_level: Optional[int] = None,
+    append: bool = False,
+    fieldnames: Optional[list[str]] = None,
+    infer_rows: int = DEFAULT_INFER_ROWS,
+    extrasaction: TYPE_CSV_EXTRAS = "ignore"
 ) -> None:
-    if not data:
-        # Empty list -> empty file with no header
-        open(path, "w", encoding=encoding).close()
-        return
-    
-    # Reference header from first row
-    headers = list(data[0].keys())
+    """
+    append: rows are added to an existing file, the header is only written to a new/empty file
+    Header and extra keys: see write_csv_stream
+    """
+    drain(write_csv_stream(
+        iter_batches(data, DEFAULT_CHUNK_SIZE),
+        path,
+        encoding=encoding,
+        delimiter=delimiter,
+        compression=compression,
+        compression_level=compression_level,
+        append=append,
+        fieldnames=fieldnames,
+        infer_rows=infer_rows,
+        extrasaction=extrasaction
+    ))
+
+def iter_csv(
+    path: str,
+    encoding: str = DEFAULT_ENCODING,
+    delimiter: str = ",",
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    skip: int = 0,
+    drop_fields: Optional[Iterable[str]] = None,
+    compression: TYPE_COMPRESSION = DEFAULT_COMPRESSION,
+    types: TYPE_CSV_TYPES = None,
+    infer_rows: int = DEFAULT_INFER_ROWS
+) -> TYPE_STREAM:
+    """
+    Same records as read_csv, but lazy:
+    - skip: first N rows are skipped without building dicts
+    - drop_fields: columns that are never put into the records
+    - types: None -> every value is a string,
+      {"id": "int", "temp_c": "float", "active": "bool"} -> converted columns (others stay str),
+      "infer" -> types inferred from the first infer_rows rows (see infer_csv_types)
+      Empty values of converted columns become None.
+    """
+    with open_file(path, "r", encoding=encoding, newline="", compression=compression) as f:
+        rows = csv.reader(f, delimiter=delimiter)
+        fieldnames = next(rows, None)
+        if fieldnames is None:
+            return
+
+        # Blank rows are skipped like csv.DictReader does
+        rows = (row for row in rows if row)
+
+        if types == "infer":
+            # Sampled before skip, so the types do not depend on a pushed down limit
+            sample = list(islice(rows, infer_rows))
+            types = infer_csv_types(sample, fieldnames)
+            rows = chain(sample, rows)
+
+        if skip:
+            rows = islice(rows, skip, None)
+
+        converters = {
+            name: _csv_converter(name, type_name)
+            for name, type_name in (types or {}).items()
+            if type_name != "str"
+        }
+        yield from iter_batches(_csv_records(rows, fieldnames, set(drop_fields or ()), converters), batch_size)
+
+def _csv_records(
+    rows: Iterator[list[str]],
+    fieldnames: list[str],
+    drop_fields: set[str],
+    converters: Optional[dict[str, Callable[[Optional[str]], Any]]] = None
+) -> Iterator[TYPE_RECORD]:
+    """
+    Builds csv.DictReader compatible records
+    - short rows -> missing values are None
+    - long rows -> extra values as list under key None
+    - converters: column name -> function applied to the raw value
+    """
+    columns = [(index, name) for index, name in enumerate(fieldnames) if name not in drop_fields]
+    width = len(fieldnames)
+    typed = [(name, converters[name]) for _, name in columns if name in (converters or {})]
+
+    for row in rows:
+        if len(row) == width:
+            record = {name: row[index] for index, name in columns}
+        else:
+            record = {name: row[index] if index < len(row) else None for index, name in columns}
+            if len(row) > width:
+                record[None] = row[width:]
+        if typed:
+            for name, convert in typed:
+                record[name] = convert(record[name])
+        yield record
+
+def write_csv_stream(
+    stream: TYPE_STREAM,
+    path: str,
+    encoding: str = DEFAULT_ENCODING,
+    delimiter: str = ",",
+    compression: TYPE_COMPRESSION = DEFAULT_COMPRESSION,
+    compression_level: Optional[int] = None,
+    append: bool = False,
+    fieldnames: Optional[list[str]] = None,
+    infer_rows: int = DEFAULT_INFER_ROWS,
+    extrasaction: TYPE_CSV_EXTRAS = "ignore"
+) -> TYPE_STREAM:
+    """
+    Writes every batch while passing it through to the next step.
+
+    Header:
+    - appending to a file with content -> its existing header
+    - fieldnames given -> fieldnames
+    - otherwise -> keys of the first infer_rows records in order of appearance
+      (only these batches are buffered)
+    extrasaction: keys missing in the header are left out ("ignore") or raise ValueError ("raise")
+    """
+    mode = "a" if append else "w"
+    existing = append and _has_content(path)
+    if existing:
+        fieldnames = _read_csv_header(path, encoding, delimiter, compression)
+
+    stream = iter(stream)
+    prefix: list[TYPE_DATA] = []
+    if fieldnames is None:
+        seen: dict[str, None] = {}
+        sampled = 0
+        for batch in stream:
+            prefix.append(batch)
+            for record in batch[: infer_rows - sampled]:
+                seen.update(dict.fromkeys(key for key in record if key is not None))
+            sampled += len(batch)
+            if sampled >= infer_rows:
+                break
+        fieldnames = list(seen)
 
-    with open(path, mode="w", encoding=encoding, newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=headers, delimiter=delimiter)
-        writer.writeheader()
-        writer.writerows(data)
+    with open_file(path, mode, encoding=encoding, newline="", compression=compression, compression_level=compression_level) as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames, delimiter=delimiter, extrasaction=extrasaction)
+        if fieldnames and not existing:
+            writer.writeheader()
+        for batch in chain(prefix, stream):
+            writer.writerows(batch)
+            yield batch
+
+def _read_csv_header(path: str, encoding: str, delimiter: str, compression: TYPE_COMPRESSION) -> list[str]:
+    with open_file(path, "r", encoding=encoding, newline="", compression=compression) as f:
+        return next(csv.reader(f, delimiter=delimiter), [])
+
+def _has_content(path: str) -> bool:
+    return os.path.exists(path) and os.path.getsize(path) > 0
 #endregion
 
 #region JSON
-def read_json(path: str, encoding: str = DEFAULT_ENCODING):
-    with open(path, encoding=encoding) as f:
-        return json.load(f)
+def read_json(
+    path: str,
+    encoding: str = DEFAULT_ENCODING,
+    codec: str = DEFAULT_JSON_CODEC,
+    compression: TYPE_COMPRESSION = DEFAULT_COMPRESSION
+):
+    with _open_json_read(path, encoding, compression) as f:
+        return get_codec(codec).decode(f.read())
+
+def write_json(
+    data,
+    path: str,
+    encoding: str = DEFAULT_ENCODING,
+    codec: str = DEFAULT_JSON_CODEC,
+    compression: TYPE_COMPRESSION = DEFAULT_COMPRESSION,
+    compression_level: Optional[int] = None
+):
+    with _JsonWriter(path, encoding, compression, compression_level) as f:
+        f.writelines([get_codec(codec).encode_indent(data)])
 
-def write_json(data, path: str, encoding: str = DEFAULT_ENCODING):
-    with open(path, "w", encoding=encoding) as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+def write_json_stream(
+    stream: TYPE_STREAM,
+    path: str,
+    encoding: str = DEFAULT_ENCODING,
+    codec: str = DEFAULT_JSON_CODEC,
+    compression: TYPE_COMPRESSION = DEFAULT_COMPRESSION,
+    compression_level: Optional[int] = None
+) -> TYPE_STREAM:
+    """
+    Writes the records as one JSON array (same layout as write_json)
+    without holding the whole array in memory.
+    """
+    encode_indent = get_codec(codec).encode_indent
+
+    with _JsonWriter(path, encoding, compression, compression_level) as f:
+        first = True
+        for batch in stream:
+            chunks = []
+            for item in batch:
+                # indent=2 only adds newlines between tokens, strings keep "\n" escaped
+                chunks.append((b"[\n  " if first else b",\n  ") + encode_indent(item).replace(b"\n", b"\n  "))
+                first = False
+            f.writelines(chunks)
+            yield batch
+        f.writelines([b"[]" if first else b"\n]"])
 #endregion
 
 #region JSONL
-def read_jsonl(path: str, encoding: str = DEFAULT_ENCODING):
-    with open(path, encoding=encoding) as f:
-        return [json.loads(line) for line in f if line.strip()]
-
-def write_jsonl(data, path: str, encoding: str = DEFAULT_ENCODING):
-    with open(path, "w", encoding=encoding) as f:
-        for item in data:
-            f.write(json.dumps(item, ensure_ascii=False) + "\n")
-#endregion
\ No newline at end of file
+def read_jsonl(
+    path: str,
+    encoding: str = DEFAULT_ENCODING,
+    codec: str = DEFAULT_JSON_CODEC,
+    compression: TYPE_COMPRESSION = DEFAULT_COMPRESSION
+):
+    decode = get_codec(codec).decode
+    with _open_json_read(path, encoding, compression) as f:
+        return [decode(line) for line in f if line.strip()]
+
+def write_jsonl(
+    data,
+    path: str,
+    encoding: str = DEFAULT_ENCODING,
+    codec: str = DEFAULT_JSON_CODEC,
+    compression: TYPE_COMPRESSION = DEFAULT_COMPRESSION,
+    compression_level: Optional[int] = None,
+    append: bool = False
+):
+    encode = get_codec(codec).encode
+    with _JsonWriter(path, encoding, compression, compression_level, append) as f:
+        for batch in iter_batches(data, DEFAULT_BATCH_SIZE):
+            f.writelines([encode(item) + b"\n" for item in batch])
+
+def iter_jsonl(
+    path: str,
+    encoding: str = DEFAULT_ENCODING,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    skip: int = 0,
+    codec: str = DEFAULT_JSON_CODEC,
+    compression: TYPE_COMPRESSION = DEFAULT_COMPRESSION
+) -> TYPE_STREAM:
+    """
+    Same records as read_jsonl, but lazy:
+    - skip: first N records are skipped without decoding
+    """
+    decode = get_codec(codec).decode
+    with _open_json_read(path, encoding, compression) as f:
+        lines = (line for line in f if line.strip())
+        if skip:
+            lines = islice(lines, skip, None)
+        yield from iter_batches(map(decode, lines), batch_size)
+
+def write_jsonl_stream(
+    stream: TYPE_STREAM,
+    path: str,
+    encoding: str = DEFAULT_ENCODING,
+    codec: str = DEFAULT_JSON_CODEC,
+    compression: TYPE_COMPRESSION = DEFAULT_COMPRESSION,
+    compression_level: Optional[int] = None,
+    append: bool = False
+) -> TYPE_STREAM:
+    """Writes every batch with one writelines() while passing it through to the next step."""
+    encode = get_codec(codec).encode
+    with _JsonWriter(path, encoding, compression, compression_level, append) as f:
+        for batch in stream:
+            f.writelines([encode(item) + b"\n" for item in batch])
+            yield batch
+
+def iter_jsonl_tail(
+    path: str,
+    offset: int = 0,
+    encoding: str = DEFAULT_ENCODING,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    skip: int = 0,
+    codec: str = DEFAULT_JSON_CODEC
+) -> Iterator[tuple[TYPE_DATA, list[int], int]]:
+    """
+    Records of the complete lines after byte `offset` (uncompressed files only).
+    Yields (batch, ends, end): ends[i] = byte offset after the line of batch[i],
+    end = byte offset after the last line read (including blank/skipped lines).
+    A trailing line without newline (still being written) is left for the next read.
+    """
+    decode = get_codec(codec).decode
+    utf8 = _is_utf8(encoding)
+
+    with open(path, "rb") as f:
+        f.seek(offset)
+        batch: TYPE_DATA = []
+        ends: list[int] = []
+        position = offset
+
+        for line in f:
+            if not line.endswith(b"\n"):
+                break
+            position += len(line)
+            if not line.strip():
+                continue
+            if skip:
+                skip -= 1
+                continue
+
+            batch.append(decode(line if utf8 else line.decode(encoding)))
+            ends.append(position)
+            if len(batch) >= batch_size:
+                yield batch, ends, position
+                batch, ends = [], []
+
+        # Possibly empty: blank/skipped lines at the end still move the offset
+        yield batch, ends, position
+
+def iter_jsonl_parallel(
+    path: str,
+    encoding: str = DEFAULT_ENCODING,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    skip: int = 0,
+    codec: str = DEFAULT_JSON_CODEC,
+    workers: int = 2,
+    ordered: bool = True,
+    range_bytes: int = DEFAULT_RANGE_BYTES
+) -> TYPE_STREAM:
+    """
+    Same records as iter_jsonl, parsed in a process pool:
+    - the file is memory-mapped and split into byte ranges ending on a newline
+    - every worker decodes whole ranges, at most 2 * workers ranges are in flight
+    - ordered=False yields ranges as they finish (file order is not kept)
+    - skip: first N records in file order (requires ordered=True)
+    Compressed files can not be split, use iter_jsonl for them.
+    """
+    if workers < 1:
+        raise ValueError(f"workers must be >= 1, got: {workers}")
+    if skip and not ordered:
+        raise ValueError("skip requires ordered=True")
+    if resolve_compression(path) is not None:
+        raise ValueError(f"Compressed files can not be read in parallel: {path}")
+    if "\n".encode(encoding) != b"\n":
+        raise ValueError(f"Parallel JSONL reading needs an ASCII-compatible encoding, got: {encoding}")
+
+    pool = concurrent.futures.ProcessPoolExecutor(max_workers=workers)
+    try:
+        pending = deque()
+        results = _ordered_results(pending) if ordered else _unordered_results(pending)
+        ranges = _jsonl_ranges(path, range_bytes)
+
+        for start, end in ranges:
+            pending.append(pool.submit(_parse_jsonl_range, path, start, end, encoding, codec))
+            if len(pending) >= 2 * workers:
+                records = next(results)
+                if skip:
+                    records, skip = records[skip:], max(skip - len(records), 0)
+                yield from iter_batches(records, batch_size)
+
+        for records in results:
+            if skip:
+                records, skip = records[skip:], max(skip - len(records), 0)
+            yield from iter_batches(records, batch_size)
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+def _ordered_results(pending: deque) -> Iterator[TYPE_DATA]:
+    while pending:
+        yield pending.popleft().result()
+
+def _unordered_results(pending: deque) -> Iterator[TYPE_DATA]:
+    while pending:
+        done, _ = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+        for future in done:
+            pending.remove(future)
+            yield future.result()
+
+def _jsonl_ranges(path: str, range_bytes: int) -> Iterator[tuple[int, int]]:
+    """Byte ranges of about range_bytes, each one ends after a newline (or at EOF)."""
+    size = os.path.getsize(path)
+    if size == 0:
+        return
+
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        start = 0
+        while start < size:
+            newline = mm.find(b"\n", min(start + range_bytes, size) - 1)
+            end = size if newline == -1 else newline + 1
+            yield start, end
+            start = end
+
+def _parse_jsonl_range(path: str, start: int, end: int, encoding: str, codec: str) -> TYPE_DATA:
+    decode = get_codec(codec).decode
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        chunk = mm[start:end]
+
+    if not _is_utf8(encoding):
+        chunk = chunk.decode(encoding).encode("utf-8")
+    return [decode(line) for line in chunk.split(b"\n") if line.strip()]
+#endregion
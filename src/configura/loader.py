@@ -1,11 +1,15 @@
 import importlib
 import inspect
 
+from functools import lru_cache
 from typing import Any
 from configura.constants import *
 
+@lru_cache(maxsize=None)
 def load_class(type_string: str) -> type:
     """
+    Resolved classes are cached per type string.
+
     Example:
     - type_string: 'configura.plugins.builtin.transform_upper:TransformUpper'
     - module_path: 'configura.plugins.builtin.transform_upper'
@@ -35,13 +39,11 @@ def load_class(type_string: str) -> type:
 
     return dynamic_class
 
-def process_class(step: dict[str, Any], data: TYPE_DATA) -> TYPE_DATA:
+def build_step(step: dict[str, Any]) -> Any:
     """
-    Execute a single pipeline step
+    Resolve and instantiate a single pipeline step
 
-    If the type refers to a class:
-        instance = Class(**params)
-        return instance.process(data)
+    instance = Class(**params)
     """
     dynamic_class = load_class(step.get("type", ""))
     params = step.get("params") or {}
@@ -54,5 +56,17 @@ def process_class(step: dict[str, Any], data: TYPE_DATA) -> TYPE_DATA:
     if not hasattr(instance, "process"):
         raise AttributeError(f"{step.get('type', '<unknown>')} does not define a process(data) method")
 
+    return instance
+
+def process_class(step: dict[str, Any], data: TYPE_DATA) -> TYPE_DATA:
+    """
+    Execute a single pipeline step
+
+    If the type refers to a class:
+        instance = Class(**params)
+        return instance.process(data)
+    """
+    instance = build_step(step)
+
     result = instance.process(data)
     return result
\ No newline at end of file
@@ -0,0 +1,86 @@
+import concurrent.futures
+
+from collections import deque
+from typing import Any
+
+from configura.constants import *
+from configura.stream import collect, iter_batches, rebatch
+
+# Steps of the chain, set once per worker process by the pool initializer
+_WORKER_STEPS: list[Any] = []
+
+def _init_worker(steps: list[Any]) -> None:
+    global _WORKER_STEPS
+    # Chunks are unpickled copies owned by the worker
+    for instance in steps:
+        if hasattr(instance, "in_place"):
+            instance.in_place = True
+    _WORKER_STEPS = steps
+
+def _run_chunk(chunk: TYPE_DATA) -> TYPE_DATA:
+    for instance in _WORKER_STEPS:
+        chunk = instance.process(chunk)
+        if not chunk:
+            return []
+    return chunk
+
+class ParallelChain:
+    """
+    Runs a chain of parallel-safe steps on chunks of records in a process pool.
+
+    A step is parallel-safe if process(chunk) only depends on the records
+    of that chunk and has no side effects (parallel_safe = True).
+    Output order is the input order, at most 2 * workers chunks are in flight.
+    """
+
+    streamable = True
+    # Results are unpickled from the workers
+    owns_output = True
+
+    def __init__(
+        self,
+        steps: list[Any],
+        workers: int,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> None:
+        if workers < 1:
+            raise ValueError(f"workers must be >= 1, got: {workers}")
+
+        self.steps = steps
+        self.workers = workers
+        self.chunk_size = chunk_size
+
+    def __repr__(self) -> str:
+        names = " -> ".join(type(step).__name__ for step in self.steps)
+        return f"ParallelChain({names}, workers={self.workers})"
+
+    def process(self, data: TYPE_DATA) -> TYPE_DATA:
+        if data is None:
+            return []
+        return collect(self.process_stream(iter_batches(data, self.chunk_size)))
+
+    def process_stream(self, stream: TYPE_STREAM) -> TYPE_STREAM:
+        pool = concurrent.futures.ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_init_worker,
+            initargs=(self.steps,),
+        )
+        try:
+            pending = deque()
+            for chunk in rebatch(stream, self.chunk_size):
+                pending.append(pool.submit(_run_chunk, chunk))
+
+                if len(pending) >= 2 * self.workers:
+                    result = pending.popleft().result()
+                    if result:
+                        yield result
+
+            while pending:
+                result = pending.popleft().result()
+                if result:
+                    yield result
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+def is_parallel_safe(instance: Any) -> bool:
+    return bool(getattr(instance, "parallel_safe", False))
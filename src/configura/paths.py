@@ -0,0 +1,174 @@
+from functools import lru_cache
+from typing import Any, Callable, Iterable
+
+from configura.constants import TYPE_RECORD
+
+TYPE_GETTER = Callable[[TYPE_RECORD], Any]
+TYPE_SETTER = Callable[[TYPE_RECORD, Any], None]
+TYPE_DELETER = Callable[[TYPE_RECORD], None]
+
+class FieldPath:
+    """
+    A dotted field path compiled once into specialized accessors.
+
+    Semantics (same for every plugin):
+    - get: missing keys, non-dict parents and None values all return None
+    - set: only sets if every parent already exists as dict, otherwise no change
+    - delete: removes the last key if its parent exists, otherwise no change
+
+    Example:
+    - path = FieldPath("payload.temp_c")
+    - path.get({"payload": {"temp_c": 18.7}}) -> 18.7
+    - path.set(obj, 20.1) -> obj["payload"]["temp_c"] = 20.1
+    - path.delete(obj) -> removes "temp_c" from obj["payload"]
+    """
+
+    __slots__ = ("path", "keys", "get", "set", "delete")
+
+    def __init__(self, path: str) -> None:
+        if not path:
+            raise ValueError("Field path must not be empty")
+
+        self.path = path
+        self.keys: tuple[str, ...] = tuple(path.split("."))
+        self.get: TYPE_GETTER = _compile_getter(self.keys)
+        self.set: TYPE_SETTER = _compile_setter(self.keys)
+        self.delete: TYPE_DELETER = _compile_deleter(self.keys)
+
+    @property
+    def root(self) -> str:
+        return self.keys[0]
+
+    @property
+    def parents(self) -> tuple[str, ...]:
+        return self.keys[:-1]
+
+    def __repr__(self) -> str:
+        return f"FieldPath({self.path!r})"
+
+    def __reduce__(self):
+        # Compiled closures can not be pickled (process pools), recompile instead
+        return (compile_path, (self.path,))
+
+@lru_cache(maxsize=1024)
+def compile_path(path: str) -> FieldPath:
+    """Cached FieldPath, the same path string is compiled only once per process."""
+    return FieldPath(path)
+
+def _compile_getter(keys: tuple[str, ...]) -> TYPE_GETTER:
+    if len(keys) == 1:
+        (key,) = keys
+
+        def get(obj: TYPE_RECORD) -> Any:
+            return obj.get(key) if isinstance(obj, dict) else None
+
+    elif len(keys) == 2:
+        outer, inner = keys
+
+        def get(obj: TYPE_RECORD) -> Any:
+            if isinstance(obj, dict):
+                parent = obj.get(outer)
+                if isinstance(parent, dict):
+                    return parent.get(inner)
+            return None
+
+    else:
+        def get(obj: TYPE_RECORD) -> Any:
+            curr: Any = obj
+            for key in keys:
+                if not isinstance(curr, dict):
+                    return None
+                curr = curr.get(key)
+            return curr
+
+    return get
+
+def _compile_setter(keys: tuple[str, ...]) -> TYPE_SETTER:
+    if len(keys) == 1:
+        (key,) = keys
+
+        def set_(obj: TYPE_RECORD, value: Any) -> None:
+            if isinstance(obj, dict):
+                obj[key] = value
+
+    elif len(keys) == 2:
+        outer, inner = keys
+
+        def set_(obj: TYPE_RECORD, value: Any) -> None:
+            if isinstance(obj, dict):
+                parent = obj.get(outer)
+                if isinstance(parent, dict):
+                    parent[inner] = value
+
+    else:
+        parents, last = keys[:-1], keys[-1]
+
+        def set_(obj: TYPE_RECORD, value: Any) -> None:
+            curr: Any = obj
+            for key in parents:
+                if not isinstance(curr, dict):
+                    return
+                curr = curr.get(key)
+            if isinstance(curr, dict):
+                curr[last] = value
+
+    return set_
+
+def _compile_deleter(keys: tuple[str, ...]) -> TYPE_DELETER:
+    if len(keys) == 1:
+        (key,) = keys
+
+        def delete(obj: TYPE_RECORD) -> None:
+            if isinstance(obj, dict):
+                obj.pop(key, None)
+
+    elif len(keys) == 2:
+        outer, inner = keys
+
+        def delete(obj: TYPE_RECORD) -> None:
+            if isinstance(obj, dict):
+                parent = obj.get(outer)
+                if isinstance(parent, dict):
+                    parent.pop(inner, None)
+
+    else:
+        parents, last = keys[:-1], keys[-1]
+
+        def delete(obj: TYPE_RECORD) -> None:
+            curr: Any = obj
+            for key in parents:
+                if not isinstance(curr, dict):
+                    return
+                curr = curr.get(key)
+            if isinstance(curr, dict):
+                curr.pop(last, None)
+
+    return delete
+
+def compile_copier(paths: Iterable[FieldPath]) -> Callable[[TYPE_RECORD], TYPE_RECORD]:
+    """
+    Copy of a record that can be changed along the given paths without changing the original:
+    the record and every dict on the way to a path's last key are copied, all other values are shared.
+
+    Example:
+    - copy = compile_copier([compile_path("payload.temp_c")])
+    - copy(record) -> new record with a new 'payload' dict, 'tags' list shared
+    """
+    # Parent prefixes, shorter ones first so a parent is copied before its children
+    prefixes = sorted({path.keys[:depth] for path in paths for depth in range(1, len(path.keys))}, key=len)
+
+    def copy(record: TYPE_RECORD) -> TYPE_RECORD:
+        result = dict(record)
+        for prefix in prefixes:
+            parent: Any = result
+            for key in prefix[:-1]:
+                parent = parent.get(key)
+                if not isinstance(parent, dict):
+                    break
+            else:
+                child = parent.get(prefix[-1])
+                if isinstance(child, dict):
+                    parent[prefix[-1]] = dict(child)
+        return result
+
+    return copy
@@ -0,0 +1,250 @@
+import copy
+import os
+
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from configura.cache import build_cache
+from configura.columnar import as_records
+from configura.dag import Branch, build_branches, run_branches
+from configura.io import read_yaml, read_json
+from configura.loader import build_step
+from configura.planner import assign_ownership, plan
+from configura.profiling import Profiler
+from configura.stages import connect_stages
+from configura.stream import connect, drain, iter_batches
+from configura.constants import *
+
+class Pipeline:
+    """
+    A pipeline config compiled once: steps validated, classes resolved,
+    plugins instantiated and planned (pushdown, parallel chains).
+    run() can then be called many times without any parsing or imports.
+
+    Example:
+    - pipeline = Pipeline.from_config("data/configs/pipeline.yaml")
+    - pipeline.run() -> reads, transforms and writes like the CLI
+    - Pipeline({"pipeline": [filter_step]}).run(data=records) -> filtered records
+
+    A Pipeline object is not thread-safe, compile one per thread.
+    """
+
+    def __init__(
+        self,
+        config: dict[str, Any],
+        verbose: bool = False,
+        streaming: Optional[bool] = None,
+        workers: Optional[int] = None,
+        pipelined: Optional[bool] = None,
+    ) -> None:
+        if not isinstance(config, dict):
+            raise ValueError(f"Config root must be an object/dict, got: {type(config)}")
+
+        self.config = config
+        self.verbose = verbose
+
+        pipeline: list[dict] = config.get("pipeline", [])
+        if not isinstance(pipeline, list):
+            raise ValueError("Config key 'pipeline' must be a list.")
+        for step in pipeline:
+            if not isinstance(step, dict):
+                raise TypeError(f"Pipeline steps must be mappings (dict), got: {type(step)}")
+        self.specs = pipeline
+
+        # Streaming: CLI/argument overrides config key 'streaming'
+        if streaming is None:
+            streaming = bool(config.get("streaming", False))
+        self.streaming = streaming
+
+        # Pipelined: every step runs as its own stage (thread), implies streaming
+        if pipelined is None:
+            pipelined = bool(config.get("pipelined", False))
+        self.pipelined = pipelined
+        self.queue_size = config.get("queue_size", DEFAULT_QUEUE_SIZE)
+        if not isinstance(self.queue_size, int) or self.queue_size < 1:
+            raise ValueError(f"Config key 'queue_size' must be a positive integer, got: {self.queue_size}")
+
+        # Worker processes: CLI/argument overrides config key 'workers'
+        if workers is None:
+            workers = config.get("workers", 1)
+        if not isinstance(workers, int) or workers < 1:
+            raise ValueError(f"Config key 'workers' must be a positive integer, got: {workers}")
+        self.workers = workers
+
+        self.chunk_size = config.get("chunk_size", DEFAULT_CHUNK_SIZE)
+
+        # Record-wise steps in one loop (config key 'fusion', default on)
+        self.fusion = bool(config.get("fusion", True))
+
+        # Checkpoint cache (config key 'cache'): skip the longest unchanged step prefix
+        self.cache = build_cache(config.get("cache"))
+
+        # Named steps with 'input' form a DAG, a plain list is a single branch
+        self.branches = build_branches(self.specs)
+        if verbose and self.branches.children: print(f"[DEBUG] DAG:\n{self.branches.describe('  ')}")
+
+        # With a cache, the cached prefix can change between runs -> planned per run
+        self._planned = None if self.cache is not None else self._compile()
+
+    @classmethod
+    def from_config(
+        cls,
+        config_path: Union[str, Path],
+        verbose: bool = False,
+        streaming: Optional[bool] = None,
+        workers: Optional[int] = None,
+        pipelined: Optional[bool] = None,
+        cache_config: bool = True,
+    ) -> "Pipeline":
+        config = load_config(Path(config_path), cache=cache_config)
+        if verbose: print("[DEBUG] Loaded config:", config)
+        return cls(config, verbose=verbose, streaming=streaming, workers=workers, pipelined=pipelined)
+
+    def _compile(self, cached: bool = True) -> Branch:
+        root = self.branches
+        # Records passed to run() belong to the caller, readers create owned records
+        owned = {id(root): False}
+        for branch in root.walk():
+            steps = []
+            for step in branch.specs:
+                if self.verbose: print(f"[DEBUG] step: {step}")
+                steps.append(build_step(step))
+
+            # Checkpoints cover the shared prefix (the root branch)
+            if cached and self.cache is not None and branch is root:
+                steps = self.cache.apply(branch.specs, steps, verbose=self.verbose)
+            branch.steps = plan(steps, verbose=self.verbose, workers=self.workers, chunk_size=self.chunk_size, fusion=self.fusion)
+
+            # Every child branch receives its own copy (or the original) of the records
+            output_owned = assign_ownership(branch.steps, owned[id(branch)], verbose=self.verbose)
+            for child in branch.children:
+                owned[id(child)] = output_owned
+        return root
+
+    def planned(self, cached: bool = True) -> Branch:
+        """
+        Root branch with the planned steps (a linear pipeline has no child branches).
+        cached = False: without the checkpoint cache (e.g. for records passed to run()).
+        """
+        if self._planned is not None:
+            return self._planned
+        # Planning changes reader state (pushdown), so every run gets fresh instances
+        return self._compile(cached)
+
+    def planned_steps(self) -> list[Any]:
+        return self.planned().all_steps()
+
+    def run(self, data: Optional[TYPE_DATA] = None, profiler: Optional[Profiler] = None) -> Optional[TYPE_DATA]:
+        """
+        Runs the pipeline once.
+        - data: input records for the first step (readers ignore it),
+          the checkpoint cache is not used for them (fingerprints only cover config and files)
+        - profiler: collects per-step metrics of this run (see configura.profiling)
+        Returns the records after the last step, None in streaming/pipelined mode
+        and for DAG pipelines (see stream()).
+        DAG pipelines always run as streams, every branch gets its own copy of the records.
+        """
+        root = self.planned(cached=data is None)
+        steps = root.all_steps()
+        if self.verbose: print(f"[DEBUG] Executing {len(steps)} pipeline steps (streaming={self.streaming}, pipelined={self.pipelined}, workers={self.workers})...")
+
+        if profiler is not None:
+            steps = profiler.wrap(steps)
+            root = root.with_steps(iter(steps))
+            profiler.start(concurrent=self.pipelined or bool(root.children))
+
+        result = None
+        try:
+            if root.children:
+                run_branches(root, iter_batches(data) if data else None, self.queue_size, self.pipelined)
+            elif self.pipelined:
+                drain(connect_stages(steps, iter_batches(data) if data else None, self.queue_size))
+            elif self.streaming:
+                run_steps_streaming(steps, data)
+            else:
+                result = run_steps(steps, data)
+        finally:
+            if profiler is not None:
+                profiler.stop()
+
+        commit_steps(steps)
+
+        if self.verbose: print("[DONE] Pipeline finished")
+        return result
+
+    def stream(self, data: Optional[TYPE_DATA] = None) -> TYPE_STREAM:
+        """Runs a linear pipeline lazily and yields the output batches of the last step."""
+        root = self.planned(cached=data is None)
+        if root.children:
+            raise ValueError("stream() needs a linear pipeline, a DAG has several outputs (use run())")
+
+        stream = iter_batches(data) if data else None
+        if self.pipelined:
+            yield from connect_stages(root.steps, stream, self.queue_size)
+        else:
+            yield from connect(root.steps, stream)
+        commit_steps(root.steps)
+
+def run_steps(steps: list[Any], data: Optional[TYPE_DATA] = None) -> TYPE_DATA:
+    """Runs the planned steps one after another on the full dataset."""
+    data = data if data is not None else []
+    for instance in steps:
+        # Columnar batches are converted back to records for steps without columnar support
+        if not getattr(instance, "columnar", False):
+            data = as_records(data)
+        data = instance.process(data)
+    return as_records(data)
+
+def run_steps_streaming(steps: list[Any], data: Optional[TYPE_DATA] = None) -> None:
+    """
+    Runs the planned steps as one lazy chain of record batches.
+    Readers yield batches, streamable steps process them one by one,
+    writers write them incrementally. Steps that need the full dataset
+    (no process_stream, not streamable) get it materialized.
+    """
+    drain(connect(steps, iter_batches(data) if data else None))
+
+def commit_steps(steps: list[Any]) -> None:
+    """After a successful run: steps with commit() persist their state (e.g. ReadJsonl watermark)."""
+    for instance in steps:
+        commit = getattr(instance, "commit", None)
+        if commit is not None:
+            commit()
+
+# abspath -> (mtime_ns, size, config)
+_CONFIG_CACHE: dict[str, tuple[int, int, dict[str, Any]]] = {}
+
+def load_config(config_path: Path, cache: bool = True) -> dict[str, Any]:
+    """
+    Reads a YAML/JSON pipeline config.
+    cache: parsed configs are kept per process and reused until the file changes (mtime/size),
+    every call returns its own copy.
+    """
+    if not config_path.exists():
+        raise SystemExit(f"Config file not found: {config_path}")
+
+    if not config_path.is_file():
+        raise SystemExit(f"Config path is not a file: {config_path}")
+
+    key = os.path.abspath(config_path)
+    stat = config_path.stat()
+    cached = _CONFIG_CACHE.get(key) if cache else None
+    if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+        return copy.deepcopy(cached[2])
+
+    if config_path.suffix in (".yaml", ".yml"):
+        config = read_yaml(str(config_path))
+    elif config_path.suffix == ".json":
+        config = read_json(str(config_path))
+    else:
+        raise SystemExit(
+            f"Unsupported config format '{config_path.suffix}'. "
+            f"Allowed: .yaml, .yml, .json"
+        )
+
+    if not isinstance(config, dict):
+        raise ValueError(f"Config root must be an object/dict, got: {type(config)}")
+
+    if cache:
+        _CONFIG_CACHE[key] = (stat.st_mtime_ns, stat.st_size, copy.deepcopy(config))
+    return config
@@ -0,0 +1,257 @@
+from typing import Any, Callable, Iterable, Optional
+
+from configura.constants import *
+from configura.fusion import FusedSteps, is_fusable
+from configura.parallel import ParallelChain, is_parallel_safe
+
+class Pushdown:
+    """
+    Work pushed from the following steps into a reader.
+
+    Applied per record in this order, which is why some pushes are refused:
+        1. predicates (FilterByField)
+        2. projection (DropFields)
+        3. range [start:stop] over surviving records (Limit)
+    """
+
+    def __init__(self) -> None:
+        self.predicates: list[Callable[[TYPE_RECORD], bool]] = []
+        self.predicate_fields: set[str] = set()
+        self.drop_fields: set[str] = set()
+        self.start: int = 0
+        self.stop: Optional[int] = None
+        self.predicates_allowed = True
+
+    @property
+    def active(self) -> bool:
+        return bool(self.predicates or self.drop_fields or self.start or self.stop is not None)
+
+    @property
+    def limited(self) -> bool:
+        return self.start > 0 or self.stop is not None
+
+    @property
+    def decode_drop_fields(self) -> set[str]:
+        """Fields a reader may leave out while decoding (not needed by any predicate)."""
+        return self.drop_fields - self.predicate_fields
+
+    @property
+    def raw_skip(self) -> int:
+        """Records a reader may skip without decoding (only if nothing is filtered before)."""
+        return 0 if self.predicates else self.start
+
+    def add_predicate(self, predicate: Callable[[TYPE_RECORD], bool], *key_names: str) -> bool:
+        # A filter after a limit sees fewer records, a filter on a dropped field sees None
+        fields = {key_name.split(".", 1)[0] for key_name in key_names}
+        if not self.predicates_allowed or self.limited or fields & self.drop_fields:
+            return False
+        self.predicates.append(predicate)
+        self.predicate_fields.update(fields)
+        return True
+
+    def add_projection(self, fields: Iterable[str]) -> bool:
+        self.drop_fields.update(fields)
+        return True
+
+    def add_range(self, start: int, stop: Optional[int]) -> bool:
+        """
+        Example:
+        - existing range [10:50], pushed range [5:20]
+        - RESULT -> [15:30]
+        """
+        if start < 0 or (stop is not None and stop < 0):
+            return False
+
+        new_stop = None if stop is None else self.start + stop
+        if self.stop is not None:
+            new_stop = self.stop if new_stop is None else min(self.stop, new_stop)
+
+        self.start += start
+        self.stop = new_stop if new_stop is None else max(new_stop, self.start)
+        return True
+
+    def apply(self, stream: TYPE_STREAM, skipped: int = 0) -> TYPE_STREAM:
+        """
+        Applies the pushed steps to decoded batches.
+        skipped = records the reader already skipped without decoding.
+        """
+        predicates = self.predicates
+        drop_fields = self.drop_fields
+        start = self.start - skipped
+        stop = None if self.stop is None else self.stop - skipped
+
+        if stop is not None and stop <= start:
+            return
+
+        position = 0
+        for batch in stream:
+            if predicates:
+                batch = [item for item in batch if all(predicate(item) for predicate in predicates)]
+
+            if start > 0 or stop is not None:
+                lower = max(start - position, 0)
+                upper = len(batch) if stop is None else min(stop - position, len(batch))
+                position += len(batch)
+                batch = batch[lower:upper]
+
+            if drop_fields:
+                for item in batch:
+                    for field in drop_fields:
+                        item.pop(field, None)
+
+            if batch:
+                yield batch
+
+            if stop is not None and position >= stop:
+                return
+
+def plan(
+    steps: list[Any],
+    verbose: bool = False,
+    workers: int = 1,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    fusion: bool = True,
+) -> list[Any]:
+    """
+    Planning phase before execution
+
+    1. pushdown into readers (see pushdown())
+    2. fusion: consecutive record-wise steps run in one loop (see fuse())
+    3. workers > 1: consecutive parallel-safe steps run in a process pool (see parallelize())
+    """
+    steps = pushdown(steps, verbose=verbose)
+
+    if fusion:
+        steps = fuse(steps, verbose=verbose)
+
+    if workers > 1:
+        steps = parallelize(steps, workers, chunk_size=chunk_size, verbose=verbose)
+
+    return steps
+
+def assign_ownership(steps: list[Any], owned: bool = False, verbose: bool = False) -> bool:
+    """
+    Ownership contract: records are 'owned' while no one outside the running steps
+    holds a reference to them. Steps with an in_place attribute get in_place = True
+    if their input is owned and may then change the records instead of copying them.
+
+    - owns_output = True: the step outputs new records (readers, cache, process pool)
+    - preserves_ownership = True: the step passes records on without keeping references
+    - any other step ends ownership (it might keep or share the records)
+
+    owned: whether the input of the first step is owned (False for records of the caller).
+    Returns whether the output of the last step is owned.
+    Copies are only made where a stream fans out (see configura.dag).
+    """
+    for instance in steps:
+        if hasattr(instance, "in_place"):
+            instance.in_place = owned
+            if verbose and owned: print(f"[DEBUG] in place: {type(instance).__name__}")
+
+        if getattr(instance, "owns_output", False):
+            owned = True
+        elif not getattr(instance, "preserves_ownership", False):
+            owned = False
+    return owned
+
+def pushdown(steps: list[Any], verbose: bool = False) -> list[Any]:
+    """
+    Pushdown: steps directly following a reader are merged into it if
+    - the reader supports pushdown (supports_pushdown = True)
+    - the step can express itself as pushdown (push_into(pushdown) -> True)
+    The first step that can not be pushed ends the chain.
+
+    Example:
+    - ReadJsonl -> FilterByField -> DropFields -> Limit -> WriteJsonl
+    - RESULT -> ReadJsonl(filter, projection, limit) -> WriteJsonl
+    """
+    planned: list[Any] = []
+    index = 0
+
+    while index < len(steps):
+        instance = steps[index]
+        planned.append(instance)
+        index += 1
+
+        if not getattr(instance, "supports_pushdown", False):
+            continue
+
+        while index < len(steps):
+            candidate = steps[index]
+            push_into = getattr(candidate, "push_into", None)
+            if push_into is None or not push_into(instance.pushdown):
+                break
+
+            if verbose: print(f"[DEBUG] pushdown: {type(candidate).__name__} -> {type(instance).__name__}")
+            index += 1
+
+    return planned
+
+def fuse(steps: list[Any], verbose: bool = False) -> list[Any]:
+    """
+    Runs of two or more record-wise steps (see fusion.is_fusable) are merged into one FusedSteps.
+    Steps on columnar batches (reader with columnar = True) are not fused, they work vectorized.
+
+    Example:
+    - ReadJsonl -> Validate -> RenameFields -> DropFields -> FilterByField -> WriteJsonl
+    - RESULT -> ReadJsonl -> Validate -> FusedSteps(RenameFields -> DropFields -> FilterByField) -> WriteJsonl
+    """
+    planned: list[Any] = []
+    run: list[Any] = []
+    columnar = False
+
+    def flush() -> None:
+        if len(run) > 1:
+            fused = FusedSteps(list(run))
+            if verbose: print(f"[DEBUG] fused: {fused}")
+            planned.append(fused)
+        else:
+            planned.extend(run)
+        run.clear()
+
+    for instance in steps:
+        if is_fusable(instance) and not columnar:
+            run.append(instance)
+            continue
+
+        flush()
+        planned.append(instance)
+        # Batches stay columnar through columnar steps, all other steps get records
+        if hasattr(instance, "read_batches"):
+            columnar = bool(getattr(instance, "columnar", False))
+        elif not getattr(instance, "columnar", False):
+            columnar = False
+    flush()
+
+    return planned
+
+def parallelize(
+    steps: list[Any],
+    workers: int,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    verbose: bool = False,
+) -> list[Any]:
+    """
+    Example:
+    - ReadJsonl -> RenameFields -> DropFields -> Limit -> WriteJsonl
+    - RESULT -> ReadJsonl -> ParallelChain(RenameFields -> DropFields) -> Limit -> WriteJsonl
+    """
+    planned: list[Any] = []
+    chain: list[Any] = []
+
+    def flush() -> None:
+        if chain:
+            parallel = ParallelChain(list(chain), workers, chunk_size=chunk_size)
+            if verbose: print(f"[DEBUG] parallel: {parallel}")
+            planned.append(parallel)
+            chain.clear()
+
+    for instance in steps:
+        if is_parallel_safe(instance):
+            chain.append(instance)
+        else:
+            flush()
+            planned.append(instance)
+    flush()
+
+    return planned
@@ -0,0 +1,348 @@
+import os
+import pickle
+import shutil
+import tempfile
+
+from typing import IO, Any, Callable, Optional, Union
+from configura.columnar import ColumnBatch, aggregate_column, group_rows, group_sizes
+from configura.constants import DEFAULT_AGGREGATE_GROUPS, DEFAULT_BATCH_SIZE, TYPE_DATA, TYPE_RECORD, TYPE_STREAM
+from configura.paths import compile_path
+from configura.stream import iter_batches
+
+class _Op:
+    """
+    Incremental accumulator of one aggregation, the state is an immutable value.
+    None values are ignored by every op (count without field counts records).
+    """
+
+    initial: Any = None
+
+    @staticmethod
+    def update(state: Any, value: Any) -> Any:
+        raise NotImplementedError
+
+    @staticmethod
+    def merge(state: Any, later: Any) -> Any:
+        raise NotImplementedError
+
+    @staticmethod
+    def result(state: Any) -> Any:
+        return state
+
+class _Count(_Op):
+    initial = 0
+
+    @staticmethod
+    def update(state: int, value: Any) -> int:
+        return state if value is None else state + 1
+
+    @staticmethod
+    def merge(state: int, later: int) -> int:
+        return state + later
+
+class _Sum(_Op):
+    @staticmethod
+    def update(state: Any, value: Any) -> Any:
+        if value is None:
+            return state
+        return value if state is None else state + value
+
+    @staticmethod
+    def merge(state: Any, later: Any) -> Any:
+        if later is None:
+            return state
+        return later if state is None else state + later
+
+class _Min(_Op):
+    @staticmethod
+    def update(state: Any, value: Any) -> Any:
+        if value is None:
+            return state
+        return value if state is None or value < state else state
+
+    merge = update
+
+class _Max(_Op):
+    @staticmethod
+    def update(state: Any, value: Any) -> Any:
+        if value is None:
+            return state
+        return value if state is None or value > state else state
+
+    merge = update
+
+class _Mean(_Op):
+    initial = (0, 0)
+
+    @staticmethod
+    def update(state: tuple, value: Any) -> tuple:
+        return state if value is None else (state[0] + value, state[1] + 1)
+
+    @staticmethod
+    def merge(state: tuple, later: tuple) -> tuple:
+        return state[0] + later[0], state[1] + later[1]
+
+    @staticmethod
+    def result(state: tuple) -> Any:
+        return state[0] / state[1] if state[1] else None
+
+class _First(_Op):
+    @staticmethod
+    def update(state: Any, value: Any) -> Any:
+        return value if state is None else state
+
+    merge = update
+
+class _Last(_Op):
+    @staticmethod
+    def update(state: Any, value: Any) -> Any:
+        return state if value is None else value
+
+    merge = update
+
+OPS: dict[str, type[_Op]] = {
+    "count": _Count,
+    "sum":   _Sum,
+    "min":   _Min,
+    "max":   _Max,
+    "mean":  _Mean,
+    "first": _First,
+    "last":  _Last,
+}
+
+class Aggregate:
+    """
+    Single-pass hash aggregation: one output record per group of 'group_by' values.
+
+    aggregations: output field -> { op: count|sum|min|max|mean|first|last, field: <path> }
+      None/missing values are ignored, count without field counts records.
+    group_by values must be hashable scalars, lists/dicts raise a ValueError.
+
+    Memory grows with the number of groups, not records. Above max_groups the partial
+    states are spilled to spill_dir by hash partition and merged per partition at the end.
+    Columnar batches are aggregated vectorized (numpy) where the columns allow it.
+    Groups are emitted in order of first appearance (per partition if spilled).
+
+    Example:
+    - group_by = "payload.status"
+    - aggregations = {"n": {"op": "count"}, "temp": {"op": "mean", "field": "payload.temp_c"}}
+    - RESULT -> {"payload": {"status": "ok"}, "n": 12, "temp": 19.4}, ...
+    """
+
+    columnar = True
+    owns_output = True
+
+    def __init__(
+        self,
+        aggregations: dict[str, dict[str, str]],
+        group_by: Union[str, list[str], None] = None,
+        max_groups: int = DEFAULT_AGGREGATE_GROUPS,
+        spill_dir: Optional[str] = None,
+        partitions: int = 64,
+    ) -> None:
+        if isinstance(group_by, str):
+            group_by = [group_by]
+        if not aggregations:
+            raise ValueError("Aggregate needs at least one aggregation")
+        if max_groups < 1:
+            raise ValueError(f"max_groups must be >= 1, got: {max_groups}")
+        if partitions < 1:
+            raise ValueError(f"partitions must be >= 1, got: {partitions}")
+
+        self.aggregations = aggregations
+        self.group_by = group_by or []
+        self.max_groups = max_groups
+        self.spill_dir = spill_dir
+        self.partitions = partitions
+
+        self._op_names: list[str] = []
+        self._ops: list[type[_Op]] = []
+        self._fields: list[Optional[str]] = []
+        for name, spec in aggregations.items():
+            op = OPS.get(spec.get("op"))
+            if op is None:
+                raise ValueError(f"Aggregation '{name}': unknown op '{spec.get('op')}'. Allowed: {', '.join(OPS)}")
+            field = spec.get("field")
+            if field is None and op is not _Count:
+                raise ValueError(f"Aggregation '{name}': op '{spec['op']}' needs a 'field'")
+            self._op_names.append(spec["op"])
+            self._ops.append(op)
+            self._fields.append(field)
+
+        self._key_getters = [compile_path(path).get for path in self.group_by]
+        self._key = _compile_key(self._key_getters)
+        self._getters: list[Callable[[TYPE_RECORD], Any]] = [
+            compile_path(field).get if field else _present for field in self._fields
+        ]
+        self._initial = [op.initial for op in self._ops]
+        self._group_keys = [tuple(path.split(".")) for path in self.group_by]
+        self._output_keys = [tuple(name.split(".")) for name in aggregations]
+
+    def process(self, data: TYPE_DATA) -> TYPE_DATA:
+        if data is None:
+            return []
+
+        stream = iter([data]) if isinstance(data, ColumnBatch) else iter_batches(data, DEFAULT_BATCH_SIZE)
+        result: TYPE_DATA = []
+        for batch in self.process_stream(stream):
+            result.extend(batch)
+        return result
+
+    def process_stream(self, stream: TYPE_STREAM) -> TYPE_STREAM:
+        # New state per run
+        return _Aggregation(self).run(stream)
+
+    def update_records(self, groups: dict[tuple, list[Any]], batch: TYPE_DATA) -> None:
+        key_of = self._key
+        initial = self._initial
+        accumulators = list(zip(range(len(self._ops)), self._getters, [op.update for op in self._ops]))
+        for item in batch:
+            key = key_of(item)
+            try:
+                state = groups.get(key)
+            except TypeError:
+                raise self._unhashable(item) from None
+            if state is None:
+                state = groups[key] = list(initial)
+            for index, get, update in accumulators:
+                state[index] = update(state[index], get(item))
+
+    def _unhashable(self, item: TYPE_RECORD) -> ValueError:
+        for path, get in zip(self.group_by, self._key_getters):
+            value = get(item)
+            try:
+                hash(value)
+            except TypeError:
+                return ValueError(f"Aggregate group_by '{path}' has an unhashable value ({type(value).__name__}): {value!r}")
+        return ValueError(f"Aggregate group_by {self.group_by} has an unhashable value")
+
+    def update_columnar(self, groups: dict[tuple, list[Any]], batch: ColumnBatch) -> bool:
+        """Vectorized update, False if the batch needs the record path."""
+        if not batch.length:
+            return True
+
+        grouped = group_rows(batch, self.group_by)
+        if grouped is None:
+            return False
+        keys, inverse = grouped
+
+        partials = []
+        for name, op, field in zip(self._op_names, self._ops, self._fields):
+            if field is None:
+                partials.append(group_sizes(inverse, len(keys)))
+                continue
+            if batch.has_nested(field):
+                return False
+            column = batch.column(field)
+            if column is None:
+                partials.append([op.initial] * len(keys))
+                continue
+            partial = aggregate_column(column, name, inverse, len(keys))
+            if partial is None:
+                return False
+            partials.append(partial)
+
+        _merge_states(self._ops, groups, zip(keys, zip(*partials)))
+        return True
+
+    def output(self, key: tuple, state: list[Any]) -> TYPE_RECORD:
+        record: TYPE_RECORD = {}
+        for keys, value in zip(self._group_keys, key):
+            _assign(record, keys, value)
+        for keys, op, value in zip(self._output_keys, self._ops, state):
+            _assign(record, keys, op.result(value))
+        return record
+
+class _Aggregation:
+    """State of one run: groups in memory and the spilled partial states on disk."""
+
+    def __init__(self, plugin: Aggregate) -> None:
+        self.plugin = plugin
+        self.directory: Optional[str] = None
+        self.spilled: dict[int, IO[bytes]] = {}
+
+    def run(self, stream: TYPE_STREAM) -> TYPE_STREAM:
+        plugin = self.plugin
+        groups: dict[tuple, list[Any]] = {}
+        try:
+            for batch in stream:
+                if not (isinstance(batch, ColumnBatch) and plugin.update_columnar(groups, batch)):
+                    plugin.update_records(groups, list(batch))
+                if len(groups) > plugin.max_groups:
+                    self._spill(groups)
+                    groups = {}
+
+            if not self.spilled:
+                yield from iter_batches((plugin.output(key, state) for key, state in groups.items()), DEFAULT_BATCH_SIZE)
+                return
+
+            self._spill(groups)
+            for partition in sorted(self.spilled):
+                yield from iter_batches(self._drain_partition(partition), DEFAULT_BATCH_SIZE)
+        finally:
+            for f in self.spilled.values():
+                f.close()
+            if self.directory is not None:
+                shutil.rmtree(self.directory, ignore_errors=True)
+
+    def _spill(self, groups: dict[tuple, list[Any]]) -> None:
+        """Appends the partial states to their partition files, later spills are merged after earlier ones."""
+        if self.directory is None:
+            if self.plugin.spill_dir:
+                os.makedirs(self.plugin.spill_dir, exist_ok=True)
+            self.directory = tempfile.mkdtemp(prefix="configura_aggregate_", dir=self.plugin.spill_dir)
+
+        partitions = self.plugin.partitions
+        buckets: dict[int, list[tuple]] = {}
+        for key, state in groups.items():
+            buckets.setdefault(hash(key) % partitions, []).append((key, state))
+
+        for partition, items in buckets.items():
+            f = self.spilled.get(partition)
+            if f is None:
+                f = self.spilled[partition] = open(os.path.join(self.directory, f"{partition:03d}.states"), "wb")
+            pickle.dump(items, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def _drain_partition(self, partition: int) -> TYPE_STREAM:
+        f = self.spilled.pop(partition)
+        f.close()
+
+        groups: dict[tuple, list[Any]] = {}
+        with open(f.name, "rb") as f:
+            while True:
+                try:
+                    items = pickle.load(f)
+                except EOFError:
+                    break
+                _merge_states(self.plugin._ops, groups, items)
+
+        output = self.plugin.output
+        for key, state in groups.items():
+            yield output(key, state)
+
+def _merge_states(ops: list[type[_Op]], groups: dict[tuple, list[Any]], items: Any) -> None:
+    """Merges (key, states) pairs into groups, the pairs are later than the states in groups."""
+    merges = list(enumerate(op.merge for op in ops))
+    for key, states in items:
+        state = groups.get(key)
+        if state is None:
+            groups[key] = list(states)
+            continue
+        for index, merge in merges:
+            state[index] = merge(state[index], states[index])
+
+def _present(item: TYPE_RECORD) -> bool:
+    return True
+
+def _compile_key(getters: list[Callable[[TYPE_RECORD], Any]]) -> Callable[[TYPE_RECORD], tuple]:
+    if not getters:
+        return lambda item: ()
+    if len(getters) == 1:
+        (get,) = getters
+        return lambda item: (get(item),)
+    return lambda item: tuple(get(item) for get in getters)
+
+def _assign(record: TYPE_RECORD, keys: tuple[str, ...], value: Any) -> None:
+    for key in keys[:-1]:
+        record = record.setdefault(key, {})
+    record[keys[-1]] = value
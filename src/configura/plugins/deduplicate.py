@@ -0,0 +1,294 @@
+import hashlib
+import math
+import os
+import pickle
+import shutil
+import sys
+import tempfile
+
+from typing import IO, Iterator, Literal, Optional, Union
+from configura.constants import DEFAULT_BATCH_SIZE, DEFAULT_DEDUP_MEMORY_BYTES, TYPE_DATA, TYPE_RECORD, TYPE_STREAM
+from configura.paths import compile_path
+from configura.stream import iter_batches
+
+# Digest bytes per key, collisions are negligible even for billions of keys
+_DIGEST_SIZE = 16
+# Digest bytes per partition level: level n uses bytes [4n:4n + 4], spilled partitions are split again up to 4 levels
+_LEVEL_BYTES = 4
+_LEVELS = _DIGEST_SIZE // _LEVEL_BYTES
+_DIGEST_BYTES_SIZE = sys.getsizeof(b"\0" * _DIGEST_SIZE)
+
+def _partition(key: bytes, level: int, partitions: int) -> int:
+    start = level * _LEVEL_BYTES
+    return int.from_bytes(key[start : start + _LEVEL_BYTES], "little") % partitions
+
+def _set_memory(seen: set[bytes]) -> int:
+    # Set table plus the digest bytes objects
+    return sys.getsizeof(seen) + len(seen) * _DIGEST_BYTES_SIZE
+
+class Deduplicate:
+    """
+    Keeps the first record of every key (one or more field paths, e.g. ["id", "ts"]).
+    Keys are compared by the repr of their values, missing fields count as None.
+
+    mode = "exact": 16 byte digests of the keys in hash partitions.
+      Above memory_bytes the largest partition is spilled to spill_dir: its digests and all
+      later records of that partition go to disk and are deduplicated at the end of the stream
+      (one partition in memory at a time). These records are emitted last.
+      A spilled partition that outgrows memory_bytes is split again (on other digest bytes).
+    mode = "approximate": scalable Bloom filter, total false-positive rate <= error_rate
+      (a false positive drops a unique record). Memory grows with the distinct keys,
+      about 2 bytes per key for error_rate = 0.001, records keep their order.
+    """
+
+    preserves_ownership = True
+
+    def __init__(
+        self,
+        keys: Union[str, list[str]],
+        mode: Literal["exact", "approximate"] = "exact",
+        memory_bytes: int = DEFAULT_DEDUP_MEMORY_BYTES,
+        spill_dir: Optional[str] = None,
+        partitions: int = 64,
+        error_rate: float = 0.001,
+        capacity: int = 1_000_000,
+    ) -> None:
+        if isinstance(keys, str):
+            keys = [keys]
+        if not keys:
+            raise ValueError("Deduplicate needs at least one key")
+        if mode not in ("exact", "approximate"):
+            raise ValueError(f"Unknown mode '{mode}'. Allowed: exact, approximate")
+        if not 0 < error_rate < 1:
+            raise ValueError(f"error_rate must be between 0 and 1, got: {error_rate}")
+        if partitions < 1 or partitions > 256:
+            raise ValueError(f"partitions must be between 1 and 256, got: {partitions}")
+
+        self.keys = keys
+        self.mode = mode
+        self.memory_bytes = memory_bytes
+        self.spill_dir = spill_dir
+        self.partitions = partitions
+        self.error_rate = error_rate
+        self.capacity = capacity
+        self._paths = [compile_path(key) for key in keys]
+
+    def _digest(self, item: TYPE_RECORD) -> bytes:
+        values = tuple(path.get(item) for path in self._paths)
+        return hashlib.blake2b(repr(values).encode(), digest_size=_DIGEST_SIZE).digest()
+
+    def process(self, data: TYPE_DATA) -> TYPE_DATA:
+        if data is None:
+            return []
+
+        result: TYPE_DATA = []
+        for batch in self.process_stream(iter_batches(data, DEFAULT_BATCH_SIZE)):
+            result.extend(batch)
+        return result
+
+    def process_stream(self, stream: TYPE_STREAM) -> TYPE_STREAM:
+        # New state per run
+        if self.mode == "approximate":
+            return self._approximate(stream)
+        return _ExactDeduplicator(self).run(stream)
+
+    def _approximate(self, stream: TYPE_STREAM) -> TYPE_STREAM:
+        seen = ScalableBloomFilter(self.capacity, self.error_rate)
+        digest = self._digest
+        for batch in stream:
+            result = [item for item in batch if seen.add(digest(item))]
+            if result:
+                yield result
+
+class _ExactDeduplicator:
+    """State of one exact run: in-memory partitions and the spilled ones on disk."""
+
+    def __init__(self, plugin: Deduplicate) -> None:
+        self.plugin = plugin
+        self.partitions = plugin.partitions
+        self.sets: list[Optional[set[bytes]]] = [set() for _ in range(self.partitions)]
+        self.directory: Optional[str] = None
+        self.pending: dict[int, IO[bytes]] = {}
+
+    def run(self, stream: TYPE_STREAM) -> TYPE_STREAM:
+        digest = self.plugin._digest
+        sets = self.sets
+        partitions = self.partitions
+        try:
+            for batch in stream:
+                result = []
+                spilled: dict[int, TYPE_DATA] = {}
+                for item in batch:
+                    key = digest(item)
+                    partition = int.from_bytes(key[:_LEVEL_BYTES], "little") % partitions
+                    seen = sets[partition]
+                    if seen is None:
+                        spilled.setdefault(partition, []).append(item)
+                    elif key not in seen:
+                        seen.add(key)
+                        result.append(item)
+
+                for partition, items in spilled.items():
+                    pickle.dump(items, self.pending[partition], protocol=pickle.HIGHEST_PROTOCOL)
+                while self._memory() > self.plugin.memory_bytes and self._spill():
+                    pass
+                if result:
+                    yield result
+
+            for partition in sorted(self.pending):
+                self.pending.pop(partition).close()
+                name = f"{partition:03d}"
+                yield from iter_batches(self._drain(name, 0), DEFAULT_BATCH_SIZE)
+        finally:
+            for f in self.pending.values():
+                f.close()
+            if self.directory is not None:
+                shutil.rmtree(self.directory, ignore_errors=True)
+
+    def _memory(self) -> int:
+        return sum(_set_memory(seen) for seen in self.sets if seen is not None)
+
+    def _spill(self) -> bool:
+        """Moves the largest partition to disk, False if nothing is left to spill."""
+        largest = max((p for p in range(self.partitions) if self.sets[p]), key=lambda p: len(self.sets[p]), default=None)
+        if largest is None:
+            return False
+
+        if self.directory is None:
+            if self.plugin.spill_dir:
+                os.makedirs(self.plugin.spill_dir, exist_ok=True)
+            self.directory = tempfile.mkdtemp(prefix="configura_dedup_", dir=self.plugin.spill_dir)
+
+        name = f"{largest:03d}"
+        with open(self._path(name, "seen"), "wb") as f:
+            f.write(b"".join(self.sets[largest]))
+        self.sets[largest] = None
+        self.pending[largest] = open(self._path(name, "pending"), "wb")
+        return True
+
+    def _drain(self, name: str, level: int) -> Iterator[TYPE_RECORD]:
+        """New records of a spilled partition, split into sub-partitions once it outgrows memory_bytes."""
+        with open(self._path(name, "seen"), "rb") as f:
+            data = f.read()
+        seen = {data[i : i + _DIGEST_SIZE] for i in range(0, len(data), _DIGEST_SIZE)}
+        del data
+        os.remove(self._path(name, "seen"))
+
+        digest = self.plugin._digest
+        with open(self._path(name, "pending"), "rb") as f:
+            while True:
+                try:
+                    items = pickle.load(f)
+                except EOFError:
+                    break
+                for item in items:
+                    key = digest(item)
+                    if key not in seen:
+                        seen.add(key)
+                        yield item
+
+                if level + 1 < _LEVELS and _set_memory(seen) > self.plugin.memory_bytes:
+                    names = self._split(name, level + 1, seen, f)
+                    del seen
+                    for sub_name in names:
+                        yield from self._drain(sub_name, level + 1)
+                    break
+        os.remove(self._path(name, "pending"))
+
+    def _split(self, name: str, level: int, seen: set[bytes], pending: IO[bytes]) -> list[str]:
+        """Writes the digests and the remaining pending records of a partition into sub-partitions."""
+        partitions = self.partitions
+        names = [f"{name}_{sub:03d}" for sub in range(partitions)]
+
+        digests: list[list[bytes]] = [[] for _ in range(partitions)]
+        for key in seen:
+            digests[_partition(key, level, partitions)].append(key)
+        for sub_name, keys in zip(names, digests):
+            with open(self._path(sub_name, "seen"), "wb") as f:
+                f.write(b"".join(keys))
+        del digests
+
+        digest = self.plugin._digest
+        files = [open(self._path(sub_name, "pending"), "wb") for sub_name in names]
+        try:
+            while True:
+                try:
+                    items = pickle.load(pending)
+                except EOFError:
+                    break
+                parts: dict[int, TYPE_DATA] = {}
+                for item in items:
+                    parts.setdefault(_partition(digest(item), level, partitions), []).append(item)
+                for sub, part in parts.items():
+                    pickle.dump(part, files[sub], protocol=pickle.HIGHEST_PROTOCOL)
+        finally:
+            for f in files:
+                f.close()
+        return names
+
+    def _path(self, name: str, kind: str) -> str:
+        return os.path.join(self.directory, f"{name}.{kind}")
+
+class BloomFilter:
+    """Fixed size Bloom filter for up to capacity items at error_rate false positives."""
+
+    def __init__(self, capacity: int, error_rate: float) -> None:
+        self.capacity = max(capacity, 1)
+        self.size = max(int(-self.capacity * math.log(error_rate) / math.log(2) ** 2), 8)
+        self.hashes = max(round(self.size / self.capacity * math.log(2)), 1)
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+        self._rounds = range(self.hashes)
+
+    def __contains__(self, digest: bytes) -> bool:
+        bits = self.bits
+        for index in self._indexes(digest):
+            if not bits[index >> 3] & (1 << (index & 7)):
+                return False
+        return True
+
+    def add(self, digest: bytes) -> bool:
+        """Sets the bits of the digest, False if all of them were set already (probably seen)."""
+        bits = self.bits
+        new = False
+        for index in self._indexes(digest):
+            byte, mask = index >> 3, 1 << (index & 7)
+            if not bits[byte] & mask:
+                bits[byte] |= mask
+                new = True
+        if new:
+            self.count += 1
+        return new
+
+    def _indexes(self, digest: bytes) -> list[int]:
+        # Double hashing on the two halves of the digest
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        size = self.size
+        return [(h1 + i * h2) % size for i in self._rounds]
+
+class ScalableBloomFilter:
+    """
+    Bloom filters that grow with the number of items (Almeida et al., 2007):
+    a full filter is followed by one with twice the capacity and half the error rate,
+    so the total false-positive rate stays below error_rate.
+    """
+
+    def __init__(self, capacity: int, error_rate: float) -> None:
+        self.error_rate = error_rate
+        self.filters = [BloomFilter(capacity, error_rate / 2)]
+
+    def add(self, digest: bytes) -> bool:
+        """Adds the digest, False if it was (probably) seen before."""
+        filters = self.filters
+        for bloom in filters[:-1]:
+            if digest in bloom:
+                return False
+
+        current = filters[-1]
+        if current.count >= current.capacity:
+            if digest in current:
+                return False
+            current = BloomFilter(current.capacity * 2, self.error_rate / 2 ** (len(filters) + 1))
+            filters.append(current)
+        return current.add(digest)
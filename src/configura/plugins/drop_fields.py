@@ -1,27 +1,56 @@
-from configura.constants import TYPE_DATA
+from configura.columnar import ColumnBatch
+from configura.constants import TYPE_DATA, TYPE_RECORD
 
 class DropFields:
     """
     Removes the specified fields from every record.
+
+    in_place = True (set by the engine if no one else holds the records, see planner.assign_ownership)
+    removes the keys from the records, otherwise new records without them are built.
     """
 
+    streamable = True
+    parallel_safe = True
+    columnar = True
+    preserves_ownership = True
+
     def __init__(self, fields: list[str]) -> None:
         self.fields = fields
+        self.in_place = False
+        self._fields = frozenset(fields)
+
+    def push_into(self, pushdown) -> bool:
+        return pushdown.add_projection(self.fields)
 
     def process(self, data: TYPE_DATA) -> TYPE_DATA:
         if data is None:
             return []
 
-        result: TYPE_DATA = []
-
-        for row in data:
-            new_row = {}
-
-            # Copy all keys except the ones we want to drop
-            for key, value in row.items():
-                if key not in self.fields:
-                    new_row[key] = value
-
-            result.append(new_row)
-
-        return result
+        if isinstance(data, ColumnBatch):
+            return data.drop(self.fields)
+
+        fields = self._fields
+
+        if self.in_place:
+            for row in data:
+                for field in fields:
+                    row.pop(field, None)
+            return data
+
+        # Copy all keys except the ones we want to drop
+        return [{key: value for key, value in row.items() if key not in fields} for row in data]
+
+    def process_record(self, item: TYPE_RECORD) -> TYPE_RECORD:
+        fields = self._fields
+        if self.in_place:
+            for field in fields:
+                item.pop(field, None)
+            return item
+        return {key: value for key, value in item.items() if key not in fields}
+
+    def record_source(self, source) -> list[str]:
+        """Inlined into a fused loop (see configura.fusion)."""
+        fields = source.bind(self._fields)
+        if self.in_place:
+            return [f"for _f in {fields}:", "    r.pop(_f, None)"]
+        return [f"r = {{_k: _x for _k, _x in r.items() if _k not in {fields}}}"]
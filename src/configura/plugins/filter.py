@@ -0,0 +1,94 @@
+import time
+
+from typing import Optional
+from configura.constants import TYPE_DATA, TYPE_RECORD
+from configura.expressions import Expression
+
+# Records per batch sampled to measure the cost and selectivity of every AND term
+_SAMPLE_SIZE = 64
+# Batches between two samples after the first one
+_SAMPLE_EVERY = 32
+
+class Filter:
+    """
+    Keeps records that match a boolean expression (see expressions.Expression), e.g.
+    'payload.temp_c >= 20 and type in ["sensor_reading", "telemetry"] and id is not None'.
+
+    The expression is compiled once into a single list comprehension per batch.
+    adaptive = True: the top-level AND terms are reordered by their observed
+    cost / rejection rate (sampled every few batches), so cheap, selective terms run first.
+    """
+
+    streamable = True
+    parallel_safe = True
+    preserves_ownership = True
+
+    def __init__(self, expression: str, adaptive: bool = True) -> None:
+        self.expression = expression
+        self.adaptive = adaptive
+        self._expression = Expression(expression)
+        self._select = self._expression.select
+        self._batches = 0
+
+        terms = len(self._expression.conjuncts)
+        self.order = list(range(terms))
+        self._terms = [self._expression.conjunct_selector(i) for i in range(terms)] if terms > 1 else []
+        self._seconds = [0.0] * terms
+        self._passed = [0] * terms
+        self._sampled = 0
+
+    def __reduce__(self):
+        # Generated functions can not be pickled (process pools), compile again instead
+        return (Filter, (self.expression, self.adaptive))
+
+    def push_into(self, pushdown) -> bool:
+        return pushdown.add_predicate(self._expression.matches, *self._expression.fields)
+
+    def process_record(self, item: TYPE_RECORD) -> Optional[TYPE_RECORD]:
+        # Fused with other record-wise steps (see configura.fusion), the written term order is used
+        return item if self._expression.matches(item) else None
+
+    def record_source(self, source) -> list[str]:
+        """Inlined into a fused loop (see configura.fusion), a TypeError falls back to matches()."""
+        return [
+            "try:",
+            f"    if not {self._expression.source(source.bind)}:",
+            "        continue",
+            "except TypeError:",
+            f"    if not {source.bind(self._expression.matches)}(r):",
+            "        continue",
+        ]
+
+    def process(self, data: TYPE_DATA) -> TYPE_DATA:
+        if not data:
+            return []
+
+        if self.adaptive and self._terms and self._batches % _SAMPLE_EVERY == 0:
+            self._sample(data)
+        self._batches += 1
+        return self._select(data)
+
+    def _sample(self, data: TYPE_DATA) -> None:
+        step = max(len(data) // _SAMPLE_SIZE, 1)
+        sample = data[::step][:_SAMPLE_SIZE]
+        if not self._sampled:
+            # Untimed first run, the first term would otherwise pay for cold caches
+            for select in self._terms:
+                select(sample)
+        self._sampled += len(sample)
+
+        for index, select in enumerate(self._terms):
+            started = time.perf_counter()
+            passed = len(select(sample))
+            self._seconds[index] += time.perf_counter() - started
+            self._passed[index] += passed
+
+        # Expected cost per rejected record, lowest first (terms that reject nothing last)
+        def rank(index: int) -> float:
+            rejected = self._sampled - self._passed[index]
+            return self._seconds[index] / rejected if rejected else float("inf")
+
+        order = sorted(range(len(self._terms)), key=rank)
+        if order != self.order:
+            self.order = order
+            self._select = self._expression.selector(order)
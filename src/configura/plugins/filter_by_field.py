@@ -1,56 +1,134 @@
-from typing import Any
-from configura.constants import TYPE_DATA
+import operator
+
+from typing import Any, Optional
+from configura.columnar import ColumnBatch, as_records, filter_column
+from configura.constants import TYPE_DATA, TYPE_RECORD
+from configura.dlq import DeadLetterSink, get_sink
+from configura.paths import compile_path
+
+OPERATORS = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    ">":  operator.gt,
+    "<":  operator.lt,
+    ">=": operator.ge,
+    "<=": operator.le,
+}
 
 class FilterByField:
+    """
+    Keeps records where '<key_name> <operator> <value>' is true.
+
+    Records whose value can not be compared (TypeError) are skipped,
+    raise with fail_on_type_error, or go to a DLQ file if dlq_dir is set
+    (rotation with dlq_max_bytes / dlq_max_records, see configura.dlq).
+    The DLQ file stays open during the run, commit() closes it.
+    """
+
+    streamable = True
+    columnar = True
+    preserves_ownership = True
+
     def __init__(
             self,
             key_name: str,
             operator: str,
             value: Any,
-            fail_on_type_error: bool = False
+            fail_on_type_error: bool = False,
+            dlq_dir: Optional[str] = None,
+            dlq_name: str = "dlq_output",
+            dlq_max_bytes: Optional[int] = None,
+            dlq_max_records: Optional[int] = None
     ) -> None:
         self.key_name = key_name
         self.operator = operator
         self.value = value
         self.fail_on_type_error = fail_on_type_error
-        
-    @staticmethod
-    def _get_by_path(obj: dict[str, Any], path: list[str]) -> Any:
-        """
-        Example:
-        - obj = {"payload": {"temp_c": 18.7}}
-        - path = ["payload", "temp_c"]
-        - RETURN -> value of "temp_c" -> 18.7
-        """
-        curr = obj
-        for key in path:
-            if not isinstance(curr, dict) or key not in curr:
-                return None
-            curr = curr[key]
-        return curr
+        self.dlq_dir = dlq_dir
+        self.dlq_name = dlq_name
+        self.dlq_max_bytes = dlq_max_bytes
+        self.dlq_max_records = dlq_max_records
+        self._key_path = compile_path(key_name)
+        # Acquired shared DLQ sink of the current run
+        self._dlq: Optional[DeadLetterSink] = None
+
+    @property
+    def side_effects(self) -> bool:
+        return self.dlq_dir is not None
+
+    @property
+    def parallel_safe(self) -> bool:
+        return not self.side_effects
+
+    @property
+    def fusable(self) -> bool:
+        # Rejected records go to the DLQ batch by batch
+        return not self.side_effects
+
+    def _predicate(self):
+        predicate = OPERATORS.get(self.operator)
+        if predicate is None:
+            raise ValueError(f"Unsupported operator: {self.operator}")
+        return predicate
+
+    def matches(self, item: TYPE_RECORD) -> bool:
+        """Single record check, used when the filter is pushed into a reader."""
+        field_value = self._key_path.get(item)
+
+        # Path does not exist -> skip
+        if field_value is None:
+            return False
+
+        try:
+            return bool(self._predicate()(field_value, self.value))
+        except TypeError:
+            if self.fail_on_type_error:
+                raise
+            return False
+
+    def process_record(self, item: TYPE_RECORD) -> Optional[TYPE_RECORD]:
+        return item if self.matches(item) else None
+
+    def record_source(self, source) -> list[str]:
+        """Inlined into a fused loop (see configura.fusion), same rules as matches()."""
+        predicate = source.bind(self._predicate())
+        return [
+            f"_v = {source.bind(self._key_path.get)}(r)",
+            "if _v is None:",
+            "    continue",
+            "try:",
+            f"    if not {predicate}(_v, {source.bind(self.value)}):",
+            "        continue",
+            "except TypeError:",
+            "    raise" if self.fail_on_type_error else "    continue",
+        ]
+
+    def push_into(self, pushdown) -> bool:
+        self._predicate() # fail at planning time for unknown operators
+        if self.side_effects:
+            return False
+        return pushdown.add_predicate(self.matches, self.key_name)
 
     def process(self, data: TYPE_DATA) -> TYPE_DATA:
         if data is None:
             return []
-        
-        op_mapping = {
-            "==": lambda a, b: a == b,
-            "!=": lambda a, b: a != b,
-            ">":  lambda a, b: a > b,
-            "<":  lambda a, b: a < b,
-            ">=": lambda a, b: a >= b,
-            "<=": lambda a, b: a <= b,
-        }
-
-        predicate = op_mapping.get(self.operator)
-        if predicate is None:
-            raise ValueError(f"Unsupported operator: {self.operator}")
+
+        predicate = self._predicate()
+
+        if isinstance(data, ColumnBatch) and not self.side_effects:
+            result = filter_column(data, self.key_name, predicate, self.value, self.fail_on_type_error)
+            if result is not None:
+                return result
+
+        # Nested dict path or DLQ -> compare per record
+        data = as_records(data)
 
         result: TYPE_DATA = []
-        key_path = self.key_name.split(".")
+        rejected: TYPE_DATA = []
+        get_value = self._key_path.get
 
         for item in data:
-            field_value = self._get_by_path(item, key_path)
+            field_value = get_value(item)
 
             # Pfad existiert nicht → skip
             if field_value is None:
@@ -60,10 +138,27 @@ class FilterByField:
             try:
                 if predicate(field_value, self.value):
                     result.append(item)
-            except TypeError:
+            except TypeError as exc:
                 if self.fail_on_type_error:
                     # explode hard to see the error
                     raise
+                if self.dlq_dir is not None:
+                    rejected.append({"record": item, "errors": [str(exc)]})
                 # Otherwise: just skip this row
                 continue
+
+        if rejected:
+            if self._dlq is None:
+                self._dlq = get_sink(
+                    self.dlq_dir, self.dlq_name, max_bytes=self.dlq_max_bytes, max_records=self.dlq_max_records
+                ).acquire()
+            self._dlq.write(rejected)
+            self._dlq.flush()
+
         return result
+
+    def commit(self) -> None:
+        """Closes the DLQ file after the run."""
+        if self._dlq is not None:
+            self._dlq.close()
+            self._dlq = None
@@ -1,5 +1,6 @@
 from typing import Optional
-from configura.constants import TYPE_DATA
+from configura.constants import TYPE_DATA, TYPE_STREAM
+from configura.stream import collect, drain
 
 class Limit:
     """
@@ -11,8 +12,13 @@ class Limit:
         - If start or end is provided → use range slicing
         - Else if count is provided → take first count
         - Else → error
+
+    Works on lists and columnar batches (only slicing is used).
     """
 
+    columnar = True
+    preserves_ownership = True
+
     def __init__(
         self,
         count: Optional[int] = None,
@@ -23,6 +29,10 @@ class Limit:
         self.start = start
         self.end = end
 
+        # Set by the engine if upstream steps have side effects (writers, DLQ),
+        # then the rest of the stream is still consumed after the end is reached
+        self.drain_input = False
+
         if self.start is not None or self.end is not None:
             # Valid range mode
             if self.start is None or self.end is None:
@@ -32,6 +42,11 @@ class Limit:
             if self.count is None:
                 raise ValueError("Either 'count' or ('start' and 'end') must be provided.")
 
+    def push_into(self, pushdown) -> bool:
+        if self.start is not None and self.end is not None:
+            return pushdown.add_range(self.start, self.end)
+        return pushdown.add_range(0, self.count)
+
     def process(self, data: TYPE_DATA) -> TYPE_DATA:
         if data is None:
             return []
@@ -42,3 +57,35 @@ class Limit:
 
         # Count mode
         return data[: self.count]
+
+    def process_stream(self, stream: TYPE_STREAM) -> TYPE_STREAM:
+        """
+        Yields only the selected records and stops pulling
+        from upstream (e.g. the reader) as soon as the end is reached.
+        """
+        if self.start is not None and self.end is not None:
+            start, end = self.start, self.end
+        else:
+            start, end = 0, self.count
+
+        # Negative indices are relative to the end -> needs the full dataset
+        if start < 0 or end < 0:
+            result = self.process(collect(stream))
+            if result:
+                yield result
+            return
+
+        position = 0
+        if end > 0:
+            for batch in stream:
+                lower = max(start - position, 0)
+                upper = min(end - position, len(batch))
+                if lower < upper:
+                    yield batch[lower:upper]
+
+                position += len(batch)
+                if position >= end:
+                    break
+
+        if self.drain_input:
+            drain(stream)
@@ -1,98 +1,68 @@
-from configura.constants import TYPE_DATA
-from typing import Any
+from configura.constants import TYPE_DATA, TYPE_RECORD
+from configura.paths import compile_copier, compile_path
 
 class RenameFields:
-    def __init__(self, mapping: dict[str, str]) -> None:
-        self.mapping = mapping
-
-    @staticmethod
-    def _get_by_path(obj: dict[str, Any], path: list[str]) -> Any:
-        """
-        Example:
-        - obj = {"payload": {"temp_c": 18.7}}
-        - path = ["payload", "temp_c"]
-        - RETURN -> value of "temp_c" -> 18.7
-        """
-        curr: Any = obj
-        for key in path:
-            if not isinstance(curr, dict):
-                return None
-            if key not in curr:
-                return None
-            curr = curr[key]
-        return curr
+    """
+    Moves values from old to new field paths.
 
-    @staticmethod
-    def _delete_by_path(obj: dict[str, Any], path: list[str]) -> None:
-        """
-        Example:
-        - obj = {"payload": {"temp_c": 18.7}}
-        - path = ["payload", "temp_c"]
-        - DELETE -> "temp_c" in "payload
-        """
-        if not path:
-            return
+    in_place = True (set by the engine if no one else holds the records, see planner.assign_ownership)
+    renames inside the records, otherwise every record is copied along the renamed paths.
+    """
 
-        curr: Any = obj
-        for key in path[:-1]:
-            if not isinstance(curr, dict):
-                return
-            if key not in curr:
-                return
-            curr = curr[key]
+    streamable = True
+    parallel_safe = True
+    preserves_ownership = True
 
-        if isinstance(curr, dict):
-            curr.pop(path[-1], None)
-
-    @staticmethod
-    def _set_by_path(obj: dict[str, Any], path: list[str], value: Any) -> None:
-        """
-        Example:
-        - obj = {"payload": {"status": "ok"}}
-        - path = ["payload", "temp_celsius"]
-        - value = 18.7
-        - SET -> obj["payload"]["temp_celsius"] = value (18.7)
-        - RESULT -> {"payload": {"status": "ok", "temp_celsius": 18.7}}
-        """
-        if not path:
-            return
-
-        curr: Any = obj
-        for key in path[:-1]:
-            if not isinstance(curr.get(key), dict):
-                return  # key does not exist -> no change
-            curr = curr[key]
+    def __init__(self, mapping: dict[str, str]) -> None:
+        self.mapping = mapping
+        self.in_place = False
 
-        if isinstance(curr, dict):
-            curr[path[-1]] = value
+        # Compile once: (old path, new path) for every mapping entry
+        self._paths = [
+            (compile_path(old_key), compile_path(new_key))
+            for old_key, new_key in mapping.items()
+        ]
+        self._copy = compile_copier(path for pair in self._paths for path in pair)
 
     def process(self, data: TYPE_DATA) -> TYPE_DATA:
         if data is None:
             return []
 
-        result: TYPE_DATA = []
-
-        for item in data:
-            copied_item: dict[str, Any] = dict(item) # Shallow Copy
-
-            # str1, str2 in dict[str1, str2]
-            for old_key, new_key in self.mapping.items():
+        result = data if self.in_place else [self._copy(item) for item in data]
 
-                #key -> payload.temp_C
-                old_path: list[str] = old_key.split(".")
-                new_path: list[str] = new_key.split(".")
-
-                # 1. Wert über Pfad suchen
-                value = self._get_by_path(copied_item, old_path)
+        for item in result:
+            for old_path, new_path in self._paths:
+                # 1. Find value by path
+                value = old_path.get(item)
                 if value is None:
                     continue # does not exist -> skip
 
                 # 2. Delete old key
-                self._delete_by_path(copied_item, old_path)
+                old_path.delete(item)
 
                 # 3. Set new key
-                self._set_by_path(copied_item, new_path, value)
-
-            result.append(copied_item)
+                new_path.set(item, value)
 
         return result
+
+    def process_record(self, item: TYPE_RECORD) -> TYPE_RECORD:
+        if not self.in_place:
+            item = self._copy(item)
+        for old_path, new_path in self._paths:
+            value = old_path.get(item)
+            if value is not None:
+                old_path.delete(item)
+                new_path.set(item, value)
+        return item
+
+    def record_source(self, source) -> list[str]:
+        """Inlined into a fused loop (see configura.fusion)."""
+        lines = [] if self.in_place else [f"r = {source.bind(self._copy)}(r)"]
+        for old_path, new_path in self._paths:
+            lines += [
+                f"_v = {source.bind(old_path.get)}(r)",
+                "if _v is not None:",
+                f"    {source.bind(old_path.delete)}(r)",
+                f"    {source.bind(new_path.set)}(r, _v)",
+            ]
+        return lines
@@ -0,0 +1,184 @@
+import heapq
+import os
+import pickle
+import shutil
+import sys
+import tempfile
+
+from typing import Any, Callable, Iterator, Optional, Union
+from configura.constants import DEFAULT_BATCH_SIZE, DEFAULT_SORT_MEMORY_BYTES, TYPE_DATA, TYPE_RECORD, TYPE_STREAM
+from configura.paths import compile_path
+from configura.stream import iter_batches
+
+# Records per pickled chunk of a run, one chunk per run is in memory while merging
+_RUN_CHUNK = 1000
+
+class Sort:
+    """
+    Sorts records by one or more field paths, stable, missing/None values last.
+    - descending: one bool for all keys or one per key
+    - values of a key that can not be compared (e.g. str and int) raise a ValueError
+
+    Streaming: records are buffered until their estimated size exceeds memory_bytes,
+    then the buffer is sorted and written to spill_dir as a run.
+    The output is a lazy k-way merge of all runs (heapq.merge), so a following
+    Limit stops the merge early. Data that fits into memory_bytes is sorted in memory.
+    """
+
+    preserves_ownership = True
+
+    def __init__(
+        self,
+        keys: Union[str, list[str]],
+        descending: Union[bool, list[bool]] = False,
+        memory_bytes: int = DEFAULT_SORT_MEMORY_BYTES,
+        spill_dir: Optional[str] = None,
+    ) -> None:
+        if isinstance(keys, str):
+            keys = [keys]
+        if not keys:
+            raise ValueError("Sort needs at least one key")
+        if isinstance(descending, bool):
+            descending = [descending] * len(keys)
+        if len(descending) != len(keys):
+            raise ValueError(f"descending needs one value per key, got {len(descending)} for {len(keys)} keys")
+
+        self.keys = keys
+        self.descending = descending
+        self.memory_bytes = memory_bytes
+        self.spill_dir = spill_dir
+
+        # One direction -> plain keys and reverse=True, mixed -> wrapped descending values
+        self._reverse = all(descending)
+        mixed = any(descending) and not self._reverse
+        self._paths = [compile_path(key) for key in keys]
+        self._key = _compile_key(self._paths, descending if mixed else [False] * len(keys), self._reverse)
+
+    def process(self, data: TYPE_DATA) -> TYPE_DATA:
+        if data is None:
+            return []
+        return self._sort(list(data))
+
+    def process_stream(self, stream: TYPE_STREAM) -> TYPE_STREAM:
+        buffer: TYPE_DATA = []
+        buffer_bytes = 0
+        runs: list[str] = []
+        directory: Optional[str] = None
+
+        try:
+            for batch in stream:
+                buffer.extend(batch)
+                buffer_bytes += _estimate_size(batch)
+                if buffer_bytes > self.memory_bytes:
+                    if directory is None:
+                        if self.spill_dir:
+                            os.makedirs(self.spill_dir, exist_ok=True)
+                        directory = tempfile.mkdtemp(prefix="configura_sort_", dir=self.spill_dir)
+                    runs.append(self._write_run(buffer, os.path.join(directory, f"{len(runs):05d}.run")))
+                    buffer, buffer_bytes = [], 0
+
+            self._sort(buffer)
+            if not runs:
+                yield from iter_batches(buffer, DEFAULT_BATCH_SIZE)
+                return
+
+            # heapq.merge is stable: ties keep the order of the runs, which is the input order
+            merged = heapq.merge(*(_read_run(path) for path in runs), buffer, key=self._key, reverse=self._reverse)
+            try:
+                yield from iter_batches(merged, DEFAULT_BATCH_SIZE)
+            except TypeError as exc:
+                # Every run was sortable on its own, the types differ between runs
+                raise self._type_error([], exc) from exc
+        finally:
+            if directory is not None:
+                shutil.rmtree(directory, ignore_errors=True)
+
+    def _sort(self, records: TYPE_DATA) -> TYPE_DATA:
+        try:
+            records.sort(key=self._key, reverse=self._reverse)
+        except TypeError as exc:
+            raise self._type_error(records, exc) from exc
+        return records
+
+    def _type_error(self, records: TYPE_DATA, exc: TypeError) -> ValueError:
+        # Names the first key whose values can not be compared with each other
+        for key, path in zip(self.keys, self._paths):
+            values = [value for value in map(path.get, records) if value is not None]
+            try:
+                values.sort()
+            except TypeError:
+                types = sorted({type(value).__name__ for value in values})
+                return ValueError(f"Sort key '{key}' has values that can not be compared ({', '.join(types)}): {exc}")
+        return ValueError(f"Sort keys {self.keys} have values that can not be compared: {exc}")
+
+    def _write_run(self, buffer: TYPE_DATA, path: str) -> str:
+        self._sort(buffer)
+        with open(path, "wb") as f:
+            for start in range(0, len(buffer), _RUN_CHUNK):
+                pickle.dump(buffer[start : start + _RUN_CHUNK], f, protocol=pickle.HIGHEST_PROTOCOL)
+        return path
+
+def _read_run(path: str) -> Iterator[TYPE_RECORD]:
+    with open(path, "rb") as f:
+        while True:
+            try:
+                chunk = pickle.load(f)
+            except EOFError:
+                return
+            yield from chunk
+
+class _Descending:
+    """Inverts the order of a value, for descending keys mixed with ascending ones."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any) -> None:
+        self.value = value
+
+    def __lt__(self, other: "_Descending") -> bool:
+        return other.value < self.value
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _Descending) and self.value == other.value
+
+def _compile_key(paths: list, wrap: list[bool], reverse: bool) -> Callable[[TYPE_RECORD], Any]:
+    # None/missing last: (True, None) sorts after (False, value), with reverse=True the flag is inverted
+    missing = not reverse
+    if len(paths) == 1 and not wrap[0]:
+        get = paths[0].get
+
+        def key(item: TYPE_RECORD) -> Any:
+            value = get(item)
+            return (value is None) == missing, value
+
+        return key
+
+    getters = [(path.get, descending) for path, descending in zip(paths, wrap)]
+
+    def key(item: TYPE_RECORD) -> Any:
+        parts = []
+        for get, descending in getters:
+            value = get(item)
+            if value is None:
+                parts.append((missing, None))
+            else:
+                parts.append((not missing, _Descending(value) if descending else value))
+        return tuple(parts)
+
+    return key
+
+def _estimate_size(batch: TYPE_DATA) -> int:
+    """Approximate memory of a batch, from the deep size of a few sample records."""
+    if not batch:
+        return 0
+    step = max(len(batch) // 10, 1)
+    samples = batch[::step]
+    return sum(_deep_size(item) for item in samples) * len(batch) // len(samples) + sys.getsizeof(batch)
+
+def _deep_size(value: Any) -> int:
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(_deep_size(key) + _deep_size(item) for key, item in value.items())
+    elif isinstance(value, list):
+        size += sum(_deep_size(item) for item in value)
+    return size
@@ -1,10 +1,11 @@
-from jsonschema import Draft7Validator
-from jsonschema.exceptions import ValidationError
-
-from configura.constants import TYPE_DATA, DEFAULT_ENCODING, TYPE_ON_FAIL, DEFAULT_ON_FAIL
-from configura.io import read_json, write_jsonl
+from configura.constants import TYPE_DATA, TYPE_STREAM, DEFAULT_ENCODING, TYPE_ON_FAIL, DEFAULT_ON_FAIL
+from configura.dlq import DeadLetterSink, get_sink
+from configura.schema import CompiledSchema, load_schema
+from typing import Optional
 
 class Validate:
+    preserves_ownership = True
+
     def __init__(
         self,
         schema_path: str,
@@ -14,14 +15,41 @@ class Validate:
 
         dlq_dir: str = "data/dlq/",
         dlq_name: str = "dlq_output",
+        dlq_encoding: str = DEFAULT_ENCODING,
+        dlq_max_bytes: Optional[int] = None,
+        dlq_max_records: Optional[int] = None,
+
+        specialize: bool = True,
     ) -> None:
         self.schema_path = schema_path
         self.schema_encoding = schema_encoding
+        self.specialize = specialize
 
         self.on_fail: TYPE_ON_FAIL= on_fail
 
         self.dlq_dir = dlq_dir
         self.dlq_name = dlq_name
+        self.dlq_encoding = dlq_encoding
+        self.dlq_max_bytes = dlq_max_bytes
+        self.dlq_max_records = dlq_max_records
+
+    @property
+    def side_effects(self) -> bool:
+        return self.on_fail == "dlq"
+
+    @property
+    def parallel_safe(self) -> bool:
+        # Every worker would write its own DLQ file
+        return not self.side_effects
+
+    def _sink(self) -> DeadLetterSink:
+        return get_sink(
+            self.dlq_dir,
+            self.dlq_name,
+            encoding=self.dlq_encoding,
+            max_bytes=self.dlq_max_bytes,
+            max_records=self.dlq_max_records,
+        )
 
     def process(self, data):
         return self.validate(
@@ -32,36 +60,84 @@ class Validate:
             on_fail=self.on_fail,
 
             dlq_dir=self.dlq_dir,
-            dlq_name=self.dlq_name
+            dlq_name=self.dlq_name,
+            dlq_encoding=self.dlq_encoding,
+            dlq_max_bytes=self.dlq_max_bytes,
+            dlq_max_records=self.dlq_max_records,
+
+            specialize=self.specialize,
         )
-    
-    @staticmethod
-    def validate(
-        data: TYPE_DATA,
-        schema_path: str,
-        schema_encoding: str = DEFAULT_ENCODING,
 
-        on_fail: TYPE_ON_FAIL = DEFAULT_ON_FAIL,
+    def process_stream(self, stream: TYPE_STREAM) -> TYPE_STREAM:
+        """
+        Validates batch by batch, valid records are yielded immediately.
+        on_fail="fail" raises at the first batch with invalid records.
+        """
+        schema = load_schema(self.schema_path, self.schema_encoding, specialize=self.specialize)
+        sink = self._sink().acquire() if self.on_fail == "dlq" else None
 
-        dlq_dir: str = "data/dlq/",
-        dlq_name: str = "dlq_output",
-    ) -> TYPE_DATA:
-        
-        schema = read_json(path=schema_path, encoding=schema_encoding)
-        validator = Draft7Validator(schema)
+        try:
+            for batch in stream:
+                good, bad = self._split(schema, batch)
+
+                if bad:
+                    if self.on_fail == "fail":
+                        raise ValueError(f"{len(bad)} records failed validation")
+                    elif sink is not None:
+                        sink.write(bad)
+                    elif self.on_fail != "skip":
+                        raise ValueError(f"Unknown on_fail mode: {self.on_fail}")
 
+                if good:
+                    yield good
+        finally:
+            if sink is not None:
+                sink.close()
+
+    @staticmethod
+    def _split(schema: CompiledSchema, data: TYPE_DATA) -> tuple[TYPE_DATA, TYPE_DATA]:
         good, bad = [], []
+        is_valid = schema.is_valid
 
         for item in data:
-            errors : list[ValidationError] = list(validator.iter_errors(item))
+            # Fast check first, error messages only for invalid records
+            errors = [] if is_valid(item) else schema.errors(item)
             if errors:
                 bad.append({
                     "record": item,
-                    "errors": [error.message for error in errors]
+                    "errors": errors
                 })
             else:
                 good.append(item)
 
+        return good, bad
+
+    @staticmethod
+    def validate(
+        data: TYPE_DATA,
+        schema_path: str,
+        schema_encoding: str = DEFAULT_ENCODING,
+
+        on_fail: TYPE_ON_FAIL = DEFAULT_ON_FAIL,
+
+        dlq_dir: str = "data/dlq/",
+        dlq_name: str = "dlq_output",
+        dlq_encoding: str = DEFAULT_ENCODING,
+        dlq_max_bytes: Optional[int] = None,
+        dlq_max_records: Optional[int] = None,
+
+        specialize: bool = True,
+        dlq_sink: Optional[DeadLetterSink] = None,
+    ) -> TYPE_DATA:
+        """
+        Returns the valid records. on_fail="dlq" appends the invalid ones to dlq_sink
+        (flushed, the caller closes it) or to the shared sink of the DLQ file.
+        """
+        # Compiled once per schema file (cached by path + mtime)
+        schema = load_schema(schema_path, schema_encoding, specialize=specialize)
+
+        good, bad = Validate._split(schema, data)
+
         if not bad:
             return good
 
@@ -71,7 +147,17 @@ class Validate:
         elif on_fail == "skip":
             return good
         elif on_fail == "dlq":
-            write_jsonl(data=bad, path=f"{dlq_dir}{dlq_name}.jsonl")
+            # Appends to the DLQ file, earlier runs are kept
+            if dlq_sink is not None:
+                dlq_sink.write(bad)
+                dlq_sink.flush()
+                return good
+
+            sink = get_sink(dlq_dir, dlq_name, encoding=dlq_encoding, max_bytes=dlq_max_bytes, max_records=dlq_max_records).acquire()
+            try:
+                sink.write(bad)
+            finally:
+                sink.close()
             return good
         else:
             raise ValueError(f"Unknown on_fail mode: {on_fail}")
\ No newline at end of file
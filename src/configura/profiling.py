@@ -0,0 +1,310 @@
+import cProfile
+import json
+import os
+import time
+import tracemalloc
+
+from typing import Any, Iterator, Optional
+
+from configura.columnar import as_records
+from configura.constants import *
+from configura.stream import stream_step
+
+try:
+    import resource
+except ImportError: # pragma: no cover (Windows)
+    resource = None
+
+class StepMetrics:
+    """
+    Measurements of one planned step.
+
+    Times are exclusive: in streaming mode the time spent in upstream steps
+    (while pulling the next input batch) is not counted for this step.
+    cpu_s is the CPU time of the thread that runs the step (stages run in their own threads),
+    work in other threads of the step (e.g. file readers) and in worker processes is not included.
+    memory_peak_bytes is None when steps run concurrently (see Profiler).
+    """
+
+    def __init__(self, index: int, name: str) -> None:
+        self.index = index
+        self.name = name
+        self.wall_s = 0.0
+        self.cpu_s = 0.0
+        self.records_in = 0
+        self.records_out = 0
+        self.batches_out = 0
+        self.memory_peak_bytes: Optional[int] = 0
+
+    @property
+    def throughput(self) -> Optional[float]:
+        """Records per second of step time (input records, output records for readers)."""
+        records = max(self.records_in, self.records_out)
+        return records / self.wall_s if self.wall_s > 0 else None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "index": self.index,
+            "step": self.name,
+            "wall_s": self.wall_s,
+            "cpu_s": self.cpu_s,
+            "records_in": self.records_in,
+            "records_out": self.records_out,
+            "batches_out": self.batches_out,
+            "throughput_rps": self.throughput,
+            "memory_peak_bytes": self.memory_peak_bytes,
+        }
+
+class Profiler:
+    """
+    Per-step metrics for one pipeline run.
+
+    - memory="rss": increase of the peak RSS while the step runs (cheap)
+    - memory="tracemalloc": peak of Python allocations while the step runs (slow, exact)
+    - cprofile_dir: one cProfile stats file per step (<index>_<step>.prof)
+
+    RSS and tracemalloc peaks are process-wide: when steps run concurrently
+    (pipelined stages, DAG branches) only the peak of the whole run is measured.
+
+    Example:
+    - profiler = Profiler()
+    - run_pipeline_from_config(path, profiler=profiler)
+    - print(profiler.table())
+    - profiler.write_json("profile.json")
+    """
+
+    def __init__(self, memory: str = "rss", cprofile_dir: Optional[str] = None) -> None:
+        if memory not in ("rss", "tracemalloc", "none"):
+            raise ValueError(f"Unknown memory mode '{memory}'. Allowed: rss, tracemalloc, none")
+        if memory == "rss" and resource is None:
+            memory = "none"
+
+        self.memory = memory
+        self.cprofile_dir = cprofile_dir
+        self.steps: list[ProfiledStep] = []
+        self.wall_s = 0.0
+        self.memory_peak_bytes: Optional[int] = None
+        # Steps run at the same time -> no memory per step
+        self.concurrent = False
+        self._started: Optional[float] = None
+        self._memory = 0
+        # Highest tracemalloc peak before a step reset it
+        self._peak = 0
+        # Tracing of the caller is left running after stop()
+        self._started_tracing = False
+
+    def wrap(self, steps: list[Any]) -> list[Any]:
+        self.steps = [
+            ProfiledStep(instance, StepMetrics(index, _step_name(instance)), self)
+            for index, instance in enumerate(steps)
+        ]
+        return list(self.steps)
+
+    @property
+    def step_memory(self) -> str:
+        """Memory mode of the single steps."""
+        return "none" if self.concurrent else self.memory
+
+    def start(self, concurrent: bool = False) -> None:
+        self.concurrent = concurrent
+        if concurrent:
+            for step in self.steps:
+                step.metrics.memory_peak_bytes = None
+
+        if self.memory == "tracemalloc":
+            self._started_tracing = not tracemalloc.is_tracing()
+            if self._started_tracing:
+                tracemalloc.start()
+            tracemalloc.reset_peak()
+            self._memory = self._peak = tracemalloc.get_traced_memory()[0]
+        elif self.memory == "rss":
+            self._memory = _max_rss()
+        self._started = time.perf_counter()
+
+    def _keep_peak(self) -> None:
+        self._peak = max(self._peak, tracemalloc.get_traced_memory()[1])
+
+    def stop(self) -> None:
+        if self._started is not None:
+            self.wall_s = time.perf_counter() - self._started
+            self._started = None
+        if self.memory == "tracemalloc" and tracemalloc.is_tracing():
+            self._keep_peak()
+            self.memory_peak_bytes = self._peak - self._memory
+            if self._started_tracing:
+                tracemalloc.stop()
+                self._started_tracing = False
+        elif self.memory == "rss":
+            self.memory_peak_bytes = _max_rss() - self._memory
+
+        if self.cprofile_dir:
+            os.makedirs(self.cprofile_dir, exist_ok=True)
+            for step in self.steps:
+                name = "".join(c if c.isalnum() else "_" for c in step.metrics.name)
+                step.meter.profile.dump_stats(os.path.join(self.cprofile_dir, f"{step.metrics.index:02d}_{name}.prof"))
+
+    def report(self) -> dict[str, Any]:
+        return {
+            "wall_s": self.wall_s,
+            "memory": self.memory,
+            "memory_peak_bytes": self.memory_peak_bytes,
+            "concurrent": self.concurrent,
+            "steps": [step.metrics.to_dict() for step in self.steps],
+        }
+
+    def write_json(self, path: str) -> None:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w", encoding=DEFAULT_ENCODING) as f:
+            json.dump(self.report(), f, indent=2)
+
+    def table(self) -> str:
+        header = ("#", "step", "wall s", "cpu s", "in", "out", "rec/s", "mem")
+        rows = [header]
+        for step in self.steps:
+            m = step.metrics
+            rows.append((
+                str(m.index),
+                m.name,
+                f"{m.wall_s:.3f}",
+                f"{m.cpu_s:.3f}",
+                str(m.records_in),
+                str(m.records_out),
+                "-" if m.throughput is None else f"{m.throughput:,.0f}",
+                "-" if m.memory_peak_bytes is None or self.memory == "none" else _format_bytes(m.memory_peak_bytes),
+            ))
+        total_memory = "-" if self.memory_peak_bytes is None else _format_bytes(self.memory_peak_bytes)
+        rows.append(("", "total", f"{self.wall_s:.3f}", "", "", "", "", total_memory))
+
+        widths = [max(len(row[col]) for row in rows) for col in range(len(header))]
+        lines = []
+        for number, row in enumerate(rows):
+            cells = [cell.ljust(width) if col == 1 else cell.rjust(width) for col, (cell, width) in enumerate(zip(row, widths))]
+            lines.append("  ".join(cells))
+            if number == 0 or number == len(rows) - 2:
+                lines.append("  ".join("-" * width for width in widths))
+        return "\n".join(lines)
+
+class _Meter:
+    """Accumulates wall/CPU time, memory and cProfile data over start()/stop() segments."""
+
+    def __init__(self, metrics: StepMetrics, profiler: Profiler) -> None:
+        self.metrics = metrics
+        self.profiler = profiler
+        self.profile = cProfile.Profile() if profiler.cprofile_dir else None
+        self._wall = 0.0
+        self._cpu = 0.0
+        self._memory = 0
+
+    def start(self) -> None:
+        memory = self.profiler.step_memory
+        if memory == "tracemalloc":
+            self.profiler._keep_peak()
+            tracemalloc.reset_peak()
+            self._memory = tracemalloc.get_traced_memory()[0]
+        elif memory == "rss":
+            self._memory = _max_rss()
+        if self.profile is not None:
+            self.profile.enable()
+        # Per thread: pipelined stages run concurrently
+        self._cpu = time.thread_time()
+        self._wall = time.perf_counter()
+
+    def stop(self) -> None:
+        self.metrics.wall_s += time.perf_counter() - self._wall
+        self.metrics.cpu_s += time.thread_time() - self._cpu
+        if self.profile is not None:
+            self.profile.disable()
+
+        memory = self.profiler.step_memory
+        if memory == "tracemalloc":
+            peak = tracemalloc.get_traced_memory()[1] - self._memory
+            self.metrics.memory_peak_bytes = max(self.metrics.memory_peak_bytes, peak)
+        elif memory == "rss":
+            self.metrics.memory_peak_bytes += _max_rss() - self._memory
+
+class ProfiledStep:
+    """
+    Transparent wrapper around a planned step, used by the engine with --profile.
+    Attributes (side_effects, commit, ...) are forwarded to the wrapped step.
+    """
+
+    # Conversion to records happens inside, so it is measured for the step
+    columnar = True
+
+    def __init__(self, instance: Any, metrics: StepMetrics, profiler: Profiler) -> None:
+        self.instance = instance
+        self.metrics = metrics
+        self.meter = _Meter(metrics, profiler)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.instance, name)
+
+    @property
+    def drain_input(self) -> bool:
+        return getattr(self.instance, "drain_input", False)
+
+    @drain_input.setter
+    def drain_input(self, value: bool) -> None:
+        if hasattr(self.instance, "drain_input"):
+            self.instance.drain_input = value
+
+    def process(self, data: Any) -> Any:
+        self.metrics.records_in += len(data) if data else 0
+        self.meter.start()
+        try:
+            if not getattr(self.instance, "columnar", False):
+                data = as_records(data)
+            result = self.instance.process(data)
+        finally:
+            self.meter.stop()
+
+        self.metrics.records_out += len(result) if result else 0
+        self.metrics.batches_out += 1
+        return result
+
+    def process_stream(self, stream: TYPE_STREAM) -> TYPE_STREAM:
+        output = stream_step(self.instance, self._pull(stream))
+        while True:
+            self.meter.start()
+            try:
+                batch = next(output)
+            except StopIteration:
+                return
+            finally:
+                self.meter.stop()
+
+            self.metrics.records_out += len(batch)
+            self.metrics.batches_out += 1
+            yield batch
+
+    def _pull(self, stream: TYPE_STREAM) -> Iterator[Any]:
+        # Upstream steps run while pulling, their time is paused for this step
+        iterator = iter(stream)
+        while True:
+            self.meter.stop()
+            try:
+                batch = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                self.meter.start()
+
+            self.metrics.records_in += len(batch)
+            yield batch
+
+def _step_name(instance: Any) -> str:
+    if type(instance).__repr__ is not object.__repr__:
+        return repr(instance)
+    return type(instance).__name__
+
+def _max_rss() -> int:
+    usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux: KiB, macOS: bytes
+    return usage if os.uname().sysname == "Darwin" else usage * 1024
+
+def _format_bytes(size: int) -> str:
+    for unit in ("B", "KiB", "MiB"):
+        if abs(size) < 1024:
+            return f"{size:.0f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GiB"
@@ -0,0 +1,251 @@
+import os
+
+from typing import Any, Callable, Optional
+
+from configura.constants import DEFAULT_ENCODING
+from configura.io import read_json
+
+# Keywords without influence on validity (Draft 7 does not assert 'format' by default)
+_ANNOTATIONS = {
+    "$schema", "$id", "$comment", "title", "description",
+    "default", "examples", "format", "definitions",
+}
+
+_TYPE_CHECKS = {
+    "object": "isinstance({v}, dict)",
+    "array": "isinstance({v}, list)",
+    "string": "isinstance({v}, str)",
+    "boolean": "isinstance({v}, bool)",
+    "null": "{v} is None",
+    "number": "(isinstance({v}, (int, float)) and not isinstance({v}, bool))",
+    "integer": "((isinstance({v}, int) and not isinstance({v}, bool)) or (isinstance({v}, float) and {v}.is_integer()))",
+}
+
+class CompiledSchema:
+    """
+    A JSON schema prepared once for many records.
+
+    - is_valid: specialized function generated from the schema (see compile_schema),
+      falls back to Draft7Validator.is_valid for unsupported keywords
+    - errors: full error collection, only needed for invalid records
+
+    jsonschema is only imported when the validator is needed (slow import).
+    """
+
+    def __init__(self, schema: dict[str, Any], specialize: bool = True) -> None:
+        self.schema = schema
+        self._validator = None
+
+        self.specialized = compile_schema(schema) if specialize else None
+        self.is_valid: Callable[[Any], bool] = self.specialized or self.validator.is_valid
+
+    @property
+    def validator(self) -> Any:
+        if self._validator is None:
+            from jsonschema import Draft7Validator
+            self._validator = Draft7Validator(self.schema)
+        return self._validator
+
+    def errors(self, item: Any) -> list[str]:
+        """
+        Full error collection with Draft7Validator, call it after is_valid() failed.
+
+        Example:
+        - valid item -> []
+        - invalid item -> ["'id' is a required property", ...]
+        """
+        return [error.message for error in self.validator.iter_errors(item)]
+
+# (path, encoding, specialize) -> (mtime_ns, size, CompiledSchema)
+_CACHE: dict[tuple[str, str, bool], tuple[int, int, CompiledSchema]] = {}
+
+def load_schema(
+    path: str,
+    encoding: str = DEFAULT_ENCODING,
+    specialize: bool = True,
+) -> CompiledSchema:
+    """
+    Returns the compiled schema of a file, cached per process.
+    The cache entry is rebuilt when the file changes (mtime/size).
+    """
+    key = (os.path.abspath(path), encoding, specialize)
+    stat = os.stat(path)
+
+    cached = _CACHE.get(key)
+    if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+        return cached[2]
+
+    compiled = CompiledSchema(read_json(path=path, encoding=encoding), specialize=specialize)
+    _CACHE[key] = (stat.st_mtime_ns, stat.st_size, compiled)
+    return compiled
+
+# JSON schema type -> CSV column type (see io.CSV_TYPES)
+_CSV_COLUMN_TYPES = {"integer": "int", "number": "float", "boolean": "bool", "string": "str"}
+
+def csv_columns(schema: dict[str, Any]) -> dict[str, str]:
+    """
+    Top-level properties of an object schema as CSV columns, in schema order.
+    Objects, arrays and unknown types stay strings.
+
+    Example:
+    - {"properties": {"id": {"type": "integer"}, "ts": {"type": ["string", "null"]}}}
+    - RESULT -> {"id": "int", "ts": "str"}
+    """
+    columns = {}
+    for name, definition in (schema.get("properties") or {}).items():
+        types = definition.get("type") if isinstance(definition, dict) else None
+        if isinstance(types, list):
+            types = next((t for t in types if t != "null"), None)
+        columns[name] = _CSV_COLUMN_TYPES.get(types, "str")
+    return columns
+
+def compile_schema(schema: Any) -> Optional[Callable[[Any], bool]]:
+    """
+    Generates a plain Python is_valid function for common constructs:
+    type, required, properties, items, additionalProperties, enum, const,
+    minimum/maximum (+ exclusive), minLength/maxLength.
+
+    Returns None if the schema uses anything else ($ref, allOf, pattern, ...),
+    the caller then uses the generic validator.
+    """
+    compiler = _SchemaCompiler()
+    try:
+        body = compiler.compile(schema, "v0", 1)
+    except _Unsupported:
+        return None
+
+    source = "def is_valid(v0):\n" + "\n".join(body) + "\n    return True\n"
+    namespace = dict(compiler.constants, _equal=_json_equal)
+    exec(compile(source, "<configura.schema>", "exec"), namespace)
+    return namespace["is_valid"]
+
+class _Unsupported(Exception):
+    pass
+
+def _json_equal(value: Any, expected: Any) -> bool:
+    # JSON semantics: True != 1, but 1 == 1.0
+    if isinstance(value, bool) or isinstance(expected, bool):
+        return isinstance(value, bool) and isinstance(expected, bool) and value == expected
+    return type(value) not in (list, dict) and value == expected
+
+class _SchemaCompiler:
+    def __init__(self) -> None:
+        self.constants: dict[str, Any] = {}
+        self.variables = 0
+
+    def _constant(self, value: Any) -> str:
+        name = f"C{len(self.constants)}"
+        self.constants[name] = value
+        return name
+
+    def _variable(self) -> str:
+        self.variables += 1
+        return f"v{self.variables}"
+
+    def compile(self, schema: Any, v: str, depth: int) -> list[str]:
+        pad = "    " * depth
+
+        if schema is True or schema == {}:
+            return []
+        if schema is False:
+            return [f"{pad}return False"]
+        if not isinstance(schema, dict):
+            raise _Unsupported()
+
+        known = {
+            "type", "required", "properties", "additionalProperties", "items",
+            "enum", "const", "minimum", "maximum", "exclusiveMinimum",
+            "exclusiveMaximum", "minLength", "maxLength",
+        }
+        if set(schema) - known - _ANNOTATIONS:
+            raise _Unsupported()
+
+        lines: list[str] = []
+
+        if "type" in schema:
+            types = schema["type"] if isinstance(schema["type"], list) else [schema["type"]]
+            if not types or any(t not in _TYPE_CHECKS for t in types):
+                raise _Unsupported()
+            check = " or ".join(_TYPE_CHECKS[t].format(v=v) for t in types)
+            lines.append(f"{pad}if not ({check}): return False")
+
+        for keyword in ("enum", "const"):
+            if keyword not in schema:
+                continue
+            members = schema[keyword] if keyword == "enum" else [schema[keyword]]
+            if not isinstance(members, list) or any(isinstance(m, (list, dict)) for m in members):
+                raise _Unsupported()
+            name = self._constant(tuple(members))
+            lines.append(f"{pad}if not any(_equal({v}, m) for m in {name}): return False")
+
+        numeric = [
+            ("minimum", "<"), ("maximum", ">"),
+            ("exclusiveMinimum", "<="), ("exclusiveMaximum", ">="),
+        ]
+        number_check = _TYPE_CHECKS["number"].format(v=v)
+        for keyword, failing in numeric:
+            if keyword in schema:
+                limit = schema[keyword]
+                if isinstance(limit, bool) or not isinstance(limit, (int, float)):
+                    raise _Unsupported()
+                lines.append(f"{pad}if {number_check} and {v} {failing} {self._constant(limit)}: return False")
+
+        for keyword, failing in (("minLength", "<"), ("maxLength", ">")):
+            if keyword in schema:
+                lines.append(f"{pad}if isinstance({v}, str) and len({v}) {failing} {int(schema[keyword])}: return False")
+
+        object_lines = self._object(schema, v, depth + 1)
+        if object_lines:
+            lines.append(f"{pad}if isinstance({v}, dict):")
+            lines.extend(object_lines)
+
+        if "items" in schema:
+            items = schema["items"]
+            if isinstance(items, list):
+                raise _Unsupported()
+            item = self._variable()
+            item_lines = self.compile(items, item, depth + 2)
+            if item_lines:
+                lines.append(f"{pad}if isinstance({v}, list):")
+                lines.append(f"{pad}    for {item} in {v}:")
+                lines.extend(item_lines)
+
+        return lines
+
+    def _object(self, schema: dict[str, Any], v: str, depth: int) -> list[str]:
+        pad = "    " * depth
+        lines: list[str] = []
+
+        required = schema.get("required", [])
+        if required:
+            name = self._constant(tuple(required))
+            lines.append(f"{pad}for key in {name}:")
+            lines.append(f"{pad}    if key not in {v}: return False")
+
+        properties = schema.get("properties", {})
+        if not isinstance(properties, dict):
+            raise _Unsupported()
+
+        for key, subschema in properties.items():
+            child = self._variable()
+            child_lines = self.compile(subschema, child, depth + 1)
+            if child_lines:
+                lines.append(f"{pad}if {key!r} in {v}:")
+                lines.append(f"{pad}    {child} = {v}[{key!r}]")
+                lines.extend(child_lines)
+
+        additional = schema.get("additionalProperties", True)
+        if additional is False:
+            name = self._constant(frozenset(properties))
+            lines.append(f"{pad}for key in {v}:")
+            lines.append(f"{pad}    if key not in {name}: return False")
+        elif additional is not True:
+            child = self._variable()
+            child_lines = self.compile(additional, child, depth + 1)
+            if child_lines:
+                name = self._constant(frozenset(properties))
+                lines.append(f"{pad}for key, {child} in {v}.items():")
+                lines.append(f"{pad}    if key in {name}: continue")
+                lines.extend(child_lines)
+
+        return lines
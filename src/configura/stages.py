@@ -0,0 +1,220 @@
+import concurrent.futures
+import queue
+import threading
+
+from typing import Any, Callable, Iterable, Optional
+
+from configura.constants import *
+from configura.stream import stream_step
+
+# Seconds between checks for cancellation while waiting on a queue
+_POLL_S = 0.05
+
+# End of a stage's output
+_END = object()
+
+class StageCancelled(RuntimeError):
+    """Raised in a stage when the pipeline was cancelled without an error (e.g. the consumer stopped)."""
+
+class _StageGroup:
+    """State shared by the stages of one pipelined run."""
+
+    def __init__(self) -> None:
+        self.cancel = threading.Event()
+        self.error: Optional[BaseException] = None
+        self._lock = threading.Lock()
+
+    def fail(self, exc: BaseException) -> None:
+        # The first error cancels every stage and is re-raised to the consumer
+        with self._lock:
+            if self.error is None and not isinstance(exc, StageCancelled):
+                self.error = exc
+        self.cancel.set()
+
+    def failure(self) -> BaseException:
+        return self.error if self.error is not None else StageCancelled("Pipeline was cancelled")
+
+class _Channel:
+    """Bounded queue of batches between two threads, a full queue blocks the producer (backpressure)."""
+
+    def __init__(self, group: _StageGroup, queue_size: int) -> None:
+        self.group = group
+        self.queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        # Set once the consumer stopped reading (e.g. Limit)
+        self.stopped = threading.Event()
+
+    def put(self, item: Any) -> bool:
+        """False if the consumer stopped or the pipeline was cancelled."""
+        while not (self.stopped.is_set() or self.group.cancel.is_set()):
+            try:
+                self.queue.put(item, timeout=_POLL_S)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def close(self) -> bool:
+        return self.put(_END)
+
+    def results(self) -> TYPE_STREAM:
+        try:
+            while True:
+                if self.group.cancel.is_set():
+                    raise self.group.failure()
+                try:
+                    batch = self.queue.get(timeout=_POLL_S)
+                except queue.Empty:
+                    continue
+                if batch is _END:
+                    return
+                yield batch
+        finally:
+            self.stopped.set()
+
+class _Stage:
+    """Runs one step in its own thread, its output batches go into a channel."""
+
+    def __init__(self, stream: TYPE_STREAM, group: _StageGroup, queue_size: int, name: str) -> None:
+        self.stream = stream
+        self.group = group
+        self.channel = _Channel(group, queue_size)
+        self.thread = threading.Thread(target=self._run, name=f"configura-stage-{name}", daemon=True)
+
+    def _run(self) -> None:
+        try:
+            for batch in self.stream:
+                if not self.channel.put(batch):
+                    return
+            self.channel.close()
+        except BaseException as exc:
+            self.group.fail(exc)
+        finally:
+            # Closes the upstream channel readers too, which stops their stages
+            _close(self.stream)
+
+def connect_stages(
+    steps: Iterable[Any],
+    stream: Optional[TYPE_STREAM] = None,
+    queue_size: int = DEFAULT_QUEUE_SIZE,
+    side_effects: bool = False,
+) -> TYPE_STREAM:
+    """
+    Like stream.connect, but every step except the last one runs as its own
+    stage in a thread, connected by queues of at most queue_size batches.
+    Reading, transforming and writing overlap, memory stays bounded by the queues.
+
+    An error in any stage cancels all stages and is raised to the consumer.
+    Threads overlap I/O (file reads/writes, compression); CPU-bound
+    parallel-safe steps still need workers (ParallelChain) to use more cores.
+    """
+    if queue_size < 1:
+        raise ValueError(f"queue_size must be >= 1, got: {queue_size}")
+
+    steps = list(steps)
+    if not steps:
+        return
+
+    if stream is None:
+        stream = iter(())
+
+    group = _StageGroup()
+    stages: list[_Stage] = []
+
+    for index, instance in enumerate(steps):
+        if side_effects and hasattr(instance, "drain_input"):
+            instance.drain_input = True
+        side_effects = side_effects or bool(getattr(instance, "side_effects", False))
+
+        stream = stream_step(instance, stream)
+        if index < len(steps) - 1:
+            stage = _Stage(stream, group, queue_size, f"{index}-{type(instance).__name__}")
+            stages.append(stage)
+            stream = stage.channel.results()
+
+    for stage in stages:
+        stage.thread.start()
+
+    # The last step runs in the consumer's thread
+    try:
+        yield from stream
+    except Exception as exc:
+        group.fail(exc)
+        raise
+    finally:
+        group.cancel.set()
+        _close(stream)
+        for stage in stages:
+            stage.thread.join()
+
+def iter_concurrent(
+    sources: list[Callable[[], TYPE_STREAM]],
+    workers: int = DEFAULT_FILE_WORKERS,
+    ordered: bool = True,
+    queue_size: int = DEFAULT_QUEUE_SIZE,
+) -> TYPE_STREAM:
+    """
+    Batches of several streams (e.g. one per file), each one is read in a pool of at most `workers` threads.
+
+    - ordered = True: all batches of sources[0], then of sources[1], ...
+      the next sources are read ahead while the consumer is still on an earlier one
+    - ordered = False: batches in the order they are read (interleaved)
+    - memory stays bounded: at most `workers` sources are open, each one has a queue of queue_size batches
+    An error in any source cancels the others and is raised to the consumer.
+    """
+    if workers < 1:
+        raise ValueError(f"workers must be >= 1, got: {workers}")
+    if queue_size < 1:
+        raise ValueError(f"queue_size must be >= 1, got: {queue_size}")
+    if not sources:
+        return
+
+    group = _StageGroup()
+    if ordered:
+        channels = [_Channel(group, queue_size) for _ in sources]
+    else:
+        # One queue for all sources, the last one to finish closes it
+        channels = [_Channel(group, queue_size * min(workers, len(sources)))] * len(sources)
+    remaining = [len(sources)]
+    lock = threading.Lock()
+
+    def run(source: Callable[[], TYPE_STREAM], channel: _Channel) -> None:
+        if group.cancel.is_set() or channel.stopped.is_set():
+            return
+        stream = None
+        try:
+            stream = source()
+            for batch in stream:
+                if not channel.put(batch):
+                    return
+        except BaseException as exc:
+            group.fail(exc)
+            return
+        finally:
+            if stream is not None:
+                _close(stream)
+
+        if ordered:
+            channel.close()
+            return
+        with lock:
+            remaining[0] -= 1
+            last = remaining[0] == 0
+        if last:
+            channel.close()
+
+    # Tasks start in order: the source the consumer waits for is always running or finished
+    pool = concurrent.futures.ThreadPoolExecutor(max_workers=workers, thread_name_prefix="configura-source")
+    try:
+        for source, channel in zip(sources, channels):
+            pool.submit(run, source, channel)
+
+        for channel in channels if ordered else channels[:1]:
+            yield from channel.results()
+    finally:
+        group.cancel.set()
+        pool.shutdown(wait=True, cancel_futures=True)
+
+def _close(stream: TYPE_STREAM) -> None:
+    close = getattr(stream, "close", None)
+    if close is not None:
+        close()
@@ -0,0 +1,129 @@
+import copy
+
+from collections import deque
+from itertools import islice
+from typing import Any, Iterable, Optional
+
+from configura.columnar import as_records
+from configura.constants import *
+
+def iter_batches(records: Iterable[TYPE_RECORD], batch_size: int = DEFAULT_BATCH_SIZE) -> TYPE_STREAM:
+    """
+    Example:
+    - records = [r1, r2, r3]
+    - batch_size = 2
+    - YIELD -> [r1, r2], [r3]
+    """
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be >= 1, got: {batch_size}")
+
+    iterator = iter(records)
+    while True:
+        batch = list(islice(iterator, batch_size))
+        if not batch:
+            return
+        yield batch
+
+def rebatch(stream: TYPE_STREAM, batch_size: int) -> TYPE_STREAM:
+    """
+    Example:
+    - stream = [r1], [r2, r3], [r4]
+    - batch_size = 2
+    - YIELD -> [r1, r2], [r3, r4]
+    """
+    pending: TYPE_DATA = []
+    for batch in stream:
+        pending.extend(batch)
+        if len(pending) < batch_size:
+            continue
+
+        full = len(pending) - len(pending) % batch_size
+        for start in range(0, full, batch_size):
+            yield pending[start : start + batch_size]
+        pending = pending[full:]
+    if pending:
+        yield pending
+
+def drain(stream: Iterable[Any]) -> None:
+    """Consume a stream completely, e.g. to run writers at the end of a pipeline."""
+    deque(stream, maxlen=0)
+
+def collect(stream: TYPE_STREAM) -> TYPE_DATA:
+    """Materialize a stream of batches into a single list of records."""
+    data: TYPE_DATA = []
+    for batch in stream:
+        data.extend(batch)
+    return data
+
+def copy_batch(batch: TYPE_DATA) -> TYPE_DATA:
+    """
+    Copy of a batch that can be changed independently, e.g. for every branch of a fan-out.
+    Records (nested dicts/lists of JSON values) are copied without deepcopy's memo overhead.
+    """
+    if not isinstance(batch, list):
+        # Columnar batch
+        return copy.deepcopy(batch)
+    return [_copy_value(record) for record in batch]
+
+def _copy_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {key: _copy_value(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_value(item) for item in value]
+    return value
+
+def connect(steps: Iterable[Any], stream: Optional[TYPE_STREAM] = None, side_effects: bool = False) -> TYPE_STREAM:
+    """
+    Chain step instances into one lazy stream, nothing runs until it is consumed.
+
+    Steps that stop early (e.g. Limit) are told to keep draining their input
+    once an upstream step has side effects (writers, DLQ), so those still see every record.
+    side_effects: steps before the stream (e.g. in a parent DAG branch) have side effects
+    """
+    if stream is None:
+        stream = iter(())
+
+    for instance in steps:
+        if side_effects and hasattr(instance, "drain_input"):
+            instance.drain_input = True
+
+        stream = stream_step(instance, stream)
+        side_effects = side_effects or bool(getattr(instance, "side_effects", False))
+
+    return stream
+
+def stream_step(instance: Any, stream: TYPE_STREAM) -> TYPE_STREAM:
+    """
+    Connect a single step instance to an incoming stream
+
+    1. instance.process_stream(stream) exists -> the step handles the stream itself
+    2. instance.streamable is True -> process(batch) is applied batch by batch
+    3. otherwise -> the step needs the full dataset, materialize and call process(data) once
+
+    Columnar batches are converted back to records for steps without columnar = True.
+    """
+    if not getattr(instance, "columnar", False):
+        stream = _record_batches(stream)
+
+    if hasattr(instance, "process_stream"):
+        return instance.process_stream(stream)
+
+    if getattr(instance, "streamable", False):
+        return _process_batches(instance, stream)
+
+    return _process_materialized(instance, stream)
+
+def _record_batches(stream: TYPE_STREAM) -> TYPE_STREAM:
+    for batch in stream:
+        yield as_records(batch)
+
+def _process_batches(instance: Any, stream: TYPE_STREAM) -> TYPE_STREAM:
+    for batch in stream:
+        result = instance.process(batch)
+        if result:
+            yield result
+
+def _process_materialized(instance: Any, stream: TYPE_STREAM) -> TYPE_STREAM:
+    result = instance.process(collect(stream))
+    if result:
+        yield from iter_batches(result)
@@ -0,0 +1,66 @@
+import os
+
+from typing import Any, Optional
+
+from configura.io import read_json, write_json
+
+class Watermark:
+    """
+    Persisted byte offset of an append-only file (state file in JSON).
+
+    The stored offset is only used if the file is still the same one:
+    - other inode/device -> file was rotated, read from the start
+    - size < offset -> file was truncated, read from the start
+
+    Example:
+    - watermark = Watermark("data/state/records.json", "data/input/records.jsonl")
+    - offset = watermark.load() -> 0 on the first run
+    - watermark.save(offset + bytes_read) -> after a successful run
+    """
+
+    def __init__(self, state_path: str, path: str) -> None:
+        self.state_path = state_path
+        self.path = path
+        self._identity: Optional[tuple[int, int]] = None
+
+    def load(self) -> int:
+        stat = os.stat(self.path)
+        self._identity = (stat.st_dev, stat.st_ino)
+
+        state = self._read_state()
+        if state is None:
+            return 0
+        if state.get("path") != os.path.abspath(self.path):
+            return 0
+        if (state.get("device"), state.get("inode")) != self._identity:
+            return 0
+
+        offset = state.get("offset", 0)
+        if not isinstance(offset, int) or offset < 0 or stat.st_size < offset:
+            return 0
+        return offset
+
+    def save(self, offset: int) -> None:
+        if self._identity is None:
+            stat = os.stat(self.path)
+            self._identity = (stat.st_dev, stat.st_ino)
+
+        device, inode = self._identity
+        state = {
+            "path": os.path.abspath(self.path),
+            "device": device,
+            "inode": inode,
+            "offset": offset,
+        }
+
+        # Write + rename, a crash never leaves a half written state file
+        os.makedirs(os.path.dirname(self.state_path) or ".", exist_ok=True)
+        tmp_path = f"{self.state_path}.tmp"
+        write_json(state, tmp_path, compression=None)
+        os.replace(tmp_path, self.state_path)
+
+    def _read_state(self) -> Optional[dict[str, Any]]:
+        if not os.path.exists(self.state_path):
+            return None
+        state = read_json(self.state_path, compression=None)
+        return state if isinstance(state, dict) else None
@@ -0,0 +1,16 @@
+import random
+
+import pytest
+
+
+@pytest.fixture
+def random_records():
+    """
+    Factory of seeded test records: random_records(count, seed=1, index="n", **fields).
+    Every record holds its position under `index` and make(rng) for every field=make.
+    """
+    def make(count, seed=1, index="n", **fields):
+        rng = random.Random(seed)
+        return [{**{field: value(rng) for field, value in fields.items()}, index: n} for n in range(count)]
+
+    return make
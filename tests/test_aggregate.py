@@ -0,0 +1,134 @@
+import pytest
+
+from configura.columnar import ColumnBatch
+from configura.plugins.aggregate import Aggregate
+from configura.stream import collect, iter_batches
+
+AGGREGATIONS = {
+    "n": {"op": "count"},
+    "temps": {"op": "count", "field": "payload.temp_c"},
+    "stats.sum": {"op": "sum", "field": "payload.temp_c"},
+    "stats.min": {"op": "min", "field": "payload.temp_c"},
+    "stats.max": {"op": "max", "field": "payload.temp_c"},
+    "stats.mean": {"op": "mean", "field": "payload.temp_c"},
+    "first_id": {"op": "first", "field": "id"},
+    "last_id": {"op": "last", "field": "id"},
+}
+
+
+def _fields(sensors=50):
+    return {
+        "sensor": lambda rng: f"s{rng.randrange(sensors)}",
+        "payload": lambda rng: {"temp_c": rng.choice([None, rng.randrange(-20, 40)])},
+    }
+
+
+def _expected(records):
+    groups = {}
+    for record in records:
+        groups.setdefault(record["sensor"], []).append(record)
+
+    result = {}
+    for sensor, items in groups.items():
+        temps = [r["payload"]["temp_c"] for r in items if r["payload"]["temp_c"] is not None]
+        result[sensor] = {
+            "sensor": sensor,
+            "n": len(items),
+            "temps": len(temps),
+            "stats": {
+                "sum": sum(temps) if temps else None,
+                "min": min(temps, default=None),
+                "max": max(temps, default=None),
+                "mean": sum(temps) / len(temps) if temps else None,
+            },
+            "first_id": items[0]["id"],
+            "last_id": items[-1]["id"],
+        }
+    return result
+
+
+def _by_sensor(result):
+    return {record["sensor"]: record for record in result}
+
+
+def test_records_in_first_appearance_order(random_records):
+    records = random_records(5000, index="id", **_fields())
+    result = Aggregate(group_by="sensor", aggregations=AGGREGATIONS).process(records)
+
+    expected = _expected(records)
+    assert result == list(expected.values())
+
+
+def test_columnar_matches_records(random_records):
+    pytest.importorskip("numpy")
+    records = random_records(5000, index="id", **_fields())
+    plugin = Aggregate(group_by="sensor", aggregations=AGGREGATIONS)
+
+    batches = [ColumnBatch.from_records(batch) for batch in iter_batches(records, 700)]
+    result = collect(plugin.process_stream(iter(batches)))
+
+    assert result == pytest.approx(list(_expected(records).values()))
+
+
+def test_spills_partial_states(tmp_path, random_records):
+    records = random_records(20000, index="id", **_fields(sensors=500))
+    plugin = Aggregate(group_by="sensor", aggregations=AGGREGATIONS, max_groups=50, spill_dir=str(tmp_path), partitions=8)
+
+    result = collect(plugin.process_stream(iter_batches(records, 300)))
+
+    assert _by_sensor(result) == _expected(records)
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_global_aggregate_and_nested_group_keys():
+    records = [{"payload": {"status": "ok"}, "v": 1}, {"payload": {"status": "bad"}, "v": 2}, {"v": 3}]
+
+    assert Aggregate(aggregations={"total": {"op": "sum", "field": "v"}}).process(records) == [{"total": 6}]
+    assert Aggregate(group_by="payload.status", aggregations={"n": {"op": "count"}}).process(records) == [
+        {"payload": {"status": "ok"}, "n": 1},
+        {"payload": {"status": "bad"}, "n": 1},
+        {"payload": {"status": None}, "n": 1},
+    ]
+
+
+def test_invalid_aggregations():
+    with pytest.raises(ValueError, match="unknown op"):
+        Aggregate(aggregations={"x": {"op": "median", "field": "v"}})
+    with pytest.raises(ValueError, match="needs a 'field'"):
+        Aggregate(aggregations={"x": {"op": "sum"}})
+
+
+def test_unhashable_group_values():
+    plugin = Aggregate(group_by=["id", "tags"], aggregations={"n": {"op": "count"}})
+    records = [{"id": 1, "tags": "a"}, {"id": 2, "tags": ["a", "b"]}]
+
+    with pytest.raises(ValueError, match=r"group_by 'tags' has an unhashable value \(list\)"):
+        plugin.process(records)
+    pytest.importorskip("numpy")
+    with pytest.raises(ValueError, match="group_by 'tags'"):
+        plugin.process(ColumnBatch.from_records(records))
+
+
+def test_columnar_without_int64_overflow(random_records):
+    pytest.importorskip("numpy")
+    keys = [f"k{i}" for i in range(6)]
+    fields = {key: lambda rng: rng.randrange(10**6) for key in keys}
+    records = random_records(3000, seed=5, index="id", v=lambda rng: rng.choice([2**62, -(2**62), 7]), **fields)
+    records += [dict(record) for record in records[:500]]
+    plugin = Aggregate(group_by=keys, aggregations={"n": {"op": "count"}, "total": {"op": "sum", "field": "v"}})
+
+    result = collect(plugin.process_stream(iter([ColumnBatch.from_records(records)])))
+
+    assert result == Aggregate(group_by=keys, aggregations=plugin.aggregations).process(records)
+    assert sum(record["n"] for record in result) == 3500
+    assert len(result) == 3000
+
+
+def test_columnar_sum_of_large_ints():
+    pytest.importorskip("numpy")
+    records = [{"g": "a", "v": 2**62} for _ in range(4)] + [{"g": "b", "v": 1}]
+    plugin = Aggregate(group_by="g", aggregations={"total": {"op": "sum", "field": "v"}})
+
+    result = collect(plugin.process_stream(iter([ColumnBatch.from_records(records)])))
+
+    assert result == [{"g": "a", "total": 2**64}, {"g": "b", "total": 1}]
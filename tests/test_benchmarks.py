@@ -0,0 +1,33 @@
+import json
+import sys
+
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "benchmarks"))
+
+import run as bench
+from datasets import make_records
+
+
+def test_datasets_are_deterministic():
+    assert make_records("dirty", 50) == make_records("dirty", 50)
+    assert make_records("nested", 50, seed=1) != make_records("nested", 50, seed=2)
+    assert "value" in make_records("flat", 1)[0]
+    assert len(make_records("wide", 1)[0]) > 40
+
+
+def test_suite_saves_baseline_and_fails_on_regression(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    baseline = tmp_path / "baseline.json"
+    args = ["-n", "200", "-r", "1", "--only", "plugin.Limit", "--baseline", str(baseline)]
+
+    assert bench.main(args) == 2
+    assert bench.main(args + ["--allow-missing-baseline"]) == 0
+    assert bench.main(args + ["--save"]) == 0
+    report = json.loads(baseline.read_text())
+    assert report["results"]["plugin.Limit"]["records"] == 200
+
+    report["results"]["plugin.Limit"]["records_per_s"] *= 1000
+    baseline.write_text(json.dumps(report))
+    assert bench.main(args) == 1
+    assert bench.main(args + ["-n", "300"]) == 2
@@ -0,0 +1,122 @@
+import json
+import os
+
+import pytest
+
+from configura import cache as cache_module
+from configura.cache import CachedSource, CheckpointCache
+from configura.engine import run_pipeline_from_config
+from configura.loader import build_step
+from configura.pipeline import Pipeline
+
+READ = "configura.adapters.jsonl_adapter:ReadJsonl"
+FILTER = "configura.plugins.filter_by_field:FilterByField"
+RENAME = "configura.plugins.rename_fields:RenameFields"
+WRITE = "configura.adapters.jsonl_adapter:WriteJsonl"
+
+
+def _pipeline(input_path, output_path, value=3):
+    return [
+        {"type": READ, "params": {"path": str(input_path)}, "checkpoint": True},
+        {"type": FILTER, "params": {"key_name": "value", "operator": ">=", "value": value}},
+        {"type": RENAME, "params": {"mapping": {"value": "score"}}},
+        {"type": WRITE, "params": {"path": str(output_path)}},
+    ]
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_rerun_resumes_from_longest_cached_prefix(tmp_path, streaming):
+    input_path = tmp_path / "input.jsonl"
+    input_path.write_text("".join(json.dumps({"id": i, "value": i % 7}) + "\n" for i in range(100)))
+    cache_dir = tmp_path / "cache"
+    config_path = tmp_path / "pipeline.json"
+
+    def run(pipeline):
+        config_path.write_text(json.dumps({
+            "pipeline": pipeline,
+            "streaming": streaming,
+            "cache": {"dir": str(cache_dir)},
+        }))
+        run_pipeline_from_config(config_path)
+
+    run(_pipeline(input_path, tmp_path / "first.jsonl"))
+    first = (tmp_path / "first.jsonl").read_text()
+    # After the reader (checkpoint: true) and after the last cacheable step (rename)
+    assert len(os.listdir(cache_dir)) == 2
+
+    pipeline = _pipeline(input_path, tmp_path / "second.jsonl")
+    cache = CheckpointCache(str(cache_dir))
+    planned = cache.apply(pipeline, [build_step(step) for step in pipeline])
+    assert isinstance(planned[0], CachedSource)
+    assert len(planned) == 2
+
+    run(pipeline)
+    assert (tmp_path / "second.jsonl").read_text() == first
+
+    # Changed filter -> resumes after the reader
+    changed = _pipeline(input_path, tmp_path / "third.jsonl", value=5)
+    steps = [build_step(step) for step in changed]
+    planned = cache.apply(changed, steps)
+    assert planned[0].key == cache.fingerprints(changed, steps)[0]
+    assert planned[1:3] == steps[1:3]
+    assert planned[3].key == cache.fingerprints(changed, steps)[2]
+
+    # Changed input file -> nothing is reused
+    input_path.write_text(json.dumps({"id": 0, "value": 6}) + "\n")
+    planned = cache.apply(changed, [build_step(step) for step in changed])
+    assert not isinstance(planned[0], CachedSource)
+
+
+def test_package_changes_invalidate_checkpoints(tmp_path, monkeypatch):
+    package = tmp_path / "configura"
+    package.mkdir()
+    (package / "cache.py").write_text("")
+    (package / "paths.py").write_text("# v1")
+    monkeypatch.setattr(cache_module, "__file__", str(package / "cache.py"))
+    pipeline = _pipeline(tmp_path / "in.jsonl", tmp_path / "out.jsonl")[:2]
+    steps = [build_step(step) for step in pipeline]
+
+    before = CheckpointCache(str(tmp_path)).fingerprints(pipeline, steps)
+    (package / "paths.py").write_text("# v2 helper")
+
+    assert CheckpointCache(str(tmp_path)).fingerprints(pipeline, steps)[0] != before[0]
+
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    cache = CheckpointCache(str(tmp_path), max_bytes=1)
+    list(cache.store("old", iter([[{"id": 1}]])))
+    list(cache.store("new", iter([[{"id": 2}]])))
+
+    assert os.listdir(tmp_path) == []
+
+    cache.max_bytes = 10_000
+    list(cache.store("old", iter([[{"id": 1}]])))
+    list(cache.store("new", iter([[{"id": 2}]])))
+    os.utime(cache.path("old"), ns=(1, 1))
+    cache.max_bytes = os.path.getsize(cache.path("new"))
+    cache.evict()
+
+    assert os.listdir(tmp_path) == ["new.pkl"]
+    assert list(cache.load("new")) == [[{"id": 2}]]
+
+
+def test_cache_keeps_pushdown_and_fusion(tmp_path):
+    input_path = tmp_path / "input.jsonl"
+    input_path.write_text("".join(json.dumps({"id": i, "value": i % 7}) + "\n" for i in range(100)))
+    pipeline = [
+        {"type": READ, "params": {"path": str(input_path)}},
+        {"type": FILTER, "params": {"key_name": "value", "operator": ">=", "value": 3}},
+        {"type": "configura.plugins.deduplicate:Deduplicate", "params": {"keys": ["id"]}},
+        {"type": RENAME, "params": {"mapping": {"value": "score"}}},
+        {"type": "configura.plugins.drop_fields:DropFields", "params": {"fields": ["id"]}},
+        {"type": WRITE, "params": {"path": str(tmp_path / "out.jsonl")}},
+    ]
+    compiled = Pipeline({"pipeline": pipeline, "cache": {"dir": str(tmp_path / "cache")}})
+
+    names = [type(step).__name__ for step in compiled.planned_steps()]
+    # Filter pushed into the reader, rename + drop fused, one checkpoint before the writer
+    assert names == ["ReadJsonl", "Deduplicate", "FusedSteps", "Checkpoint", "WriteJsonl"]
+
+    compiled.run()
+    compiled.run()
+    assert [type(step).__name__ for step in compiled.planned_steps()] == ["CachedSource", "WriteJsonl"]
@@ -0,0 +1,49 @@
+import pytest
+
+pytest.importorskip("numpy")
+
+from configura.columnar import ColumnBatch
+from configura.plugins.drop_fields import DropFields
+from configura.plugins.filter_by_field import FilterByField
+from configura.plugins.limit import Limit
+
+
+RECORDS = [
+    {"id": 1, "payload": {"temp_c": 18.5, "status": "ok"}, "debug": True},
+    {"id": 2, "payload": {"temp_c": 21.0, "status": "warning"}},
+    {"id": 3, "payload": {"temp_c": None, "status": "ok"}},
+    {"id": 4, "payload": {"status": "ok"}, "debug": False},
+    {"id": 5, "payload": {"temp_c": 22.5, "status": "ok"}},
+]
+
+
+def test_column_batch_round_trip_keeps_missing_and_null_values():
+    batch = ColumnBatch.from_records(RECORDS)
+
+    assert len(batch) == 5
+    assert batch.to_records() == RECORDS
+    assert batch[-1] == RECORDS[-1]
+
+
+def test_columnar_plugins_match_record_plugins():
+    steps = [
+        FilterByField(key_name="payload.temp_c", operator=">=", value=20),
+        DropFields(fields=["debug"]),
+        Limit(count=1),
+    ]
+
+    rows, batch = RECORDS, ColumnBatch.from_records(RECORDS)
+    for step in steps:
+        rows, batch = step.process(rows), step.process(batch)
+
+    assert isinstance(batch, ColumnBatch)
+    assert batch.to_records() == rows == [{"id": 2, "payload": {"temp_c": 21.0, "status": "warning"}}]
+
+
+def test_columnar_filter_keeps_type_error_semantics():
+    batch = ColumnBatch.from_records([{"value": 1}, {"value": "x"}, {"value": 5}])
+
+    assert FilterByField(key_name="value", operator=">", value=2).process(batch).to_records() == [{"value": 5}]
+
+    with pytest.raises(TypeError):
+        FilterByField(key_name="value", operator=">", value=2, fail_on_type_error=True).process(batch)
@@ -0,0 +1,66 @@
+import pytest
+
+from configura.adapters.csv_adapter import ReadCsv, WriteCsv
+from configura.io import infer_csv_types, read_csv
+from configura.plugins.filter_by_field import FilterByField
+from configura.stream import collect, iter_batches
+
+
+def test_writer_infers_header_from_prefix(tmp_path):
+    path = tmp_path / "out.csv"
+    records = [{"id": 1}, {"id": 2, "extra": "x"}] + [{"id": i, "late": i} for i in range(3, 10)]
+
+    writer = WriteCsv(str(path), infer_rows=5)
+    assert collect(writer.process_stream(iter_batches(records, 2))) == records
+
+    lines = path.read_text().splitlines()
+    # 'late' first appears inside the sampled prefix, columns after it are left out
+    assert lines[:3] == ["id,extra,late", "1,,", "2,x,"]
+    assert len(lines) == 10
+
+    with pytest.raises(ValueError):
+        WriteCsv(str(path), fieldnames=["id"], extrasaction="raise").process(records)
+
+
+def test_writer_append_keeps_existing_header(tmp_path):
+    path = tmp_path / "out.csv"
+    WriteCsv(str(path)).process([{"b": 1, "a": 2}])
+    WriteCsv(str(path), append=True).process([{"a": 3, "b": 4}])
+
+    assert read_csv(str(path)) == [{"b": "1", "a": "2"}, {"b": "4", "a": "3"}]
+
+
+def test_typed_reader(tmp_path):
+    path = tmp_path / "in.csv"
+    path.write_text("id,temp,active,name\n1,20.5,true,a\n2,,false,b\n3,7,1,\n")
+
+    assert infer_csv_types([["1", "20.5", "true", "a"]], ["id", "temp", "active", "name"]) == {
+        "id": "int", "temp": "float", "active": "bool", "name": "str",
+    }
+
+    inferred = ReadCsv(str(path), types="infer").process(None)
+    assert inferred[1] == {"id": 2, "temp": None, "active": False, "name": "b"}
+
+    declared = ReadCsv(str(path), types={"id": "int"}).process(None)
+    assert declared[2] == {"id": 3, "temp": "7", "active": "1", "name": ""}
+
+    # Numeric filters work on typed columns
+    records = FilterByField(key_name="temp", operator=">=", value=10).process(inferred)
+    assert [record["id"] for record in records] == [1]
+
+
+def test_typed_reader_reports_bad_values(tmp_path):
+    path = tmp_path / "in.csv"
+    path.write_text("id\n1\nx\n")
+
+    with pytest.raises(ValueError, match="'id'"):
+        ReadCsv(str(path), types={"id": "int"}).process(None)
+
+
+def test_schema_columns(tmp_path):
+    path = tmp_path / "in.csv"
+    path.write_text("id,ts,payload\n1,2024,{}\n")
+
+    reader = ReadCsv(str(path), schema_path="data/schema/records_schema.json")
+    assert reader.process(None) == [{"id": 1, "ts": "2024", "payload": "{}"}]
+    assert WriteCsv(str(tmp_path / "out.csv"), schema_path="data/schema/records_schema.json").fieldnames == ["id", "ts", "type", "payload"]
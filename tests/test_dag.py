@@ -0,0 +1,67 @@
+import csv
+import json
+import threading
+
+import pytest
+
+from configura.dag import build_branches
+from configura.pipeline import Pipeline
+
+READ = "configura.adapters.jsonl_adapter:ReadJsonl"
+WRITE = "configura.adapters.jsonl_adapter:WriteJsonl"
+
+
+def _input(tmp_path, count=300):
+    path = tmp_path / "input.jsonl"
+    path.write_text("".join(json.dumps({"id": i, "payload": {"value": i % 7}}) + "\n" for i in range(count)))
+    return str(path)
+
+
+def _read_jsonl(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+@pytest.mark.parametrize("pipelined", [False, True])
+def test_fan_out_to_independent_branches(tmp_path, pipelined):
+    config = {"pipeline": [
+        {"name": "read", "type": READ, "params": {"path": _input(tmp_path), "batch_size": 32}},
+        {"type": WRITE, "params": {"path": str(tmp_path / "all.jsonl")}},
+        {"input": "read", "type": "configura.plugins.rename_fields:RenameFields", "params": {"mapping": {"payload.value": "payload.renamed"}}},
+        {"type": "configura.plugins.filter_by_field:FilterByField", "params": {"key_name": "payload.renamed", "operator": ">=", "value": 5}},
+        {"type": "configura.plugins.limit:Limit", "params": {"count": 10}},
+        {"type": "configura.adapters.csv_adapter:WriteCsv", "params": {"path": str(tmp_path / "subset.csv")}},
+    ], "queue_size": 2}
+
+    pipeline = Pipeline(config, pipelined=pipelined)
+    assert [branch.names for branch in pipeline.branches.walk()] == [["read"], ["step1"], ["step2", "step3", "step4", "step5"]]
+    assert pipeline.run() is None
+
+    # The rename in one branch does not leak into the other
+    everything = _read_jsonl(tmp_path / "all.jsonl")
+    assert len(everything) == 300
+    assert all("value" in record["payload"] for record in everything)
+
+    with open(tmp_path / "subset.csv", newline="") as f:
+        subset = list(csv.DictReader(f))
+    assert len(subset) == 10
+
+
+def test_branch_error_cancels_dag(tmp_path):
+    config = {"pipeline": [
+        {"name": "read", "type": READ, "params": {"path": _input(tmp_path, 5000), "batch_size": 10}},
+        {"type": WRITE, "params": {"path": str(tmp_path / "all.jsonl")}},
+        {"input": "read", "type": "configura.plugins.filter_by_field:FilterByField",
+         "params": {"key_name": "payload", "operator": ">=", "value": 1, "fail_on_type_error": True}},
+    ], "queue_size": 1}
+
+    with pytest.raises(TypeError):
+        Pipeline(config).run()
+
+    assert not [thread for thread in threading.enumerate() if thread.name.startswith("configura-")]
+
+
+def test_invalid_inputs():
+    with pytest.raises(ValueError, match="earlier step"):
+        build_branches([{"type": READ, "input": "later"}, {"name": "later", "type": WRITE}])
+    with pytest.raises(ValueError, match="duplicate"):
+        build_branches([{"name": "a", "type": READ}, {"name": "a", "type": WRITE}])
@@ -0,0 +1,81 @@
+import hashlib
+
+import pytest
+
+from configura.plugins import deduplicate
+from configura.plugins.deduplicate import Deduplicate, ScalableBloomFilter
+from configura.stream import collect, iter_batches
+
+
+def _fields(distinct=1000):
+    return {"id": lambda rng: rng.randrange(distinct), "ts": lambda rng: rng.randrange(3)}
+
+
+def _first_occurrences(records, fields):
+    seen, result = set(), []
+    for record in records:
+        key = tuple(record[field] for field in fields)
+        if key not in seen:
+            seen.add(key)
+            result.append(record)
+    return result
+
+
+@pytest.mark.parametrize("keys", ["id", ["id", "ts"]])
+def test_exact_in_memory_keeps_first_occurrence(keys, random_records):
+    records = random_records(5000, **_fields())
+    fields = [keys] if isinstance(keys, str) else keys
+
+    assert Deduplicate(keys=keys).process(records) == _first_occurrences(records, fields)
+
+
+def test_exact_spills_partitions(tmp_path, random_records):
+    records = random_records(20000, **_fields(5000))
+    plugin = Deduplicate(keys="id", memory_bytes=20_000, spill_dir=str(tmp_path), partitions=8)
+
+    result = collect(plugin.process_stream(iter_batches(records, 500)))
+
+    # Same records, spilled partitions come last
+    expected = _first_occurrences(records, ["id"])
+    assert len(result) == len(expected)
+    assert sorted(record["n"] for record in result) == sorted(record["n"] for record in expected)
+    # Spill files are removed after the run
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_exact_splits_large_spilled_partitions(tmp_path, monkeypatch, random_records):
+    records = random_records(30000, **_fields(20000))
+    plugin = Deduplicate(keys="id", memory_bytes=20_000, spill_dir=str(tmp_path), partitions=3)
+    splits = []
+    original = deduplicate._ExactDeduplicator._split
+    monkeypatch.setattr(deduplicate._ExactDeduplicator, "_split", lambda self, *args: splits.append(args[1]) or original(self, *args))
+
+    result = collect(plugin.process_stream(iter_batches(records, 500)))
+
+    expected = _first_occurrences(records, ["id"])
+    assert sorted(record["n"] for record in result) == sorted(record["n"] for record in expected)
+    assert splits and max(splits) > 1
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_approximate_mode(random_records):
+    records = random_records(20000, **_fields(5000))
+    result = Deduplicate(keys="id", mode="approximate", capacity=500, error_rate=0.01).process(records)
+
+    expected = _first_occurrences(records, ["id"])
+    # False positives only drop records, the filter grew beyond its initial capacity
+    assert {record["n"] for record in result} <= {record["n"] for record in expected}
+    assert len(result) >= len(expected) * 0.98
+
+
+def test_scalable_bloom_filter_rate():
+    def digest(value):
+        return hashlib.blake2b(str(value).encode(), digest_size=16).digest()
+
+    bloom = ScalableBloomFilter(capacity=1000, error_rate=0.01)
+    for i in range(10000):
+        bloom.add(digest(i))
+
+    false_positives = sum(not bloom.add(digest(-i - 1)) for i in range(10000))
+    assert len(bloom.filters) > 1
+    assert false_positives < 200
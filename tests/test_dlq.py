@@ -0,0 +1,94 @@
+import json
+import threading
+
+import pytest
+
+from configura import dlq
+from configura.dlq import DeadLetterSink
+from configura.plugins.filter_by_field import FilterByField
+from configura.plugins.validate import Validate
+
+
+def _lines(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def test_dlq_sink_appends_and_rotates_by_record_count(tmp_path):
+    sink = DeadLetterSink(f"{tmp_path}/", "bad", max_records=3, buffer_records=2)
+
+    sink.write({"n": n} for n in range(5))
+    sink.close()
+    sink.write([{"n": 5}])
+    sink.close()
+
+    rotated = [path for path in tmp_path.iterdir() if path.name != "bad.jsonl"]
+    assert len(rotated) == 1
+    assert _lines(rotated[0]) == [{"n": 0}, {"n": 1}, {"n": 2}]
+    assert _lines(tmp_path / "bad.jsonl") == [{"n": 3}, {"n": 4}, {"n": 5}]
+
+
+def test_filter_by_field_writes_type_errors_to_dlq(tmp_path):
+    plugin = FilterByField(
+        key_name="value",
+        operator=">",
+        value=1,
+        dlq_dir=f"{tmp_path}/",
+        dlq_name="filter_dlq",
+    )
+
+    assert plugin.process([{"value": 2}, {"value": "x"}]) == [{"value": 2}]
+    assert plugin.process([{"value": "y"}]) == []
+
+    assert [entry["record"] for entry in _lines(tmp_path / "filter_dlq.jsonl")] == [{"value": "x"}, {"value": "y"}]
+
+
+def test_shared_sink_settings_and_no_rescans(tmp_path, monkeypatch):
+    counted = []
+    monkeypatch.setattr(dlq, "_count_lines", lambda path: counted.append(path) or 0)
+
+    plugin = FilterByField(key_name="value", operator=">", value=1, dlq_dir=f"{tmp_path}/", dlq_name="shared", dlq_max_records=2)
+    for n in range(5):
+        plugin.process([{"value": str(n)}])
+    plugin.commit()
+
+    assert len(list(tmp_path.iterdir())) == 3
+    assert [entry["record"] for entry in _lines(tmp_path / "shared.jsonl")] == [{"value": "4"}]
+    assert counted == []
+
+    with pytest.raises(ValueError, match="already used"):
+        dlq.get_sink(f"{tmp_path}/", "shared", max_records=3)
+
+
+def test_shared_sink_across_threads(tmp_path):
+    def user(worker):
+        for batch in range(3):
+            sink = dlq.get_sink(f"{tmp_path}/", "threads", max_records=1000).acquire()
+            try:
+                for part in range(7):
+                    sink.write({"worker": worker, "n": batch * 700 + part * 100 + n} for n in range(100))
+            finally:
+                sink.close()
+
+    threads = [threading.Thread(target=user, args=(worker,)) for worker in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    lines = [line for path in tmp_path.iterdir() for line in _lines(path)]
+    assert sorted((line["worker"], line["n"]) for line in lines) == [(w, n) for w in range(3) for n in range(2100)]
+    assert dlq.get_sink(f"{tmp_path}/", "threads", max_records=1000)._file is None
+
+
+def test_static_validate_uses_dlq_settings(tmp_path):
+    schema_path = tmp_path / "schema.json"
+    schema_path.write_text(json.dumps({"required": ["id"]}))
+    shared = dlq.get_sink(f"{tmp_path}/", "invalid", max_records=2).acquire()
+    shared.write([{"record": {}, "errors": []}])
+
+    Validate.validate([{"id": 1}, {"n": 2}], str(schema_path), on_fail="dlq", dlq_dir=f"{tmp_path}/", dlq_name="invalid", dlq_max_records=2)
+
+    # The shared sink of the other user stays open
+    assert shared._file is not None and not shared._file.closed
+    shared.close()
+    assert [entry["record"] for entry in _lines(tmp_path / "invalid.jsonl")] == [{}, {"n": 2}]
@@ -0,0 +1,73 @@
+import pickle
+import random
+
+import pytest
+
+from configura.adapters.jsonl_adapter import ReadJsonl
+from configura.expressions import Expression
+from configura.io import write_jsonl
+from configura.planner import plan
+from configura.plugins.filter import Filter
+
+RECORDS = [
+    {"id": 1, "type": "a", "payload": {"temp_c": 18.5}},
+    {"id": 2, "type": "b", "payload": {"temp_c": 25.0}},
+    {"id": 3, "type": "c", "payload": {"temp_c": "n/a"}},
+    {"id": 4, "type": "a", "payload": {}},
+    {"id": 5, "type": None, "tags": ["x", "y"], "active": True},
+]
+
+
+@pytest.mark.parametrize(
+    "text, ids",
+    [
+        ("18 <= payload.temp_c < 30", [1, 2]),
+        ('type in ["a", "b"] and id > 1', [2, 4]),
+        ("payload.temp_c is None or id == 1", [1, 4, 5]),
+        ("not (payload.temp_c > 20)", [1, 3, 4, 5]),
+        ('"x" in tags and active', [5]),
+        ('type not in ("a",)', [2, 3]),
+        ('field("payload.temp_c") == "n/a"', [3]),
+    ],
+)
+def test_expression_semantics(text, ids):
+    expression = Expression(text)
+
+    assert [r["id"] for r in RECORDS if expression.matches(r)] == ids
+    assert [r["id"] for r in expression.select(RECORDS)] == ids
+
+
+def test_invalid_expressions():
+    for text in ["id >", "id + 1 > 2", "5", "id is 5", "__import__('os')"]:
+        with pytest.raises(ValueError):
+            Expression(text)
+
+
+def test_adaptive_order_keeps_result():
+    rng = random.Random(3)
+    records = [{"a": rng.random(), "b": rng.randrange(100), "c": rng.choice(["x", "y"])} for _ in range(20000)]
+    text = 'a < 0.9 and c == "x" and b < 5'
+    batches = [records[i : i + 500] for i in range(0, len(records), 500)]
+
+    adaptive = Filter(text)
+    static = Filter(text, adaptive=False)
+
+    assert [adaptive.process(b) for b in batches] == [static.process(b) for b in batches]
+    # The most selective term (b < 5) runs first
+    assert adaptive.order[0] == 2
+
+
+def test_filter_pushed_into_reader(tmp_path):
+    path = str(tmp_path / "in.jsonl")
+    write_jsonl(RECORDS, path)
+
+    steps = plan([ReadJsonl(path), Filter('type == "a" or payload.temp_c > 20')])
+
+    assert len(steps) == 1
+    assert [r["id"] for r in steps[0].process(None)] == [1, 2, 4]
+
+
+def test_filter_can_be_pickled():
+    plugin = pickle.loads(pickle.dumps(Filter('type == "a"')))
+
+    assert [r["id"] for r in plugin.process(RECORDS)] == [1, 4]
@@ -0,0 +1,126 @@
+import pytest
+
+from configura.io import get_codec, read_json, read_jsonl, write_json, write_json_stream, write_jsonl
+
+RECORDS = [
+    {"id": 1, "name": "Müller", "payload": {"temp_c": 18.7, "tags": ["a", "b"]}},
+    {"id": 2, "name": None, "big": 2 ** 70},
+]
+
+
+@pytest.mark.parametrize("codec", ["json", "orjson", "msgspec"])
+def test_codecs_roundtrip_jsonl(tmp_path, codec):
+    if codec != "json":
+        pytest.importorskip(codec)
+    path = tmp_path / "out.jsonl"
+
+    write_jsonl(RECORDS, str(path), codec=codec)
+
+    assert read_jsonl(str(path), codec=codec) == RECORDS
+    assert read_jsonl(str(path), codec="json") == RECORDS
+
+
+@pytest.mark.parametrize("codec", ["json", "orjson", "msgspec"])
+def test_codecs_write_same_json_layout(tmp_path, codec):
+    if codec != "json":
+        pytest.importorskip(codec)
+    path = tmp_path / "out.json"
+    stream_path = tmp_path / "stream.json"
+
+    write_json(RECORDS, str(path), codec=codec)
+    list(write_json_stream(iter([RECORDS[:1], RECORDS[1:]]), str(stream_path), codec=codec))
+
+    write_json(RECORDS, str(tmp_path / "ref.json"), codec="json")
+    assert path.read_bytes() == (tmp_path / "ref.json").read_bytes()
+    assert stream_path.read_bytes() == (tmp_path / "ref.json").read_bytes()
+
+
+@pytest.mark.parametrize("codec", ["auto", "json", "orjson", "msgspec"])
+def test_codecs_keep_non_finite_floats(tmp_path, codec):
+    if codec not in ("auto", "json"):
+        pytest.importorskip(codec)
+    records = [{"a": float("nan"), "b": [float("inf"), -float("inf")], "c": None}]
+    path = tmp_path / "out.jsonl"
+
+    write_jsonl(records, str(path), codec=codec)
+    write_json(records, str(tmp_path / "out.json"), codec=codec)
+
+    for result in (read_jsonl(str(path), codec=codec), read_json(str(tmp_path / "out.json"), codec=codec)):
+        assert result[0]["a"] != result[0]["a"]
+        assert result[0]["b"] == [float("inf"), -float("inf")]
+        assert result[0]["c"] is None
+
+
+def test_auto_codec_writes_stdlib_layout(tmp_path):
+    write_jsonl(RECORDS, str(tmp_path / "auto.jsonl"))
+    write_jsonl(RECORDS, str(tmp_path / "json.jsonl"), codec="json")
+
+    assert (tmp_path / "auto.jsonl").read_bytes() == (tmp_path / "json.jsonl").read_bytes()
+
+
+def test_codec_transcodes_other_encodings(tmp_path):
+    path = tmp_path / "latin.jsonl"
+
+    write_jsonl(RECORDS[:1], str(path), encoding="latin-1")
+
+    assert "Müller".encode("latin-1") in path.read_bytes()
+    assert read_jsonl(str(path), encoding="latin-1") == RECORDS[:1]
+
+
+def test_unknown_codec():
+    with pytest.raises(ValueError):
+        get_codec("simdjson")
+
+
+def test_parallel_jsonl_reader_matches_sequential(tmp_path):
+    from configura.adapters.jsonl_adapter import ReadJsonl
+    from configura.io import iter_jsonl_parallel
+    from configura.stream import collect
+
+    path = tmp_path / "in.jsonl"
+    records = [{"id": i, "name": "x" * (i % 7)} for i in range(3000)]
+    write_jsonl(records, str(path))
+    with open(path, "a") as f:
+        f.write("\n{\"id\": 3000}")  # blank line, no trailing newline
+
+    expected = read_jsonl(str(path))
+    ordered = collect(iter_jsonl_parallel(str(path), workers=2, range_bytes=1000))
+    unordered = collect(iter_jsonl_parallel(str(path), workers=2, ordered=False, range_bytes=1000))
+    skipped = collect(iter_jsonl_parallel(str(path), workers=2, skip=1234, range_bytes=1000))
+
+    assert ordered == expected
+    assert sorted(unordered, key=lambda r: r["id"]) == expected
+    assert skipped == expected[1234:]
+    assert ReadJsonl(str(path), workers=2, range_bytes=1000).read() == expected
+
+
+@pytest.mark.parametrize("suffix", [".gz", ".bz2", ".xz"])
+def test_adapters_compress_by_extension(tmp_path, suffix):
+    import gzip
+
+    from configura.adapters.csv_adapter import ReadCsv, WriteCsv
+    from configura.adapters.jsonl_adapter import ReadJsonl, WriteJsonl
+    from configura.stream import collect
+
+    jsonl_path = str(tmp_path / f"out.jsonl{suffix}")
+    csv_path = str(tmp_path / f"out.csv{suffix}")
+    rows = [{"id": str(i), "name": "Müller"} for i in range(50)]
+
+    collect(WriteJsonl(jsonl_path, compression_level=1).process_stream(iter([rows])))
+    WriteCsv(csv_path).process(rows)
+
+    assert (tmp_path / f"out.jsonl{suffix}").read_bytes()[:1] != b"{"
+    assert ReadJsonl(jsonl_path, workers=2).read() == rows
+    assert collect(ReadCsv(csv_path, batch_size=7).read_batches()) == rows
+    if suffix == ".gz":
+        assert gzip.decompress((tmp_path / "out.jsonl.gz").read_bytes()).count(b"\n") == 50
+
+
+def test_explicit_compression_overrides_extension(tmp_path):
+    path = str(tmp_path / "records.bin")
+
+    write_jsonl(RECORDS, path, compression="xz")
+
+    assert read_jsonl(path, compression="xz") == RECORDS
+    with pytest.raises(ValueError):
+        read_jsonl(path, compression="zip")
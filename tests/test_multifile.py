@@ -0,0 +1,127 @@
+import threading
+
+import pytest
+
+from configura.adapters.csv_adapter import ReadCsv
+from configura.adapters.json_adapter import ReadJson
+from configura.adapters.jsonl_adapter import ReadJsonl
+from configura.cache import CheckpointCache
+from configura.io import write_csv, write_json, write_jsonl
+from configura.pipeline import Pipeline
+from configura.planner import plan
+from configura.plugins.drop_fields import DropFields
+from configura.plugins.limit import Limit
+from configura.stages import iter_concurrent
+from configura.stream import collect
+
+
+def _shards(tmp_path, hours=6, per_file=250):
+    paths = []
+    for hour in range(hours):
+        path = str(tmp_path / f"records_2025-11-01T{hour:02d}.jsonl")
+        write_jsonl([{"id": hour * per_file + n, "hour": hour} for n in range(per_file)], path)
+        paths.append(path)
+    return paths
+
+
+def test_glob_reads_files_in_order_with_source(tmp_path):
+    paths = _shards(tmp_path)
+    reader = ReadJsonl(str(tmp_path / "records_2025-11-01T*.jsonl"), batch_size=100, file_workers=3)
+
+    result = collect(reader.read_batches())
+
+    assert [r["id"] for r in result] == list(range(6 * 250))
+    assert [r["_source"] for r in result] == [path for path in paths for _ in range(250)]
+    assert reader.process(None) == result
+
+
+def test_interleaved_reads_every_record(tmp_path):
+    _shards(tmp_path)
+    reader = ReadJsonl(str(tmp_path / "*.jsonl"), batch_size=50, ordered=False, source_field=None)
+
+    result = collect(reader.read_batches())
+
+    assert sorted(r["id"] for r in result) == list(range(6 * 250))
+    assert "_source" not in result[0]
+
+
+def test_path_list_for_json_and_csv(tmp_path):
+    write_json([{"id": 1}, {"id": 2}], str(tmp_path / "a.json"))
+    write_json([{"id": 3}], str(tmp_path / "b.json"))
+    write_csv([{"id": 4, "v": "x"}], str(tmp_path / "c.csv"))
+    write_csv([{"id": 5, "v": "y"}], str(tmp_path / "d.csv"))
+
+    json_reader = ReadJson([str(tmp_path / "b.json"), str(tmp_path / "a.json")], source_field="file")
+    csv_reader = ReadCsv([str(tmp_path / "*.csv")], types={"id": "int"})
+
+    assert [(r["id"], r["file"].endswith("b.json")) for r in json_reader.process(None)] == [(3, True), (1, False), (2, False)]
+    assert [(r["id"], r["v"]) for r in csv_reader.process(None)] == [(4, "x"), (5, "y")]
+
+
+def test_pushdown_applies_across_files(tmp_path):
+    paths = _shards(tmp_path)
+    reader = ReadJsonl(str(tmp_path / "*.jsonl"), batch_size=100, ordered=False)
+
+    steps = plan([reader, DropFields(["hour"]), Limit(start=200, end=300)])
+
+    assert len(steps) == 1
+    result = steps[0].process(None)
+    # A pushed down Limit keeps the file order
+    assert result == [{"id": n, "_source": paths[n // 250]} for n in range(200, 300)]
+
+
+def test_missing_files_and_watermark(tmp_path):
+    reader = ReadJsonl(str(tmp_path / "*.jsonl"))
+    with pytest.raises(FileNotFoundError, match="No files match"):
+        reader.process(None)
+
+    _shards(tmp_path, hours=2)
+    with pytest.raises(ValueError, match="single file"):
+        ReadJsonl(str(tmp_path / "*.jsonl"), watermark=str(tmp_path / "state.json"))
+
+
+def test_compiled_pipeline_sees_new_files(tmp_path):
+    pipeline = Pipeline({"pipeline": [{"type": "configura.adapters.jsonl_adapter:ReadJsonl", "params": {"path": str(tmp_path / "*.jsonl")}}]})
+    with pytest.raises(FileNotFoundError, match="No files match"):
+        pipeline.run()
+
+    _shards(tmp_path, hours=1, per_file=10)
+    assert len(pipeline.run()) == 10
+    _shards(tmp_path, hours=3, per_file=10)
+    assert [r["id"] for r in collect(pipeline.stream())] == list(range(30))
+
+
+def test_new_file_changes_cache_fingerprint(tmp_path):
+    _shards(tmp_path, hours=2)
+    pipeline = [{"type": "ReadJsonl", "params": {"path": str(tmp_path / "*.jsonl")}}]
+    cache = CheckpointCache(str(tmp_path / "cache"))
+
+    before = cache.fingerprints(pipeline, [ReadJsonl(str(tmp_path / "*.jsonl"))])
+    write_jsonl([{"id": -1}], str(tmp_path / "records_2025-11-01T02.jsonl"))
+    after = cache.fingerprints(pipeline, [ReadJsonl(str(tmp_path / "*.jsonl"))])
+
+    assert before != after
+
+
+def test_concurrent_error_and_early_stop():
+    def failing():
+        yield [{"id": 1}]
+        raise RuntimeError("broken file")
+
+    with pytest.raises(RuntimeError, match="broken file"):
+        collect(iter_concurrent([lambda: iter([[{"id": 0}]]), failing], workers=2))
+
+    closed = threading.Event()
+
+    def endless():
+        try:
+            while True:
+                yield [{"id": 0}]
+        finally:
+            closed.set()
+
+    stream = iter_concurrent([endless, endless], workers=2, ordered=False, queue_size=1)
+    next(stream)
+    stream.close()
+
+    assert closed.is_set()
@@ -0,0 +1,33 @@
+from configura.parallel import ParallelChain
+from configura.planner import parallelize
+from configura.plugins.filter_by_field import FilterByField
+from configura.plugins.limit import Limit
+from configura.plugins.rename_fields import RenameFields
+
+
+def test_parallel_chain_preserves_order():
+    data = [{"id": i, "value": i % 10} for i in range(5000)]
+    steps = [
+        RenameFields(mapping={"value": "score"}),
+        FilterByField(key_name="score", operator=">", value=4),
+    ]
+
+    expected = steps[1].process(steps[0].process(data))
+    result = ParallelChain(steps, workers=2, chunk_size=300).process(data)
+
+    assert result == expected
+    assert len(result) == 2500
+
+
+def test_parallelize_groups_only_parallel_safe_steps():
+    steps = [
+        RenameFields(mapping={"a": "b"}),
+        FilterByField(key_name="b", operator="==", value=1),
+        Limit(count=10),
+        RenameFields(mapping={"b": "c"}),
+    ]
+
+    planned = parallelize(steps, workers=2)
+
+    assert [type(step).__name__ for step in planned] == ["ParallelChain", "Limit", "ParallelChain"]
+    assert planned[0].steps == steps[:2]
@@ -0,0 +1,42 @@
+import pickle
+
+import pytest
+
+from configura.paths import compile_copier, compile_path
+
+
+@pytest.mark.parametrize("path", ["a", "a.b", "a.b.c"])
+def test_field_path_get_set_delete(path):
+    field = compile_path(path)
+    record = {"a": {"b": {"c": 1}}}
+
+    field.set(record, 42)
+    assert field.get(record) == 42
+
+    field.delete(record)
+    assert field.get(record) is None
+
+    # Missing parents -> no change
+    missing = compile_path("x." + path)
+    missing.set(record, 1)
+    missing.delete(record)
+    assert "x" not in record
+    assert missing.get(record) is None
+
+
+def test_field_path_treats_non_dict_parents_as_missing():
+    field = compile_path("payload.temp_c")
+
+    assert field.get({"payload": "broken"}) is None
+    assert field.get({"payload": None}) is None
+    assert pickle.loads(pickle.dumps(field)).get({"payload": {"temp_c": 1}}) == 1
+
+
+def test_copier_copies_only_along_paths():
+    record = {"a": {"b": {"c": 1}, "other": {"d": 2}}, "tags": [1]}
+
+    copy = compile_copier([compile_path("a.b.c")])(record)
+
+    assert copy == record
+    assert copy is not record and copy["a"] is not record["a"] and copy["a"]["b"] is not record["a"]["b"]
+    assert copy["a"]["other"] is record["a"]["other"] and copy["tags"] is record["tags"]
@@ -0,0 +1,43 @@
+import json
+import os
+
+from configura.pipeline import Pipeline, load_config
+from configura.stream import collect
+
+FILTER = {"type": "configura.plugins.filter_by_field:FilterByField", "params": {"key_name": "value", "operator": ">=", "value": 3}}
+
+
+def test_compiled_pipeline_runs_repeatedly_on_new_data():
+    pipeline = Pipeline({"pipeline": [FILTER]})
+    planned = pipeline.planned()
+
+    for offset in range(3):
+        records = [{"id": i, "value": (i + offset) % 5} for i in range(20)]
+        expected = [record for record in records if record["value"] >= 3]
+        assert pipeline.run(data=records) == expected
+        assert collect(pipeline.stream(records)) == expected
+
+    # Compiled once, the same planned steps serve every run
+    assert pipeline.planned() is planned
+
+
+def test_load_config_cache_invalidates_on_change(tmp_path):
+    config_path = tmp_path / "pipeline.json"
+    config_path.write_text(json.dumps({"pipeline": [FILTER]}))
+
+    first = load_config(config_path)
+    first["pipeline"].clear()
+    assert load_config(config_path)["pipeline"] == [FILTER]
+
+    config_path.write_text(json.dumps({"pipeline": [], "workers": 2}))
+    stat = config_path.stat()
+    os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert load_config(config_path) == {"pipeline": [], "workers": 2}
+
+
+def test_cached_pipeline_uses_new_data(tmp_path):
+    pipeline = Pipeline({"pipeline": [FILTER], "cache": {"dir": str(tmp_path / "cache")}})
+
+    assert pipeline.run(data=[{"v": 5, "value": 4}]) == [{"v": 5, "value": 4}]
+    assert pipeline.run(data=[{"v": 6, "value": 3}, {"v": 7, "value": 1}]) == [{"v": 6, "value": 3}]
+    assert collect(pipeline.stream([{"v": 8, "value": 9}])) == [{"v": 8, "value": 9}]
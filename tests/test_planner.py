@@ -0,0 +1,119 @@
+import json
+
+import pytest
+
+from configura.adapters.jsonl_adapter import ReadJsonl, WriteJsonl
+from configura.engine import run_steps
+from configura.planner import assign_ownership, plan
+from configura.plugins.deduplicate import Deduplicate
+from configura.plugins.drop_fields import DropFields
+from configura.plugins.filter_by_field import FilterByField
+from configura.plugins.limit import Limit
+from configura.plugins.rename_fields import RenameFields
+
+
+def _input(tmp_path, count=100):
+    path = tmp_path / "input.jsonl"
+    path.write_text("".join(json.dumps({"id": i, "value": i % 5, "secret": "x"}) + "\n" for i in range(count)))
+    return str(path)
+
+
+def test_plan_pushes_filter_projection_and_limit_into_reader(tmp_path):
+    path = _input(tmp_path)
+    steps = [
+        ReadJsonl(path=path),
+        FilterByField(key_name="value", operator=">=", value=3),
+        DropFields(fields=["secret"]),
+        Limit(start=2, end=5),
+        WriteJsonl(path=str(tmp_path / "output.jsonl")),
+    ]
+    expected = run_steps([ReadJsonl(path=path)] + steps[1:])
+
+    planned = plan(steps)
+
+    assert [type(step).__name__ for step in planned] == ["ReadJsonl", "WriteJsonl"]
+    assert run_steps(planned) == expected == [
+        {"id": 8, "value": 3},
+        {"id": 9, "value": 4},
+        {"id": 13, "value": 3},
+    ]
+
+
+def test_plan_keeps_filter_after_limit(tmp_path):
+    path = _input(tmp_path)
+    steps = [
+        ReadJsonl(path=path),
+        Limit(count=10),
+        FilterByField(key_name="value", operator="==", value=0),
+    ]
+
+    planned = plan(steps)
+
+    assert [type(step).__name__ for step in planned] == ["ReadJsonl", "FilterByField"]
+    assert [row["id"] for row in run_steps(planned)] == [0, 5]
+
+
+def test_ownership_enables_in_place_after_readers(tmp_path):
+    class Unknown:
+        def process(self, data):
+            return data
+
+    steps = [RenameFields(mapping={"a": "b"}), ReadJsonl(path=_input(tmp_path)), DropFields(fields=["x"]), Unknown(), RenameFields(mapping={"b": "c"})]
+
+    assert assign_ownership(steps) is False
+    assert [getattr(step, "in_place", None) for step in steps] == [False, None, True, None, False]
+
+
+def test_copy_mode_leaves_caller_records_unchanged():
+    records = [{"id": 1, "payload": {"temp_c": 20}, "secret": "x"}]
+
+    renamed = RenameFields(mapping={"payload.temp_c": "payload.celsius"}).process(records)
+    dropped = DropFields(fields=["secret"]).process(records)
+
+    assert records == [{"id": 1, "payload": {"temp_c": 20}, "secret": "x"}]
+    assert renamed == [{"id": 1, "payload": {"celsius": 20}, "secret": "x"}]
+    assert dropped == [{"id": 1, "payload": {"temp_c": 20}}]
+
+
+def test_plan_fuses_record_wise_steps(tmp_path):
+    records = [{"id": i, "value": i % 5, "secret": "x", "payload": {"temp_c": i}} for i in range(50)]
+    steps = [
+        RenameFields(mapping={"value": "score", "payload.temp_c": "payload.celsius"}),
+        DropFields(fields=["secret"]),
+        FilterByField(key_name="score", operator=">=", value=3),
+        Limit(count=100),
+        FilterByField(key_name="id", operator="<", value=40, dlq_dir=str(tmp_path)),
+    ]
+    expected = run_steps(steps, records)
+
+    planned = plan(steps)
+
+    assert [repr(step) if type(step).__name__ == "FusedSteps" else type(step).__name__ for step in planned] == [
+        "FusedSteps(RenameFields -> DropFields -> FilterByField)",
+        "Limit",
+        "FilterByField",
+    ]
+    assert assign_ownership(planned) is False
+    assert run_steps(planned, records) == expected
+    # Copy mode, the caller's records are unchanged
+    assert records[0] == {"id": 0, "value": 0, "secret": "x", "payload": {"temp_c": 0}}
+
+
+def test_fused_steps_in_place_after_reader(tmp_path):
+    steps = [ReadJsonl(path=_input(tmp_path)), Deduplicate(keys="id"), DropFields(fields=["secret"]), RenameFields(mapping={"value": "v"})]
+    assert [type(step).__name__ for step in plan(list(steps), fusion=False)] == ["ReadJsonl", "Deduplicate", "DropFields", "RenameFields"]
+
+    planned = plan(steps)
+    assign_ownership(planned)
+
+    assert [type(step).__name__ for step in planned] == ["ReadJsonl", "Deduplicate", "FusedSteps"]
+    assert planned[2].in_place is True
+    assert run_steps(planned)[0] == {"id": 0, "v": 0}
+
+
+def test_columnar_batches_are_not_fused(tmp_path):
+    pytest.importorskip("numpy")
+    # Negative range, not pushed into the reader, batches stay columnar
+    steps = [ReadJsonl(path=_input(tmp_path), columnar=True), Limit(start=-10, end=-1), DropFields(fields=["secret"]), FilterByField(key_name="value", operator=">", value=1)]
+
+    assert [type(step).__name__ for step in plan(steps)] == ["ReadJsonl", "Limit", "DropFields", "FilterByField"]
@@ -0,0 +1,80 @@
+import json
+import tracemalloc
+
+import pytest
+
+from configura.engine import run_pipeline_from_config
+from configura.profiling import Profiler
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_profiler_counts_records_per_step(tmp_path, streaming):
+    input_path = tmp_path / "input.jsonl"
+    input_path.write_text("".join(json.dumps({"id": i, "value": i % 4}) + "\n" for i in range(40)))
+    config_path = tmp_path / "pipeline.json"
+    config_path.write_text(json.dumps({
+        "streaming": streaming,
+        # Per-step counts, RenameFields and FilterByField would otherwise run fused
+        "fusion": False,
+        "pipeline": [
+            {"type": "configura.adapters.jsonl_adapter:ReadJsonl", "params": {"path": str(input_path), "batch_size": 8}},
+            {"type": "configura.plugins.rename_fields:RenameFields", "params": {"mapping": {"value": "score"}}},
+            {"type": "configura.plugins.filter_by_field:FilterByField", "params": {"key_name": "score", "operator": "==", "value": 1}},
+            {"type": "configura.adapters.jsonl_adapter:WriteJsonl", "params": {"path": str(tmp_path / "out.jsonl")}},
+        ],
+    }))
+
+    profiler = Profiler(memory="tracemalloc", cprofile_dir=str(tmp_path / "prof"))
+    run_pipeline_from_config(config_path, profiler=profiler)
+    profiler.write_json(str(tmp_path / "report.json"))
+
+    report = json.loads((tmp_path / "report.json").read_text())
+    counts = [(step["step"], step["records_in"], step["records_out"]) for step in report["steps"]]
+    assert counts == [
+        ("ReadJsonl", 0, 40),
+        ("RenameFields", 40, 40),
+        ("FilterByField", 40, 10),
+        ("WriteJsonl", 10, 10),
+    ]
+    assert all(step["wall_s"] >= 0 for step in report["steps"])
+    assert len(list((tmp_path / "prof").iterdir())) == 4
+    assert "FilterByField" in profiler.table()
+    assert len((tmp_path / "out.jsonl").read_text().splitlines()) == 10
+
+
+def test_profiler_measures_only_run_memory_for_concurrent_steps(tmp_path):
+    input_path = tmp_path / "input.jsonl"
+    input_path.write_text("".join(json.dumps({"id": i, "value": i % 4}) + "\n" for i in range(40)))
+    config_path = tmp_path / "pipeline.json"
+    config_path.write_text(json.dumps({
+        "pipelined": True,
+        "pipeline": [
+            {"type": "configura.adapters.jsonl_adapter:ReadJsonl", "params": {"path": str(input_path), "batch_size": 8}},
+            {"type": "configura.adapters.jsonl_adapter:WriteJsonl", "params": {"path": str(tmp_path / "out.jsonl")}},
+        ],
+    }))
+
+    profiler = Profiler(memory="tracemalloc")
+    run_pipeline_from_config(config_path, profiler=profiler)
+    report = profiler.report()
+
+    assert report["concurrent"] is True
+    assert report["memory_peak_bytes"] > 0
+    assert [step["memory_peak_bytes"] for step in report["steps"]] == [None, None]
+    assert all(step["cpu_s"] <= report["wall_s"] for step in report["steps"])
+
+
+def test_profiler_keeps_caller_tracing():
+    tracemalloc.start()
+    try:
+        profiler = Profiler(memory="tracemalloc")
+        profiler.start()
+        profiler.stop()
+
+        assert tracemalloc.is_tracing()
+    finally:
+        tracemalloc.stop()
+
+    profiler.start()
+    profiler.stop()
+    assert not tracemalloc.is_tracing()
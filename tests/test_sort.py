@@ -0,0 +1,75 @@
+
+import pytest
+
+from configura.plugins.limit import Limit
+from configura.plugins.sort import Sort
+from configura.stream import collect, connect, iter_batches
+
+
+FIELDS = {
+    "ts": lambda rng: rng.randrange(500),
+    "payload": lambda rng: {"temp": rng.choice([None, 1.5, 2.5, 3.5])},
+}
+
+
+def test_sort_is_stable_with_missing_last():
+    records = [{"ts": 2, "n": 0}, {"n": 1}, {"ts": 1, "n": 2}, {"ts": None, "n": 3}, {"ts": 2, "n": 4}]
+
+    assert [r["n"] for r in Sort(keys="ts").process(records)] == [2, 0, 4, 1, 3]
+    assert [r["n"] for r in Sort(keys="ts", descending=True).process(records)] == [0, 4, 2, 1, 3]
+
+
+def test_mixed_directions(random_records):
+    records = random_records(5000, **FIELDS)
+    result = Sort(keys=["ts", "payload.temp"], descending=[False, True]).process(records)
+
+    # Python's multi-pass stable sort as reference, None temps last
+    expected = sorted(records, key=lambda r: (r["payload"]["temp"] is None, -(r["payload"]["temp"] or 0)))
+    expected.sort(key=lambda r: r["ts"])
+    assert result == expected
+
+
+@pytest.mark.parametrize("descending", [False, True])
+def test_spilled_runs_are_merged(tmp_path, descending, random_records):
+    records = random_records(20000, **FIELDS)
+    plugin = Sort(keys="ts", descending=descending, memory_bytes=200_000, spill_dir=str(tmp_path))
+
+    stream = plugin.process_stream(iter_batches(records, 500))
+    next(stream)
+    # Several runs on disk while merging
+    assert len(list(next(tmp_path.iterdir()).iterdir())) > 2
+    stream.close()
+    assert list(tmp_path.iterdir()) == []
+
+    result = collect(plugin.process_stream(iter_batches(records, 500)))
+    assert result == sorted(records, key=lambda r: r["ts"], reverse=descending)
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_limit_after_sort(tmp_path, random_records):
+    records = random_records(20000, **FIELDS)
+    steps = [Sort(keys="ts", memory_bytes=200_000, spill_dir=str(tmp_path)), Limit(start=0, end=10)]
+
+    result = collect(connect(steps, iter_batches(records, 500)))
+
+    assert result == sorted(records, key=lambda r: r["ts"])[:10]
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_descending_length_must_match_keys():
+    with pytest.raises(ValueError):
+        Sort(keys=["ts", "n"], descending=[True])
+
+
+def test_mixed_types_raise_value_error(tmp_path):
+    records = [{"ts": 1, "a": 1}, {"ts": 2, "a": "x"}]
+
+    with pytest.raises(ValueError, match=r"Sort key 'a' .*\(int, str\)"):
+        Sort(keys=["ts", "a"]).process([{"ts": 1, "a": 1}, {"ts": 1, "a": "x"}])
+    assert Sort(keys=["ts", "a"]).process(records) == records
+
+    # Runs of different types only meet in the merge
+    plugin = Sort(keys="a", memory_bytes=1, spill_dir=str(tmp_path))
+    with pytest.raises(ValueError, match="can not be compared"):
+        collect(plugin.process_stream(iter([[{"a": 1}], [{"a": "x"}]])))
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,81 @@
+import json
+import threading
+
+import pytest
+
+from configura.engine import run_pipeline_from_config
+from configura.plugins.limit import Limit
+from configura.stages import connect_stages
+from configura.stream import collect, iter_batches
+
+
+class Source:
+    """Yields numbered batches and records how many were pulled."""
+
+    def __init__(self, batches):
+        self.batches = batches
+        self.pulled = 0
+
+    def process_stream(self, stream):
+        for index in range(self.batches):
+            self.pulled += 1
+            yield [{"id": index * 10 + i} for i in range(10)]
+
+
+class Explode:
+    streamable = True
+
+    def __init__(self, at):
+        self.at = at
+
+    def process(self, batch):
+        if any(record["id"] == self.at for record in batch):
+            raise ValueError("boom")
+        return batch
+
+
+def test_pipelined_matches_streaming(tmp_path):
+    input_path = tmp_path / "input.jsonl"
+    input_path.write_text("".join(json.dumps({"id": i, "value": i % 7}) + "\n" for i in range(500)))
+
+    outputs = {}
+    for pipelined in (False, True):
+        output_path = tmp_path / f"output_{pipelined}.jsonl"
+        config_path = tmp_path / f"pipeline_{pipelined}.json"
+        config_path.write_text(json.dumps({"pipeline": [
+            {"type": "configura.adapters.jsonl_adapter:ReadJsonl", "params": {"path": str(input_path), "batch_size": 16}},
+            {"type": "configura.plugins.filter_by_field:FilterByField", "params": {"key_name": "value", "operator": ">=", "value": 3}},
+            {"type": "configura.adapters.jsonl_adapter:WriteJsonl", "params": {"path": str(output_path)}},
+        ], "streaming": True, "queue_size": 2}))
+        run_pipeline_from_config(config_path, pipelined=pipelined)
+        outputs[pipelined] = output_path.read_text()
+
+    assert outputs[True] == outputs[False]
+    assert len(outputs[True].splitlines()) == 284
+
+
+def test_stage_error_cancels_pipeline():
+    source = Source(1000)
+
+    with pytest.raises(ValueError, match="boom"):
+        collect(connect_stages([source, Explode(at=25), Limit(count=5000)], queue_size=2))
+
+    # Cancelled: the source stopped shortly after the failing batch
+    assert source.pulled < 10
+    assert not [thread for thread in threading.enumerate() if thread.name.startswith("configura-stage-")]
+
+
+def test_downstream_stop_and_backpressure():
+    source = Source(1000)
+
+    result = collect(connect_stages([source, Limit(count=15)], queue_size=2))
+
+    assert [record["id"] for record in result] == list(range(15))
+    # Bounded queue: the source is at most queue_size (+ one in hand) batches ahead
+    assert source.pulled <= 5
+
+
+def test_pipelined_with_input_data():
+    data = [{"id": i} for i in range(25)]
+
+    assert collect(connect_stages([Limit(start=5, end=20), Limit(count=10)], iter_batches(data, 4))) == data[5:15]
@@ -0,0 +1,45 @@
+import json
+
+from configura.engine import run_pipeline_from_config
+from configura.plugins.limit import Limit
+from configura.stream import collect, iter_batches
+
+
+def _write_config(tmp_path, pipeline, **options):
+    config_path = tmp_path / "pipeline.json"
+    config_path.write_text(json.dumps({"pipeline": pipeline, **options}))
+    return config_path
+
+
+def test_streaming_matches_list_mode(tmp_path):
+    input_path = tmp_path / "input.jsonl"
+    input_path.write_text("".join(json.dumps({"id": i, "value": i % 7}) + "\n" for i in range(50)))
+
+    outputs = {}
+    for streaming in (False, True):
+        output_path = tmp_path / f"output_{streaming}.jsonl"
+        config_path = _write_config(tmp_path, [
+            {"type": "configura.adapters.jsonl_adapter:ReadJsonl", "params": {"path": str(input_path), "batch_size": 8}},
+            {"type": "configura.plugins.filter_by_field:FilterByField", "params": {"key_name": "value", "operator": ">=", "value": 3}},
+            {"type": "configura.plugins.limit:Limit", "params": {"start": 5, "end": 20}},
+            {"type": "configura.adapters.jsonl_adapter:WriteJsonl", "params": {"path": str(output_path)}},
+        ])
+        run_pipeline_from_config(config_path, streaming=streaming)
+        outputs[streaming] = output_path.read_text()
+
+    assert outputs[True] == outputs[False]
+    assert len(outputs[True].splitlines()) == 15
+
+
+def test_limit_stops_pulling_batches():
+    pulled = []
+
+    def source():
+        for batch in iter_batches(({"id": i} for i in range(100)), 10):
+            pulled.append(batch)
+            yield batch
+
+    result = collect(Limit(count=15).process_stream(source()))
+
+    assert [row["id"] for row in result] == list(range(15))
+    assert len(pulled) == 2
@@ -0,0 +1,39 @@
+import json
+import os
+
+from configura.plugins.validate import Validate
+from configura.schema import compile_schema, load_schema
+
+SCHEMA = {
+    "type": "object",
+    "properties": {
+        "id": {"type": "integer", "minimum": 1},
+        "status": {"enum": ["ok", "warning"]},
+    },
+    "required": ["id"],
+}
+
+
+def test_compile_schema_matches_common_constructs():
+    is_valid = compile_schema(SCHEMA)
+
+    assert is_valid({"id": 1, "status": "ok"})
+    assert not is_valid({"id": 0})
+    assert not is_valid({"id": True})
+    assert not is_valid({"status": "ok"})
+    assert compile_schema({"allOf": [SCHEMA]}) is None
+
+
+def test_validate_uses_cached_schema_until_file_changes(tmp_path):
+    schema_path = tmp_path / "schema.json"
+    schema_path.write_text(json.dumps(SCHEMA))
+
+    first = load_schema(str(schema_path))
+    assert load_schema(str(schema_path)) is first
+
+    schema_path.write_text(json.dumps({**SCHEMA, "required": ["id", "status"]}))
+    os.utime(schema_path, ns=(0, 10**9))
+    assert load_schema(str(schema_path)) is not first
+
+    data = [{"id": 1, "status": "ok"}, {"id": 2}]
+    assert Validate(schema_path=str(schema_path)).process(data) == [{"id": 1, "status": "ok"}]
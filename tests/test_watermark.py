@@ -0,0 +1,88 @@
+import json
+
+from configura.engine import run_pipeline_from_config
+
+
+def _append(path, records, tail=""):
+    with open(path, "a") as f:
+        f.write("".join(json.dumps(record) + "\n" for record in records) + tail)
+
+
+def _run(tmp_path, input_path, output_path, streaming, steps=()):
+    config_path = tmp_path / "pipeline.json"
+    config_path.write_text(json.dumps({
+        "streaming": streaming,
+        "pipeline": [
+            {"type": "configura.adapters.jsonl_adapter:ReadJsonl",
+             "params": {"path": str(input_path), "watermark": str(tmp_path / "state" / "input.json")}},
+            *steps,
+            {"type": "configura.adapters.jsonl_adapter:WriteJsonl",
+             "params": {"path": str(output_path), "append": True}},
+        ],
+    }))
+    run_pipeline_from_config(config_path)
+
+
+def _ids(path):
+    return [json.loads(line)["id"] for line in path.read_text().splitlines()]
+
+
+def test_watermark_reads_only_appended_lines(tmp_path):
+    input_path = tmp_path / "input.jsonl"
+    output_path = tmp_path / "output.jsonl"
+
+    for streaming in (False, True):
+        input_path.unlink(missing_ok=True)
+        output_path.unlink(missing_ok=True)
+        (tmp_path / "state" / "input.json").unlink(missing_ok=True)
+
+        _append(input_path, [{"id": 1}, {"id": 2}], tail='{"id": 3')
+        _run(tmp_path, input_path, output_path, streaming)
+        assert _ids(output_path) == [1, 2]
+
+        # Incomplete line is finished by the producer, more lines follow
+        with open(input_path, "a") as f:
+            f.write("}\n")
+        _append(input_path, [{"id": 4}])
+        _run(tmp_path, input_path, output_path, streaming)
+        assert _ids(output_path) == [1, 2, 3, 4]
+
+        _run(tmp_path, input_path, output_path, streaming)
+        assert _ids(output_path) == [1, 2, 3, 4]
+
+
+def test_watermark_restarts_after_truncation(tmp_path):
+    input_path = tmp_path / "input.jsonl"
+    output_path = tmp_path / "output.jsonl"
+
+    _append(input_path, [{"id": 1}, {"id": 2}, {"id": 3}])
+    _run(tmp_path, input_path, output_path, streaming=True)
+
+    input_path.write_text(json.dumps({"id": 10}) + "\n")
+    _run(tmp_path, input_path, output_path, streaming=True)
+
+    assert _ids(output_path) == [1, 2, 3, 10]
+
+
+def test_watermark_keeps_lines_after_limit(tmp_path):
+    input_path = tmp_path / "input.jsonl"
+    steps = [
+        {"type": "configura.plugins.filter_by_field:FilterByField", "params": {"key_name": "even", "operator": "==", "value": True}},
+        {"type": "configura.plugins.limit:Limit", "params": {"count": 3}},
+    ]
+    _append(input_path, [{"id": i, "even": i % 2 == 0} for i in range(20)])
+
+    for streaming in (False, True):
+        output_path = tmp_path / f"output_{streaming}.jsonl"
+        (tmp_path / "state" / "input.json").unlink(missing_ok=True)
+
+        _run(tmp_path, input_path, output_path, streaming, steps[1:])
+        assert _ids(output_path) == [0, 1, 2]
+        _run(tmp_path, input_path, output_path, streaming, steps[1:])
+        assert _ids(output_path) == [0, 1, 2, 3, 4, 5]
+
+        # Filtered lines before the last selected record are done as well
+        _run(tmp_path, input_path, output_path, streaming, steps)
+        assert _ids(output_path) == [0, 1, 2, 3, 4, 5, 6, 8, 10]
+        _run(tmp_path, input_path, output_path, streaming, steps)
+        assert _ids(output_path) == [0, 1, 2, 3, 4, 5, 6, 8, 10, 12, 14, 16]